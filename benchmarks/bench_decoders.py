@@ -0,0 +1,66 @@
+"""Compare JSON decoding strategies on realistic smscenter.gr response bodies.
+
+Run with ``python benchmarks/bench_decoders.py``. Backends that are not installed are skipped.
+"""
+
+import json
+import random
+import string
+import timeit
+
+from pysmscenter.decoders import JSONDecoder, get_decoder
+
+STATUSES = ("d", "s", "f")
+
+
+def history_payload(size: int) -> bytes:
+    rng = random.Random(size)
+    sms = [
+        {
+            "smsId": str(10_000_000 + index),
+            "sender": rng.choice(("SMSCenter", "MyShop", "Alerts")),
+            "flash": "false",
+            "unicode": rng.choice(("false", "true")),
+            "to": f"3069{rng.randrange(10**8):08d}",
+            "text": rng.choice(
+                ("Your order has shipped", "Χρόνια πολλά!", "".join(rng.choices(string.ascii_letters, k=60)))
+            ),
+            "timestamp": f"2024-01-{1 + index % 28:02d} 12:{index % 60:02d}:00",
+            "status": rng.choice(STATUSES),
+            "cost": "1",
+            "ttd": str(rng.randrange(30)),
+            "contactId": str(rng.randrange(10**6)),
+        }
+        for index in range(size)
+    ]
+    body = {"status": "1", "remarks": "Success", "error": "0", "total": str(size), "sms": sms}
+    return json.dumps(body, ensure_ascii=False).encode()
+
+
+def requests_style(body: bytes) -> object:
+    """What ``requests.Response.json()`` does: decode the body to text, then parse it."""
+    return json.loads(body.decode("utf-8"))
+
+
+def main() -> None:
+    backends: dict[str, JSONDecoder] = {"response.json() (text)": requests_style}
+    for name in ("json", "msgspec", "orjson"):
+        try:
+            backends[f"{name} (bytes)"] = get_decoder(name)
+        except ImportError:
+            print(f"skipping {name}: not installed")
+
+    for size in (100, 10_000, 100_000):
+        body = history_payload(size)
+        number = max(1, 200_000 // size)
+        print(f"\nhistory/single/list with {size:,} messages ({len(body) / 1e6:.1f} MB), {number} runs")
+        baseline = None
+        for label, decode in backends.items():
+            timings = timeit.repeat(lambda decode=decode, body=body: decode(body), number=number, repeat=3)
+            seconds = min(timings) / number
+            baseline = baseline or seconds
+            print(f"  {label:<24} {seconds * 1e3:9.3f} ms   x{baseline / seconds:5.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,10 @@
+try:
+    import httpx  # noqa: F401
+except ImportError as exc:  # pragma: no cover - exercised only without the optional dependency
+    raise ImportError(
+        "pysmscenter.aio requires the 'httpx' package. Install it with `pip install pysmscenter[async]`."
+    ) from exc
+
+from .client import AsyncSMSClient
+
+__all__ = ["AsyncSMSClient"]
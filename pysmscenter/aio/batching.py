@@ -0,0 +1,136 @@
+import asyncio
+import types
+from typing import Self, TYPE_CHECKING
+
+from pysmscenter.batching import Batch, BatchKey, batch_key
+from pysmscenter.managers.sms_manager import SmsManager
+from pysmscenter.types import SMSBulkItem, Timestamp
+
+if TYPE_CHECKING:
+    from .client import AsyncSMSClient
+
+
+class AsyncBatchingSender:
+    """Coalesce concurrent single sends of the same message into ``sms/bulk`` calls.
+
+    The asyncio counterpart of :class:`pysmscenter.batching.BatchingSender`; it must be used from a
+    single event loop.
+
+    Args:
+        client: Client to send through.
+        max_delay: Seconds the first send of a batch may wait for others to join.
+        max_batch: Recipients that make a batch go out immediately.
+        max_in_flight: Batches that may be in flight at the same time.
+    """
+
+    def __init__(
+        self,
+        client: "AsyncSMSClient",
+        max_delay: float = 0.005,
+        max_batch: int = 100,
+        max_in_flight: int = 4,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.client = client
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._semaphore = asyncio.Semaphore(max_in_flight)
+        self._batches: dict[BatchKey, Batch[asyncio.Future[SMSBulkItem]]] = {}
+        self._timers: dict[BatchKey, asyncio.TimerHandle] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} max_delay={self.max_delay} max_batch={self.max_batch}>"
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> bool:
+        await self.aclose()
+        return False
+
+    async def send(
+        self,
+        to: str,
+        text: str,
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+    ) -> SMSBulkItem:
+        """Send an SMS as part of a batch and wait for its result.
+
+        Raises:
+            SMSExceptionError: If the API rejects the batch or this recipient.
+
+        Returns:
+            SMSBulkItem: The ``sms/bulk`` result for this recipient.
+        """
+        return await self.submit(to, text, sender, ucs, flash, timestamp)
+
+    def submit(
+        self,
+        to: str,
+        text: str,
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+    ) -> asyncio.Future[SMSBulkItem]:
+        """Queue an SMS for the next batch and return a future for its result."""
+        if self._closed:
+            raise RuntimeError("AsyncBatchingSender is closed")
+        loop = asyncio.get_running_loop()
+        text = SmsManager._prepare_text(self.client, text)
+        params = SmsManager._bulk_params("", text, sender, ucs, flash, timestamp)
+        key = batch_key(params)
+        future: asyncio.Future[SMSBulkItem] = loop.create_future()
+        batch = self._batches.get(key)
+        if batch is not None and to in batch:
+            # One call cannot tell two sends to the same number apart, so the open batch goes first.
+            self._dispatch(key)
+            batch = None
+        if batch is None:
+            batch = self._batches[key] = Batch(params, loop.time() + self.max_delay)
+            self._timers[key] = loop.call_at(batch.deadline, self._dispatch, key)
+        batch.add(to, future)
+        if len(batch) >= self.max_batch:
+            self._dispatch(key)
+        return future
+
+    def flush(self) -> None:
+        """Send every pending batch now."""
+        for key in list(self._batches):
+            self._dispatch(key)
+
+    async def aclose(self) -> None:
+        """Send pending batches, wait for them to complete and stop the sender."""
+        self._closed = True
+        self.flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def _dispatch(self, key: BatchKey) -> None:
+        batch = self._batches.pop(key)
+        self._timers.pop(key).cancel()
+        task = asyncio.create_task(self._send_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _send_batch(self, batch: Batch[asyncio.Future[SMSBulkItem]]) -> None:
+        try:
+            async with self._semaphore:
+                response = await self.client.sms._bulk_chunk(batch.recipients, batch.params)
+        except BaseException as exc:
+            batch.fail(exc)
+            if isinstance(exc, asyncio.CancelledError):
+                raise
+        else:
+            batch.resolve(response)
@@ -0,0 +1,454 @@
+import asyncio
+import contextlib
+import time
+import types
+from collections.abc import AsyncIterator, Mapping, Sequence
+from typing import Any, ClassVar, Self, cast
+from urllib.parse import urljoin
+
+import httpx
+
+from pysmscenter.aio.managers.balance_manager import AsyncBalanceManager
+from pysmscenter.aio.managers.contact_manager import AsyncContactManager
+from pysmscenter.aio.managers.group_manager import AsyncGroupManager
+from pysmscenter.aio.managers.history_manager import AsyncHistoryManager
+from pysmscenter.aio.managers.hlr_manager import AsyncHLRManager
+from pysmscenter.aio.managers.manager import AsyncManager
+from pysmscenter.aio.managers.mobile_manager import AsyncMobileManager
+from pysmscenter.aio.managers.purchase_manager import AsyncPurchaseManager
+from pysmscenter.aio.managers.sms_manager import AsyncSmsManager
+from pysmscenter.aio.managers.status_manager import AsyncStatusManager
+from pysmscenter.aio.managers.two_factor_manager import AsyncTwoFactorManager
+from pysmscenter.aio.managers.user_manager import AsyncUserManager
+from pysmscenter.cache import ResponseCache
+from pysmscenter.circuit_breaker import CircuitBreaker, CircuitBreakers
+from pysmscenter.coalesce import SingleFlight
+from pysmscenter.decoders import JSONDecoder, get_decoder
+from pysmscenter.encoding import Transliterator
+from pysmscenter.exceptions import CredentialError
+from pysmscenter.hedging import HedgePolicy
+from pysmscenter.main import APIKeyClient, BaseClient, Timeout
+from pysmscenter.priority import PriorityScheduler
+from pysmscenter.rate_limit import RateLimiter, parse_retry_after
+from pysmscenter.reconcile import HistoryReconciler
+from pysmscenter.streaming import JSONItemParser
+from pysmscenter.types.key_types import KeyRawResponse
+
+
+class AsyncBaseHTTPClient(BaseClient):
+    DEFAULT_MAX_CONNECTIONS: ClassVar[int] = 100
+    DEFAULT_MAX_KEEPALIVE_CONNECTIONS: ClassVar[int] = 20
+
+    def __init__(
+        self,
+        max_retries: int = 0,
+        timeout: Timeout | None = BaseClient.DEFAULT_TIMEOUT,
+        backoff_factor: float = 0.5,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        decoder: JSONDecoder | str = "auto",
+    ) -> None:
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.backoff_factor = backoff_factor
+        self.decoder = get_decoder(decoder)
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self._session: httpx.AsyncClient = self._build_session()
+        self._closed: bool = False
+
+    @property
+    def session(self) -> httpx.AsyncClient:
+        if self._closed:
+            raise RuntimeError("Session is closed")
+        return self._session
+
+    async def aclose(self) -> None:
+        if not self._closed:
+            await self._session.aclose()
+            self._closed = True
+
+    async def __aenter__(self) -> Self:
+        if self._closed:
+            raise RuntimeError("Cannot enter context with closed session")
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> bool:
+        await self.aclose()
+        return False
+
+    def _build_session(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+        )
+        # The transport only retries connection failures; status retries are handled in ``_request``.
+        transport = httpx.AsyncHTTPTransport(retries=self.max_retries, limits=limits)
+        return httpx.AsyncClient(transport=transport, timeout=self._build_timeout())
+
+    def _build_timeout(self) -> httpx.Timeout:
+        if self.timeout is None:
+            return httpx.Timeout(None)
+        connect, read = self.timeout
+        return httpx.Timeout(read, connect=connect)
+
+    async def _request(self, method: str, endpoint: str, params: Mapping[str, Any] | None = None) -> dict[str, Any]:
+        url = urljoin(self.BASE_URL, endpoint)
+        # ``requests`` silently drops ``None`` values while ``httpx`` sends them as empty strings.
+        request_params = {key: value for key, value in self._build_params(params).items() if value is not None}
+        method = method.upper()
+        retry_statuses = self._retry_statuses(endpoint)
+
+        attempt = 0
+        while True:
+            response = await self.session.request(method, url, params=request_params)
+            if response.status_code not in retry_statuses or attempt >= self.max_retries:
+                break
+            attempt += 1
+            await asyncio.sleep(self.backoff_factor * (2 ** (attempt - 1)))
+
+        response.raise_for_status()
+        return self.decoder(response.content)
+
+    async def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        path: Sequence[str],
+        params: Mapping[str, Any] | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        url = urljoin(self.BASE_URL, endpoint)
+        request_params = {key: value for key, value in self._build_params(params).items() if value is not None}
+        method = method.upper()
+        parser = JSONItemParser(path, meta)
+        async with self.session.stream(method, url, params=request_params) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(self.STREAM_CHUNK_SIZE):
+                for item in parser.feed(chunk):
+                    yield item
+        for item in parser.close():
+            yield item
+
+
+class AsyncSMSAuthClient(AsyncBaseHTTPClient):
+    async def get_key(self, username: str, password: str) -> KeyRawResponse:
+        """
+        Get an API key for the given username and password.
+
+        Args:
+            username (str): The username to authenticate with.
+            password (str): The password to authenticate with.
+        Returns:
+            KeyRawResponse: The API key for the authenticated user.
+        """
+        response = await self._request("GET", "key/get", params={"username": username, "password": password})
+        return cast(KeyRawResponse, response)
+
+    async def reset_key(self, username: str, password: str) -> KeyRawResponse:
+        """
+        Reset the API key for the authenticated user.
+
+        Returns:
+            KeyRawResponse: The new API key for the authenticated user.
+        """
+        response = await self._request("GET", "key/reset", params={"username": username, "password": password})
+        return cast(KeyRawResponse, response)
+
+
+class AsyncSMSClient(APIKeyClient, AsyncBaseHTTPClient):
+    mobile: "AsyncMobileManager"
+    sms: "AsyncSmsManager"
+    balance: "AsyncBalanceManager"
+    history: "AsyncHistoryManager"
+    status: "AsyncStatusManager"
+    contact: "AsyncContactManager"
+    group: "AsyncGroupManager"
+    purchase: "AsyncPurchaseManager"
+    hlr: "AsyncHLRManager"
+    two_factor: "AsyncTwoFactorManager"
+    user: "AsyncUserManager"
+
+    managers: ClassVar[list[type[AsyncManager]]] = [
+        AsyncMobileManager,
+        AsyncSmsManager,
+        AsyncBalanceManager,
+        AsyncHistoryManager,
+        AsyncStatusManager,
+        AsyncContactManager,
+        AsyncGroupManager,
+        AsyncPurchaseManager,
+        AsyncHLRManager,
+        AsyncTwoFactorManager,
+        AsyncUserManager,
+    ]
+
+    def __init__(
+        self,
+        api_key: str,
+        max_retries: int = 0,
+        timeout: Timeout | None = BaseClient.DEFAULT_TIMEOUT,
+        max_connections: int = AsyncBaseHTTPClient.DEFAULT_MAX_CONNECTIONS,
+        max_keepalive_connections: int = AsyncBaseHTTPClient.DEFAULT_MAX_KEEPALIVE_CONNECTIONS,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        coalesce: SingleFlight | bool = False,
+        cache: ResponseCache | None = None,
+        decoder: JSONDecoder | str = "auto",
+        reconcile: Mapping[str, HistoryReconciler] | bool = False,
+        circuit_breaker: CircuitBreaker | CircuitBreakers | None = None,
+        hedging: HedgePolicy | None = None,
+        transliterate: Transliterator | bool = False,
+        scheduler: PriorityScheduler | None = None,
+    ) -> None:
+        super().__init__(
+            max_retries=max_retries,
+            timeout=timeout,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            decoder=decoder,
+        )
+        self._set_api_key(api_key)
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        self.single_flight = self._build_single_flight(coalesce)
+        self.cache = cache
+        self.reconcilers = self._build_reconcilers(reconcile)
+        self.transliterator = self._build_transliterator(transliterate)
+        self.scheduler = scheduler
+
+        self._setup_managers()
+
+    @classmethod
+    async def from_credentials(
+        cls,
+        username: str,
+        password: str,
+        max_retries: int = 0,
+        timeout: Timeout | None = BaseClient.DEFAULT_TIMEOUT,  # noqa: ASYNC109 - HTTP timeout, not a deadline
+    ) -> "AsyncSMSClient":
+        """
+        Create an AsyncSMSClient instance from a username and password.
+
+        Args:
+            username (str): The username to authenticate with.
+            password (str): The password to authenticate with.
+            max_retries (int, optional): The maximum number of retries for HTTP requests. Defaults to 0.
+            timeout (Timeout, optional): The timeout for HTTP requests. Defaults to BaseClient.DEFAULT_TIMEOUT.
+        Returns:
+            AsyncSMSClient: An instance of AsyncSMSClient authenticated with the provided credentials.
+        """
+        auth_client = AsyncSMSAuthClient(max_retries=max_retries, timeout=timeout)
+        try:
+            key_response = await auth_client.get_key(username, password)
+        finally:
+            await auth_client.aclose()
+
+        api_key = key_response.get("key")
+        if not api_key:
+            raise CredentialError("Failed to retrieve API key with provided credentials")
+        return cls(api_key=api_key, max_retries=max_retries, timeout=timeout)
+
+    @classmethod
+    async def reset_api_key(
+        cls,
+        username: str,
+        password: str,
+        max_retries: int = 0,
+        timeout: Timeout | None = BaseClient.DEFAULT_TIMEOUT,  # noqa: ASYNC109 - HTTP timeout, not a deadline
+    ) -> str:
+        auth_client = AsyncSMSAuthClient(max_retries=max_retries, timeout=timeout)
+        try:
+            key_response = await auth_client.reset_key(username, password)
+        finally:
+            await auth_client.aclose()
+
+        new_api_key = key_response.get("key")
+        if not new_api_key:
+            raise CredentialError("Failed to reset API key with provided credentials")
+
+        return new_api_key
+
+    def _setup_managers(self) -> None:
+        for manager in self.managers:
+            setattr(self, manager.name, manager(self))
+
+    async def fetch_data(
+        self,
+        method: str,
+        endpoint: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        if self.cache is not None:
+            cached = self.cache.get(method, endpoint, params)
+            if cached is not None:
+                return cached
+
+        key = self.single_flight.key(method, endpoint, params) if self.single_flight is not None else None
+        if self.single_flight is not None and key is not None:
+            response_json = await self.single_flight.do_async(key, lambda: self._fetch(method, endpoint, params))
+        else:
+            response_json = await self._fetch(method, endpoint, params)
+
+        if self.cache is not None:
+            self.cache.update(method, endpoint, params, response_json)
+        return response_json
+
+    async def _fetch(
+        self,
+        method: str,
+        endpoint: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        breaker = self._acquire_circuit(endpoint)
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(endpoint)
+            async with self._slot(endpoint):
+                if self.hedging is not None and self.hedging.applies(endpoint):
+                    response_json = await self._request_hedged(self.hedging, method, endpoint, params=params)
+                else:
+                    response_json = await self._request_reconciled(method, endpoint, params=params)
+        except BaseException as exc:
+            self._record_failure(endpoint, breaker, exc)
+            raise
+        self._record_success(endpoint, breaker)
+        self._raise_for_credential_error(response_json)
+        return response_json
+
+    def _slot(self, endpoint: str) -> contextlib.AbstractAsyncContextManager[object]:
+        """Hold a connection slot in the lane of ``endpoint`` while the request runs."""
+        if self.scheduler is None:
+            return contextlib.nullcontext()
+        return self.scheduler.slot_async(endpoint)
+
+    def _record_failure(self, endpoint: str, breaker: CircuitBreaker | None, exc: BaseException) -> None:
+        response = exc.response if isinstance(exc, httpx.HTTPStatusError) else None
+        if self.rate_limiter is not None and response is not None and response.status_code == 429:
+            self.rate_limiter.throttled(endpoint, parse_retry_after(response.headers.get("Retry-After")))
+        if breaker is not None:
+            # Only an unreachable or failing provider counts against the circuit; a 4xx is a healthy answer.
+            if isinstance(exc, httpx.TransportError) or (response is not None and response.status_code >= 500):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+    async def _request_hedged(
+        self,
+        policy: HedgePolicy,
+        method: str,
+        endpoint: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a request and, if it is slow to answer, a second identical one; the first response wins.
+
+        The losing attempt is cancelled, closing its connection.
+        """
+        policy.admit()
+        started = time.monotonic()
+        primary = asyncio.create_task(self._request(method, endpoint, params=params))
+        pending: set[asyncio.Task[dict[str, Any]]] = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=policy.hedge_delay(endpoint))
+            if not done and policy.try_hedge():
+                pending.add(asyncio.create_task(self._request(method, endpoint, params=params)))
+
+            errors: list[BaseException] = []
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    error = attempt.exception()
+                    if error is None:
+                        policy.observe(endpoint, time.monotonic() - started, hedge_won=attempt is not primary)
+                        return attempt.result()
+                    errors.append(error)
+            raise errors[0]
+        finally:
+            for attempt in pending:
+                attempt.cancel()
+
+    async def _request_reconciled(
+        self,
+        method: str,
+        endpoint: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a request, retrying an ambiguous failure of an unsafe call once reconciliation proves it was lost."""
+        reconciler = self.reconcilers.get(endpoint)
+        attempt = 0
+        while True:
+            started = time.time()
+            try:
+                return await self._request(method, endpoint, params=params)
+            except (httpx.HTTPStatusError, httpx.TransportError) as exc:
+                if reconciler is None or attempt >= self.max_retries or not self._is_ambiguous(exc):
+                    raise
+                attempt += 1
+                await asyncio.sleep(reconciler.delay)
+                if await self._was_accepted(reconciler, params, started):
+                    raise
+
+    async def _was_accepted(
+        self,
+        reconciler: HistoryReconciler,
+        params: Mapping[str, Any] | None,
+        since: float,
+    ) -> bool:
+        try:
+            history = await self._request("GET", reconciler.endpoint)
+        except (httpx.HTTPError, ValueError):
+            # Without the history nothing is proven, so the send must be assumed accepted.
+            return True
+        return reconciler.accepted(history, params or {}, since)
+
+    @staticmethod
+    def _is_ambiguous(exc: httpx.HTTPError) -> bool:
+        if isinstance(exc, httpx.HTTPStatusError):
+            return exc.response.status_code >= 500
+        return True
+
+    async def stream_data(
+        self,
+        method: str,
+        endpoint: str,
+        path: Sequence[str],
+        params: Mapping[str, Any] | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream the items of a list response as they arrive instead of loading the whole body.
+
+        Bypasses the response cache and request coalescing, which both need the complete response.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): API endpoint.
+            path (Sequence[str]): Keys leading to the list to stream, e.g. ``("contacts",)``.
+            params (Mapping[str, Any], optional): Query parameters.
+            meta (dict, optional): Filled with the rest of the response (``status``, ``error``, ...).
+        Raises:
+            CircuitOpenError: If the circuit guarding the endpoint is open.
+            LoadShedError: If the scheduler sheds the call.
+            CredentialError: If the API key is rejected, once the response has been consumed.
+        Returns:
+            AsyncIterator[Any]: The list items, in response order.
+        """
+        meta = meta if meta is not None else {}
+        breaker = self._acquire_circuit(endpoint)
+        try:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async(endpoint)
+            async with self._slot(endpoint):
+                async for item in self._stream(method, endpoint, path, params=params, meta=meta):
+                    yield item
+        except BaseException as exc:
+            self._record_failure(endpoint, breaker, exc)
+            raise
+        self._record_success(endpoint, breaker)
+        self._raise_for_credential_error(meta)
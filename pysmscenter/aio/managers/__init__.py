@@ -0,0 +1,27 @@
+from .balance_manager import AsyncBalanceManager
+from .contact_manager import AsyncContactManager
+from .group_manager import AsyncGroupManager
+from .history_manager import AsyncHistoryManager
+from .hlr_manager import AsyncHLRManager
+from .manager import AsyncManager
+from .mobile_manager import AsyncMobileManager
+from .purchase_manager import AsyncPurchaseManager
+from .sms_manager import AsyncSmsManager
+from .status_manager import AsyncStatusManager
+from .two_factor_manager import AsyncTwoFactorManager
+from .user_manager import AsyncUserManager
+
+__all__ = [
+    "AsyncBalanceManager",
+    "AsyncContactManager",
+    "AsyncGroupManager",
+    "AsyncHLRManager",
+    "AsyncHistoryManager",
+    "AsyncManager",
+    "AsyncMobileManager",
+    "AsyncPurchaseManager",
+    "AsyncSmsManager",
+    "AsyncStatusManager",
+    "AsyncTwoFactorManager",
+    "AsyncUserManager",
+]
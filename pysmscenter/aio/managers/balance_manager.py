@@ -0,0 +1,22 @@
+from typing import cast
+
+from pysmscenter.types import BalanceRawData
+
+from .manager import AsyncManager
+
+
+class AsyncBalanceManager(AsyncManager):
+    name = "balance"
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
+
+    async def check(self) -> BalanceRawData:
+        """Check the account balance.
+
+        Returns:
+            BalanceRawData: Response from the API.
+        """
+        response = await self.call("GET", "me/balance")
+
+        return cast(BalanceRawData, response)
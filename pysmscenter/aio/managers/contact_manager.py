@@ -0,0 +1,137 @@
+from collections.abc import AsyncIterator
+from typing import Any, cast
+
+from pysmscenter.exceptions import ContactExceptionError
+from pysmscenter.managers.contact_manager import ContactManager
+from pysmscenter.types import BaseResponse, ContactData, ContactDetail, ContactListData, Contacts, DateLike
+from pysmscenter.utils import raise_for_errors
+
+from .manager import AsyncManager
+
+
+class AsyncContactManager(AsyncManager):
+    name = "contact"
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
+
+    async def add(
+        self,
+        mobile: str,
+        name: str = "",
+        surname: str = "",
+        full_name: str = "",
+        vname: str = "",
+        vusername: str = "",
+        birthday: DateLike | None = None,
+        nameday: DateLike | None = None,
+        **kwargs: Any,
+    ) -> ContactData:
+        """Add a contact.
+
+        See :meth:`pysmscenter.managers.contact_manager.ContactManager.add` for the parameters.
+
+        Raises:
+            ContactExceptionError: If the API response indicates an error.
+
+        Returns:
+           ContactData: Response from the API.
+        """
+        params = ContactManager._add_params(
+            mobile, name, surname, full_name, vname, vusername, birthday, nameday, **kwargs
+        )
+
+        response = await self.call("GET", "contact/add", params)
+
+        raise_for_errors(response, ContactExceptionError)
+
+        return cast(ContactData, response)
+
+    async def list(self) -> ContactListData:
+        """Get the list of contacts.
+
+        Returns:
+            ContactListData: Response from the API.
+        """
+        response = await self.call("GET", "contact/list")
+        return cast(ContactListData, response)
+
+    async def iter(self) -> AsyncIterator[Contacts]:
+        """Iterate over all contacts, parsing them as they are received.
+
+        Raises:
+            ContactExceptionError: If the API response indicates an error, once the response has been consumed.
+
+        Returns:
+            AsyncIterator[Contacts]: Contacts, in response order.
+        """
+        meta: dict[str, Any] = {}
+        async for contact in self.stream("GET", "contact/list", ("contacts",), meta=meta):
+            yield contact
+        raise_for_errors(meta, ContactExceptionError)
+
+    async def get(self, contact_id: str) -> ContactDetail:
+        """Get a contact's details.
+
+        Args:
+            contact_id: Contact ID to retrieve.
+
+        Raises:
+            ContactExceptionError: If the API response indicates an error.
+
+        Returns:
+            ContactDetail: Response from the API.
+        """
+        response = await self.call("GET", "contact/get", {"contactId": contact_id})
+        raise_for_errors(response, ContactExceptionError)
+        return cast(ContactDetail, response)
+
+    async def delete(self, contact_id: str) -> BaseResponse:
+        """Delete a contact.
+
+        Args:
+            contact_id (str): Contact ID of the contact to delete.
+
+        Raises:
+            ContactExceptionError: If the API response indicates an error.
+
+        Returns:
+            BaseResponse: Response from the API.
+        """
+        response = await self.call("GET", "contact/delete", {"contactId": contact_id})
+
+        raise_for_errors(response, ContactExceptionError)
+
+        return cast(BaseResponse, response)
+
+    async def update(
+        self,
+        contact_id: str,
+        mobile: str | None = None,
+        name: str | None = None,
+        surname: str | None = None,
+        full_name: str | None = None,
+        vname: str | None = None,
+        vusername: str | None = None,
+        birthday: DateLike | None = None,
+        nameday: DateLike | None = None,
+        **kwargs: Any,
+    ) -> ContactData:
+        """Update a contact.
+
+        See :meth:`pysmscenter.managers.contact_manager.ContactManager.update` for the parameters.
+
+        Raises:
+            ContactExceptionError: If the API response indicates an error.
+
+        Returns:
+            ContactData: Response from the API.
+        """
+        params = ContactManager._update_params(
+            contact_id, mobile, name, surname, full_name, vname, vusername, birthday, nameday, **kwargs
+        )
+        response = await self.call("GET", "contact/update", params)
+
+        raise_for_errors(response, ContactExceptionError)
+
+        return cast(ContactData, response)
@@ -0,0 +1,161 @@
+from collections.abc import AsyncIterator
+from typing import Any, cast, overload
+
+from pysmscenter.exceptions import GroupExceptionError
+from pysmscenter.managers.group_manager import GroupManager
+from pysmscenter.types import BaseResponse, GroupAddContactData, GroupContact, GroupData, GroupGetData, GroupListData
+from pysmscenter.utils import raise_for_errors
+
+from .manager import AsyncManager
+
+
+class AsyncGroupManager(AsyncManager):
+    name = "group"
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
+
+    async def add(self, name: str) -> GroupData:
+        """
+        Add a new group.
+
+        Args:
+            name (str): The name of the group to be added.
+        """
+        response = await self.call("GET", "group/add", {"name": name})
+        raise_for_errors(response, GroupExceptionError)
+        return cast(GroupData, response)
+
+    async def delete(self, group_id: str) -> GroupData:
+        """
+        Delete a group.
+
+        Args:
+            group_id (str): The ID of the group to be deleted.
+        """
+        response = await self.call("GET", "group/delete", {"groupId": group_id})
+        raise_for_errors(response, GroupExceptionError)
+
+        return cast(GroupData, response)
+
+    async def list(self) -> GroupListData:
+        """
+        List all groups.
+
+        Returns:
+            GroupListData: Response from the API.
+        """
+        response = await self.call("GET", "group/list")
+
+        return cast(GroupListData, response)
+
+    async def get(self, group_id: str) -> GroupGetData:
+        """
+        Get details of a specific group.
+
+        Args:
+            group_id (str): The ID of the group to retrieve.
+
+        Raises:
+            GroupExceptionError: If the API response indicates an error.
+
+        Returns:
+            GroupGetData: Response from the API.
+        """
+        response = await self.call("GET", "group/get", {"groupId": group_id})
+
+        raise_for_errors(response, GroupExceptionError)
+
+        return cast(GroupGetData, response)
+
+    async def iter_contacts(self, group_id: str) -> AsyncIterator[GroupContact]:
+        """
+        Iterate over the contacts of a group, parsing them as they are received.
+
+        Args:
+            group_id (str): The ID of the group whose contacts to iterate.
+
+        Raises:
+            GroupExceptionError: If the API response indicates an error, once the response has been consumed.
+
+        Returns:
+            AsyncIterator[GroupContact]: Contacts of the group, in response order.
+        """
+        meta: dict[str, Any] = {}
+        async for contact in self.stream("GET", "group/get", ("group", "contacts"), {"groupId": group_id}, meta=meta):
+            yield contact
+        raise_for_errors(meta, GroupExceptionError)
+
+    async def add_contact(self, group_id: str, contact_id: str) -> GroupAddContactData:
+        """
+        Add a contact to a group.
+
+        Args:
+            group_id (str): The ID of the group to which the contact will be added.
+            contact_id (str): The ID of the contact to be added.
+
+        Raises:
+            GroupExceptionError: If the API response indicates an error.
+
+        Returns:
+            GroupAddContactData: Response from the API.
+        """
+        params = {
+            "groupId": group_id,
+            "contactId": contact_id,
+        }
+
+        response = await self.call("GET", "group/addContact", params)
+
+        raise_for_errors(response, GroupExceptionError)
+
+        return cast(GroupAddContactData, response)
+
+    @overload
+    async def delete_contact(self, *, group_id: str, contact_id: str) -> BaseResponse: ...
+
+    @overload
+    async def delete_contact(self, *, contact_group_id: str) -> BaseResponse: ...
+
+    async def delete_contact(
+        self,
+        *,
+        group_id: str | None = None,
+        contact_id: str | None = None,
+        contact_group_id: str | None = None,
+    ) -> BaseResponse:
+        """
+        Delete a contact from a group.
+
+        See :meth:`pysmscenter.managers.group_manager.GroupManager.delete_contact` for the parameters.
+
+        Raises:
+            GroupExceptionError: If the API response indicates an error.
+            ValueError: If neither contact_group_id nor both group_id and contact_id are provided.
+        Returns:
+            BaseResponse: Response from the API.
+        """
+        params = GroupManager._delete_contact_params(group_id, contact_id, contact_group_id)
+
+        response = await self.call("GET", "group/deleteContact", params)
+
+        raise_for_errors(response, GroupExceptionError)
+
+        return cast(BaseResponse, response)
+
+    async def delete_all_contacts(self, group_id: str) -> BaseResponse:
+        """
+        Delete all contacts from a group.
+
+        Args:
+            group_id (str): The ID of the group from which all contacts will be deleted.
+        Raises:
+            GroupExceptionError: If the API response indicates an error.
+        Returns:
+            BaseResponse: Response from the API.
+        """
+        response = await self.call("GET", "group/deleteAllContacts", {"groupId": group_id})
+
+        raise_for_errors(response, GroupExceptionError)
+
+        return cast(BaseResponse, response)
@@ -0,0 +1,48 @@
+from collections.abc import AsyncIterator
+from typing import cast
+
+from pysmscenter.types import GroupListHistoryRawResponse, HistoryGroupItem, SingleListHistoryRawData, SmS
+
+from .manager import AsyncManager
+
+
+class AsyncHistoryManager(AsyncManager):
+    name = "history"
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
+
+    async def group_list(self) -> GroupListHistoryRawResponse:
+        """Get the grouped SMS history list.
+
+        Returns:
+            GroupListHistoryRawResponse: Response from the API.
+        """
+        response = await self.call("GET", "history/group/list")
+        return cast(GroupListHistoryRawResponse, response)
+
+    async def single_list(self) -> SingleListHistoryRawData:
+        """Get the single (non-grouped) SMS history list.
+
+        Returns:
+            SingleListHistoryRawData: Response from the API.
+        """
+        response = await self.call("GET", "history/single/list")
+
+        return cast(SingleListHistoryRawData, response)
+
+    def iter_single(self) -> AsyncIterator[SmS]:
+        """Iterate over the single SMS history, parsing messages as they are received.
+
+        Returns:
+            AsyncIterator[SmS]: Messages, in response order.
+        """
+        return self.stream("GET", "history/single/list", ("sms",))
+
+    def iter_groups(self) -> AsyncIterator[HistoryGroupItem]:
+        """Iterate over the grouped SMS history, parsing groups as they are received.
+
+        Returns:
+            AsyncIterator[HistoryGroupItem]: History groups, in response order.
+        """
+        return self.stream("GET", "history/group/list", ())
@@ -0,0 +1,30 @@
+from collections.abc import AsyncIterator, Mapping, Sequence
+from typing import Any, ClassVar, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from pysmscenter.aio.client import AsyncSMSClient
+
+
+class AsyncManager:
+    name: ClassVar[str]
+
+    def __init__(self, client: "AsyncSMSClient") -> None:
+        self.client = client
+
+    async def call(
+        self,
+        method: str,
+        endpoint: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        return await self.client.fetch_data(method, endpoint, params)
+
+    def stream(
+        self,
+        method: str,
+        endpoint: str,
+        path: Sequence[str],
+        params: Mapping[str, Any] | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> AsyncIterator[Any]:
+        return self.client.stream_data(method, endpoint, path, params, meta)
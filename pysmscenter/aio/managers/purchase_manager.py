@@ -0,0 +1,22 @@
+from typing import cast
+
+from pysmscenter.types import PurchaseRawResponse
+
+from .manager import AsyncManager
+
+
+class AsyncPurchaseManager(AsyncManager):
+    name = "purchase"
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
+
+    async def list(self) -> PurchaseRawResponse:
+        """List available purchase options.
+
+        Returns:
+            PurchaseRawResponse: Response from the API.
+        """
+        response = await self.call("GET", "purchase/list")
+
+        return cast(PurchaseRawResponse, response)
@@ -0,0 +1,244 @@
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Mapping, Sequence
+from typing import Any, cast
+
+from pysmscenter.bulk import (
+    BulkJob,
+    CampaignSummary,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_MAX_URL_LENGTH,
+    chunk_recipients,
+)
+from pysmscenter.exceptions import SMSExceptionError
+from pysmscenter.managers.sms_manager import SmsManager
+from pysmscenter.merge import ContactSource, MergeGrouper, MessageTemplate, contact_rows
+from pysmscenter.types import SMSBulkRawData, SMSCancelRawData, SMSRawData, Timestamp
+from pysmscenter.utils import raise_for_errors
+
+from .manager import AsyncManager
+
+
+class AsyncSmsManager(AsyncManager):
+    name = "sms"
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
+
+    async def send(
+        self,
+        to: str,
+        text: str,
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+        callback: str | None = None,
+    ) -> SMSRawData:
+        """Send an SMS.
+
+        Args:
+            to (str): Mobile number to send the sms to
+            text (str): Text of the sms to send
+            sender (str): Sender of the sms
+            ucs (bool, optional): Whether the sms is unicode. Defaults to None, detected from the text.
+            flash (bool, optional): Whether the sms is flash. Defaults to None.
+            timestamp (Timestamp, optional): Timestamp for scheduled sending. Defaults to None.
+            callback (str, optional): Callback URL for delivery reports. Defaults to None.
+
+        Raises:
+            SMSExceptionError: If the API response indicates an error.
+
+        Returns:
+            SMSRawData: Response from the API.
+        """
+        text = SmsManager._prepare_text(self.client, text)
+        params = SmsManager._send_params(to, text, sender, ucs, flash, timestamp, callback)
+
+        response = await self.call("GET", "sms/send", params)
+
+        raise_for_errors(response, SMSExceptionError)
+
+        return cast(SMSRawData, response)
+
+    async def bulk(
+        self,
+        to: Sequence[str] | str,
+        text: str,
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+    ) -> SMSBulkRawData:
+        """Send an SMS to multiple recipients.
+
+        Args:
+            to (Sequence[str] | str): multiple mobiles to send the sms to
+            text (str): Text of the sms to send
+            sender (str): Sender of the sms
+            ucs (bool, optional): Whether the sms is unicode. Defaults to None, detected from the text.
+            flash (bool, optional): Whether the sms is flash. Defaults to None.
+            timestamp (Timestamp, optional): Timestamp for scheduled sending. Defaults to None.
+
+        Raises:
+            SMSExceptionError: If the API response indicates an error.
+
+        Returns:
+            SMSBulkRawData: Response from the API.
+        """
+        text = SmsManager._prepare_text(self.client, text)
+        params = SmsManager._bulk_params(to, text, sender, ucs, flash, timestamp)
+
+        response = await self.call("GET", "sms/bulk", params)
+        raise_for_errors(response, SMSExceptionError)
+
+        return cast(SMSBulkRawData, response)
+
+    async def bulk_stream(
+        self,
+        recipients: Iterable[str],
+        text: str,
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> CampaignSummary:
+        """Send an SMS to any number of recipients, split into pipelined ``sms/bulk`` calls.
+
+        Args:
+            recipients (Iterable[str]): Mobile numbers to send the sms to. May be a lazy iterable.
+            text (str): Text of the sms to send
+            sender (str): Sender of the sms
+            ucs (bool, optional): Whether the sms is unicode. Defaults to None, detected from the text.
+            flash (bool, optional): Whether the sms is flash. Defaults to None.
+            timestamp (Timestamp, optional): Timestamp for scheduled sending. Defaults to None.
+            chunk_size (int, optional): Maximum recipients per call. Defaults to 1000.
+            max_url_length (int, optional): Maximum request URL length. Defaults to 8000.
+            max_in_flight (int, optional): Maximum concurrent calls. Defaults to 4.
+
+        Returns:
+            CampaignSummary: Merged results, including rejected recipients to retry.
+        """
+        text = SmsManager._prepare_text(self.client, text)
+        params = SmsManager._bulk_params("", text, sender, ucs, flash, timestamp)
+        base_length = SmsManager._bulk_base_length(self.client, params)
+
+        async def jobs() -> AsyncIterator[BulkJob]:
+            for chunk in chunk_recipients(recipients, base_length, chunk_size, max_url_length):
+                yield params, chunk
+
+        return await self._send_chunks(jobs(), max_in_flight)
+
+    async def merge(
+        self,
+        template: MessageTemplate | str,
+        contacts: ContactSource | AsyncIterable[Mapping[str, Any]],
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> CampaignSummary:
+        """Send a personalized SMS to every contact, one ``sms/bulk`` call per distinct rendered text.
+
+        Args:
+            template (MessageTemplate | str): Message with ``{field}`` placeholders, e.g. ``"Hello {vname}!"``.
+            contacts (ContactSource | AsyncIterable): A group ID, a contact list response or any (async) iterable
+                of contacts.
+            sender (str): Sender of the sms
+            ucs (bool, optional): Whether the sms is unicode. Defaults to None, detected from the text.
+            flash (bool, optional): Whether the sms is flash. Defaults to None.
+            timestamp (Timestamp, optional): Timestamp for scheduled sending. Defaults to None.
+            chunk_size (int, optional): Maximum recipients per call. Defaults to 1000.
+            max_url_length (int, optional): Maximum request URL length. Defaults to 8000.
+            max_in_flight (int, optional): Maximum concurrent calls. Defaults to 4.
+
+        Raises:
+            ContactExceptionError: If ``contacts`` is a contact list response that indicates an error.
+
+        Returns:
+            CampaignSummary: Merged results, including rejected recipients to retry.
+        """
+        if isinstance(template, str):
+            template = MessageTemplate(template)
+
+        def params(text: str) -> dict[str, Any]:
+            return SmsManager._bulk_params("", text, sender, ucs, flash, timestamp)
+
+        grouper = MergeGrouper(
+            template,
+            lambda text: SmsManager._bulk_base_length(self.client, params(text)),
+            chunk_size,
+            max_url_length,
+            self.client.transliterator,
+        )
+
+        async def jobs() -> AsyncIterator[BulkJob]:
+            source = self.client.group.iter_contacts(contacts) if isinstance(contacts, str) else contacts
+            if isinstance(source, AsyncIterable):
+                async for contact in source:
+                    for text, chunk in grouper.feed(contact):
+                        yield params(text), chunk
+            else:
+                for contact in contact_rows(source):
+                    for text, chunk in grouper.feed(contact):
+                        yield params(text), chunk
+            for text, chunk in grouper.close():
+                yield params(text), chunk
+
+        return await self._send_chunks(jobs(), max_in_flight)
+
+    async def _send_chunks(self, jobs: AsyncIterator[BulkJob], max_in_flight: int) -> CampaignSummary:
+        summary = CampaignSummary()
+        in_flight: dict[asyncio.Task[SMSBulkRawData], list[str]] = {}
+
+        async def drain() -> None:
+            done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                chunk = in_flight.pop(task)
+                error = task.exception()
+                if error is not None:
+                    summary.add_failure(chunk, error)
+                else:
+                    summary.add(chunk, task.result())
+
+        try:
+            async for params, chunk in jobs:
+                if len(in_flight) >= max_in_flight:
+                    await drain()
+                in_flight[asyncio.create_task(self._bulk_chunk(chunk, params))] = chunk
+            while in_flight:
+                await drain()
+        finally:
+            for task in in_flight:
+                task.cancel()
+        return summary
+
+    async def _bulk_chunk(self, recipients: list[str], params: Mapping[str, Any]) -> SMSBulkRawData:
+        response = await self.call("GET", "sms/bulk", {**params, "to": ",".join(recipients)})
+        raise_for_errors(response, SMSExceptionError)
+        return cast(SMSBulkRawData, response)
+
+    async def cancel(self, sms_id: str) -> SMSCancelRawData:
+        """Cancel a scheduled SMS.
+
+        Args:
+            sms_id (str): ID of the sms to cancel
+
+        Raises:
+            SMSExceptionError: If the API response indicates an error.
+
+        Returns:
+            SMSCancelRawData: Response from the API.
+        """
+        params = {"smsId": sms_id}
+        response = await self.call("GET", "sms/cancel", params)
+        raise_for_errors(response, SMSExceptionError)
+        return cast(SMSCancelRawData, response)
@@ -0,0 +1,52 @@
+from typing import cast
+
+from pysmscenter.exceptions import TwoFactorExceptionError
+from pysmscenter.managers.two_factor_manager import TwoFactorManager
+from pysmscenter.types import TwoFactorCheckResponse, TwoFactorRawResponse
+from pysmscenter.utils import raise_for_errors
+
+from .manager import AsyncManager
+
+
+class AsyncTwoFactorManager(AsyncManager):
+    name = "two_factor"
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
+
+    async def send(
+        self,
+        to: str,
+        text: str | None = None,
+        sender: str | None = None,
+        wait: int | None = None,
+        callback: str | None = None,
+        ucs: bool | None = None,
+    ) -> TwoFactorRawResponse:
+        """
+        Send a 2FA code to a mobile number.
+
+        See :meth:`pysmscenter.managers.two_factor_manager.TwoFactorManager.send` for the parameters.
+        """
+        params = TwoFactorManager._send_params(to, text, sender, wait, callback, ucs)
+
+        response = await self.call("GET", "2fa/send", params=params)
+        raise_for_errors(response, TwoFactorExceptionError)
+        return cast(TwoFactorRawResponse, response)
+
+    async def check(self, auth_id: str, code: str) -> TwoFactorCheckResponse:
+        """
+        Check the 2FA code for a given auth_id.
+
+        Args:
+            auth_id (str): The authentication ID received when sending the 2FA code.
+            code (str): The 2FA code to check.
+        """
+        params = {
+            "authId": auth_id,
+            "code": code,
+        }
+
+        response = await self.call("GET", "2fa/check", params=params)
+        raise_for_errors(response, TwoFactorExceptionError)
+        return cast(TwoFactorCheckResponse, response)
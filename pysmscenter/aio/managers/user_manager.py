@@ -0,0 +1,99 @@
+from typing import cast
+
+from pysmscenter.exceptions import SMSClientError, UserCommentExceptionError, UserExceptionError
+from pysmscenter.managers.user_manager import UserManager
+from pysmscenter.types import (
+    BaseResponse,
+    UserCommentListRawResponseType,
+    UserCommentRawResponse,
+    UserListRawResponseType,
+    UserRawResponse,
+)
+from pysmscenter.utils import raise_for_errors
+
+from .manager import AsyncManager
+
+
+class AsyncUserManager(AsyncManager):
+    name = "user"
+
+    def __str__(self) -> str:
+        return self.__class__.__name__
+
+    async def add(self, email: str, password: str) -> UserRawResponse:
+        """
+        Add a new sub-account with the given email and password.
+
+        Args:
+            email (str): The email address for the new sub-account.
+            password (str): The password for the new sub-account.
+        """
+        UserManager._validate_email(email)
+        params = {"email": email, "password": password}
+        response = await self.call("GET", "user/add", params=params)
+        raise_for_errors(response, UserExceptionError)
+        return cast(UserRawResponse, response)
+
+    async def list(self) -> UserListRawResponseType:
+        """
+        List all sub-accounts under the main account.
+
+        Returns:
+            UserListRawResponseType: The response containing the list of sub-accounts.
+        """
+        response = await self.call("GET", "user/list")
+        return cast(UserListRawResponseType, response)
+
+    async def topup(self, user_id: str, sms: str, cost: str) -> UserRawResponse:
+        """
+        Top up a sub-account with the specified amount.
+
+        Args:
+            user_id (str): The ID of the sub-account to top up.
+            sms (str): The number of SMS to add to the sub-account balance.
+            cost (str): The cost associated with the top-up.
+
+        Returns:
+            UserRawResponse: The response containing the updated sub-account information.
+        """
+        params = {"userId": user_id, "sms": sms, "cost": cost}
+        response = await self.call("GET", "user/topup", params=params)
+        raise_for_errors(response, UserExceptionError)
+        return cast(UserRawResponse, response)
+
+    async def add_comment(self, user_id: str, comment: str) -> UserCommentRawResponse:
+        """
+        Add a comment to a sub-account.
+
+        Args:
+            user_id (str): The ID of the sub-account to add a comment to.
+            comment (str): The comment to add to the sub-account.
+        """
+        params = {"userId": user_id, "comment": comment}
+        response = await self.call("GET", "user/comment/add", params=params)
+        raise_for_errors(response, UserCommentExceptionError)
+        return cast(UserCommentRawResponse, response)
+
+    async def delete_comment(self, comment_id: str) -> BaseResponse:
+        """
+        Delete a comment from a sub-account.
+
+        Args:
+            comment_id (str): The ID of the comment to delete.
+        """
+        params = {"commentId": comment_id}
+        response = await self.call("GET", "user/comment/delete", params=params)
+        raise_for_errors(response, SMSClientError)
+        return cast(BaseResponse, response)
+
+    async def comments(self, user_id: str) -> UserCommentListRawResponseType:
+        """
+        List all comments for a sub-account.
+
+        Args:
+            user_id (str): The ID of the sub-account to list comments for.
+        """
+        params = {"userId": user_id}
+        response = await self.call("GET", "user/comment/list", params=params)
+        raise_for_errors(response, SMSClientError)
+        return cast(UserCommentListRawResponseType, response)
@@ -0,0 +1,219 @@
+import threading
+import time
+import types
+from collections.abc import Mapping
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Protocol, Self, TYPE_CHECKING
+
+from pysmscenter.exceptions import SMSExceptionError
+from pysmscenter.managers.sms_manager import SmsManager
+from pysmscenter.parallel import ParallelExecutor
+from pysmscenter.types import SMSBulkItem, Timestamp
+from pysmscenter.utils import msisdn_key
+
+if TYPE_CHECKING:
+    from pysmscenter.main import SMSClient
+
+type BatchKey = tuple[tuple[str, Any], ...]
+
+
+class _ResultSink(Protocol):
+    def done(self) -> bool: ...
+
+    def set_result(self, result: SMSBulkItem, /) -> None: ...
+
+    def set_exception(self, exception: BaseException, /) -> None: ...
+
+
+@dataclass(slots=True)
+class Batch[F: _ResultSink]:
+    """Sends waiting to go out together in one ``sms/bulk`` call."""
+
+    params: dict[str, Any]
+    deadline: float
+    recipients: list[str] = field(default_factory=list[str])
+    futures: list[F] = field(default_factory=list[F])
+    keys: set[str] = field(default_factory=set[str])
+
+    def __len__(self) -> int:
+        return len(self.recipients)
+
+    def __contains__(self, to: str) -> bool:
+        return msisdn_key(to) in self.keys
+
+    def add(self, to: str, future: F) -> None:
+        self.recipients.append(to)
+        self.futures.append(future)
+        self.keys.add(msisdn_key(to))
+
+    def resolve(self, response: Mapping[str, Any]) -> None:
+        """Hand each caller the ``sms`` item for its own recipient, or an error if it was rejected."""
+        items: list[SMSBulkItem] = list(response.get("sms") or ())
+        by_recipient = {msisdn_key(msisdn): item for item in items if (msisdn := item.get("msisdn"))}
+        if not by_recipient and len(items) == len(self.recipients):
+            # Without numbers in the response only a complete, ordered answer can be matched up.
+            by_recipient = {msisdn_key(to): item for to, item in zip(self.recipients, items, strict=True)}
+        for to, future in zip(self.recipients, self.futures, strict=True):
+            item = by_recipient.get(msisdn_key(to))
+            if future.done():
+                # The caller stopped waiting and cancelled its future.
+                continue
+            if item is not None:
+                future.set_result(item)
+            else:
+                future.set_exception(SMSExceptionError(f"Recipient {to} was rejected", response=dict(response)))
+
+    def fail(self, error: BaseException) -> None:
+        for future in self.futures:
+            if not future.done():
+                future.set_exception(error)
+
+
+def batch_key(params: Mapping[str, Any]) -> BatchKey:
+    """Identity of the message a send carries; sends with equal keys can share an ``sms/bulk`` call."""
+    return tuple(sorted((name, value) for name, value in params.items() if name != "to"))
+
+
+class BatchingSender:
+    """Coalesce concurrent single sends of the same message into ``sms/bulk`` calls.
+
+    Sends with the same text, sender, ``ucs``, ``flash`` and ``timestamp`` are held for up to
+    ``max_delay`` seconds, or until ``max_batch`` recipients have joined, and then go out as one call.
+    Every caller still receives the result for its own recipient.
+
+    Args:
+        client: Client to send through.
+        max_delay: Seconds the first send of a batch may wait for others to join.
+        max_batch: Recipients that make a batch go out immediately.
+        max_workers: Batches that may be in flight at the same time.
+    """
+
+    def __init__(
+        self,
+        client: "SMSClient",
+        max_delay: float = 0.005,
+        max_batch: int = 100,
+        max_workers: int = 4,
+    ) -> None:
+        if max_batch < 1:
+            raise ValueError("max_batch must be at least 1")
+        self.client = client
+        self.max_delay = max_delay
+        self.max_batch = max_batch
+        self._executor = ParallelExecutor(client, max_workers=max_workers)
+        self._batches: dict[BatchKey, Batch[Future[SMSBulkItem]]] = {}
+        self._condition = threading.Condition()
+        self._timer: threading.Thread | None = None
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} max_delay={self.max_delay} max_batch={self.max_batch}>"
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> bool:
+        self.close()
+        return False
+
+    def send(
+        self,
+        to: str,
+        text: str,
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+    ) -> SMSBulkItem:
+        """Send an SMS as part of a batch and wait for its result.
+
+        Raises:
+            SMSExceptionError: If the API rejects the batch or this recipient.
+
+        Returns:
+            SMSBulkItem: The ``sms/bulk`` result for this recipient.
+        """
+        return self.submit(to, text, sender, ucs, flash, timestamp).result()
+
+    def submit(
+        self,
+        to: str,
+        text: str,
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+    ) -> Future[SMSBulkItem]:
+        """Queue an SMS for the next batch and return a future for its result."""
+        text = SmsManager._prepare_text(self.client, text)
+        params = SmsManager._bulk_params("", text, sender, ucs, flash, timestamp)
+        key = batch_key(params)
+        future: Future[SMSBulkItem] = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("BatchingSender is closed")
+            batch = self._batches.get(key)
+            if batch is not None and to in batch:
+                # One call cannot tell two sends to the same number apart, so the open batch goes first.
+                self._dispatch(self._batches.pop(key))
+                batch = None
+            if batch is None:
+                batch = self._batches[key] = Batch(params, time.monotonic() + self.max_delay)
+                self._start_timer()
+                self._condition.notify()
+            batch.add(to, future)
+            if len(batch) >= self.max_batch:
+                self._dispatch(self._batches.pop(key))
+        return future
+
+    def flush(self) -> None:
+        """Send every pending batch now."""
+        with self._condition:
+            for key in list(self._batches):
+                self._dispatch(self._batches.pop(key))
+
+    def close(self) -> None:
+        """Send pending batches, wait for them to complete and stop the sender."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+            timer = self._timer
+        if timer is not None:
+            timer.join()
+        self.flush()
+        self._executor.shutdown(wait=True)
+
+    def _start_timer(self) -> None:
+        if self._timer is None:
+            self._timer = threading.Thread(target=self._run_timer, name="pysmscenter-batching", daemon=True)
+            self._timer.start()
+
+    def _run_timer(self) -> None:
+        with self._condition:
+            while not self._closed:
+                if not self._batches:
+                    self._condition.wait()
+                    continue
+                now = time.monotonic()
+                for key, batch in list(self._batches.items()):
+                    if batch.deadline <= now:
+                        self._dispatch(self._batches.pop(key))
+                if self._batches:
+                    self._condition.wait(min(batch.deadline for batch in self._batches.values()) - now)
+
+    def _dispatch(self, batch: Batch[Future[SMSBulkItem]]) -> None:
+        self._executor.start().submit(self._send_batch, batch)
+
+    def _send_batch(self, batch: Batch[Future[SMSBulkItem]]) -> None:
+        try:
+            response = self.client.sms._bulk_chunk(batch.recipients, batch.params)
+        except BaseException as exc:
+            batch.fail(exc)
+        else:
+            batch.resolve(response)
@@ -0,0 +1,118 @@
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Any
+from urllib.parse import quote
+
+from pysmscenter.types import SMSBulkItem
+from pysmscenter.utils import msisdn_key
+
+DEFAULT_CHUNK_SIZE = 1000
+# Conservative request-line limit; many servers and proxies reject URLs longer than 8 KiB.
+DEFAULT_MAX_URL_LENGTH = 8000
+DEFAULT_MAX_IN_FLIGHT = 4
+
+# Query parameters of an ``sms/bulk`` call (without ``to``) and the recipients to send them to.
+type BulkJob = tuple[Mapping[str, Any], list[str]]
+
+# Recipients are joined with "," which is percent-encoded in the query string.
+_SEPARATOR_LENGTH = len(quote(","))
+
+
+def chunk_recipients(
+    recipients: Iterable[str],
+    base_length: int = 0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+) -> Iterator[list[str]]:
+    """Split recipients lazily into chunks bounded by count and by the length of the resulting URL.
+
+    Args:
+        recipients: Mobile numbers; blank entries are skipped.
+        base_length: Length of the request URL without any recipients.
+        chunk_size: Maximum recipients per chunk.
+        max_url_length: Maximum URL length once a chunk's recipients are added.
+
+    Returns:
+        Iterator[list[str]]: Chunks of recipients, in input order. A recipient that does not fit on its
+        own is still sent alone, so the provider can reject it.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    chunk: list[str] = []
+    length = base_length
+    for raw in recipients:
+        recipient = raw.strip()
+        if not recipient:
+            continue
+        added = len(quote(recipient, safe="")) + (_SEPARATOR_LENGTH if chunk else 0)
+        if chunk and (len(chunk) >= chunk_size or length + added > max_url_length):
+            yield chunk
+            chunk, length = [], base_length
+            added = len(quote(recipient, safe=""))
+        chunk.append(recipient)
+        length += added
+    if chunk:
+        yield chunk
+
+
+@dataclass(slots=True)
+class ChunkFailure:
+    """A chunk whose ``sms/bulk`` call failed as a whole."""
+
+    recipients: list[str]
+    error: BaseException
+
+
+@dataclass(slots=True)
+class CampaignSummary:
+    """Merged outcome of every ``sms/bulk`` call made for one campaign."""
+
+    chunks: int = 0
+    accepted: int = 0
+    rejected: int = 0
+    cost: Decimal = field(default_factory=Decimal)
+    balance: str | None = None
+    sms: list[SMSBulkItem] = field(default_factory=list[SMSBulkItem])
+    rejected_recipients: list[str] = field(default_factory=list[str])
+    failures: list[ChunkFailure] = field(default_factory=list[ChunkFailure])
+
+    @property
+    def ok(self) -> bool:
+        return not self.rejected_recipients and not self.failures
+
+    def add(self, recipients: list[str], response: Mapping[str, Any]) -> None:
+        """Merge the response of a successful chunk."""
+        self.chunks += 1
+        items: list[SMSBulkItem] = list(response.get("sms") or ())
+        self.sms.extend(items)
+        self.accepted += _to_int(response.get("accepted"), len(items))
+        self.cost += _to_decimal(response.get("cost"))
+        if response.get("balance") is not None:
+            self.balance = str(response["balance"])
+        sent = {msisdn_key(msisdn) for item in items if (msisdn := item.get("msisdn"))}
+        # Without per-recipient numbers in the response the rejected recipients cannot be identified.
+        rejected = [recipient for recipient in recipients if msisdn_key(recipient) not in sent] if sent else []
+        self.rejected += _to_int(response.get("rejected"), len(rejected))
+        self.rejected_recipients.extend(rejected)
+
+    def add_failure(self, recipients: list[str], error: BaseException) -> None:
+        """Record a chunk that failed; all of its recipients need to be sent again."""
+        self.chunks += 1
+        self.rejected += len(recipients)
+        self.rejected_recipients.extend(recipients)
+        self.failures.append(ChunkFailure(recipients, error))
+
+
+def _to_int(value: Any, default: int) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _to_decimal(value: Any) -> Decimal:
+    try:
+        return Decimal(str(value)) if value is not None else Decimal()
+    except InvalidOperation:
+        return Decimal()
@@ -0,0 +1,187 @@
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from pysmscenter.endpoints import RequestKey, request_key
+
+DEFAULT_TTLS: Mapping[str, float] = {
+    "me/balance": 30.0,
+    "contact/list": 300.0,
+    "contact/get": 300.0,
+    "group/list": 300.0,
+    "group/get": 300.0,
+    "purchase/list": 600.0,
+    "user/list": 300.0,
+}
+
+# Mutating endpoint -> cached endpoints it makes stale. When a parameter name is given, only entries
+# whose parameter matches the mutation's value are dropped; if the mutation does not carry that
+# parameter (e.g. ``group/deleteContact`` by ``contactGroupId``) every entry of the endpoint is dropped.
+DEFAULT_INVALIDATIONS: Mapping[str, tuple[tuple[str, str | None], ...]] = {
+    "contact/add": (("contact/list", None), ("contact/get", None)),
+    "contact/update": (("contact/list", None), ("contact/get", "contactId"), ("group/get", None)),
+    "contact/delete": (("contact/list", None), ("contact/get", "contactId"), ("group/get", None)),
+    "group/add": (("group/list", None),),
+    "group/delete": (("group/list", None), ("group/get", "groupId")),
+    "group/addContact": (("group/get", "groupId"),),
+    "group/deleteContact": (("group/get", "groupId"),),
+    "group/deleteAllContacts": (("group/get", "groupId"),),
+    "sms/send": (("me/balance", None),),
+    "sms/bulk": (("me/balance", None),),
+    "sms/cancel": (("me/balance", None),),
+    "2fa/send": (("me/balance", None),),
+    "hlr/lookup": (("me/balance", None),),
+    "user/add": (("user/list", None),),
+    "user/topup": (("user/list", None), ("me/balance", None)),
+}
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """Caching policy for API responses on top of a pluggable storage backend.
+
+    The policy decides which endpoints are cached and for how long (``ttls``) and which cached
+    entries a mutating call makes stale (``invalidations``). Subclasses provide the storage by
+    implementing :meth:`_load`, :meth:`_store`, :meth:`_drop` and :meth:`clear`.
+
+    Cached responses are shared between callers and should be treated as read-only.
+
+    Args:
+        ttls: Seconds to keep responses per endpoint. Endpoints without a TTL are never cached.
+        invalidations: Mutating endpoint to the cached endpoints it invalidates.
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        invalidations: Mapping[str, tuple[tuple[str, str | None], ...]] = DEFAULT_INVALIDATIONS,
+    ) -> None:
+        self.ttls = dict(ttls)
+        self.invalidations = dict(invalidations)
+        self.stats = CacheStats()
+
+    def get(self, method: str, endpoint: str, params: Mapping[str, Any] | None = None) -> dict[str, Any] | None:
+        """Return the cached response for a call, or None on a miss or for uncacheable calls."""
+        if not self._cacheable(method, endpoint):
+            return None
+        value = self._load(request_key(endpoint, params))
+        if value is None:
+            self.stats.misses += 1
+        else:
+            self.stats.hits += 1
+        return value
+
+    def update(
+        self,
+        method: str,
+        endpoint: str,
+        params: Mapping[str, Any] | None,
+        response: Mapping[str, Any],
+    ) -> None:
+        """Record the response of a completed call: store it if cacheable and drop entries it invalidates."""
+        if self._cacheable(method, endpoint):
+            if str(response.get("status")) == "1":
+                self._store(request_key(endpoint, params), dict(response), self.ttls[endpoint])
+            return
+        params = params or {}
+        for target, param in self.invalidations.get(endpoint, ()):
+            match = {param: str(params[param])} if param is not None and param in params else None
+            self.stats.invalidations += self._drop(target, match)
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    def _cacheable(self, method: str, endpoint: str) -> bool:
+        return method.upper() == "GET" and endpoint in self.ttls
+
+    def _load(self, key: RequestKey) -> dict[str, Any] | None:
+        raise NotImplementedError
+
+    def _store(self, key: RequestKey, value: dict[str, Any], ttl: float) -> None:
+        raise NotImplementedError
+
+    def _drop(self, endpoint: str, match: Mapping[str, str] | None) -> int:
+        """Remove entries for ``endpoint`` whose params contain ``match`` (all entries if None); return the count."""
+        raise NotImplementedError
+
+
+class TTLCache(ResponseCache):
+    """In-memory, thread-safe response cache with per-entry expiry and LRU eviction.
+
+    Args:
+        maxsize: Maximum number of responses kept; the least recently used entry is evicted first.
+        ttls: Seconds to keep responses per endpoint.
+        invalidations: Mutating endpoint to the cached endpoints it invalidates.
+        clock: Monotonic time source.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttls: Mapping[str, float] = DEFAULT_TTLS,
+        invalidations: Mapping[str, tuple[tuple[str, str | None], ...]] = DEFAULT_INVALIDATIONS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(ttls=ttls, invalidations=invalidations)
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._clock = clock
+        self._entries: OrderedDict[RequestKey, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} size={len(self)} maxsize={self.maxsize}>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _load(self, key: RequestKey) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _store(self, key: RequestKey, value: dict[str, Any], ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def _drop(self, endpoint: str, match: Mapping[str, str] | None) -> int:
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if key[0] == endpoint and (match is None or match.items() <= dict(key[1]).items())
+            ]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
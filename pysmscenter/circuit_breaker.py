@@ -0,0 +1,186 @@
+import enum
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Mapping
+
+from pysmscenter.exceptions import CircuitOpenError
+
+
+class CircuitState(enum.StrEnum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+type StateListener = Callable[["CircuitBreaker", CircuitState, CircuitState], None]
+
+
+class CircuitBreaker:
+    """Fail fast while the provider is unhealthy instead of waiting out timeouts and retries.
+
+    The breaker opens once ``failure_threshold`` failures (connection errors, timeouts, 5xx) happen
+    within ``window`` seconds; while open every call raises :class:`CircuitOpenError` immediately.
+    After ``reset_timeout`` seconds it lets up to ``half_open_max_calls`` probe calls through: if they
+    all succeed it closes again, a single failing probe opens it for another ``reset_timeout``.
+
+    Args:
+        name: Label passed to listeners and used in error messages.
+        failure_threshold: Failures within ``window`` that open the circuit.
+        window: Seconds over which failures are counted.
+        reset_timeout: Seconds the circuit stays open before probing.
+        half_open_max_calls: Probe calls allowed, and successes required to close, while half-open.
+        on_state_change: Listener called as ``listener(breaker, old_state, new_state)`` on every transition.
+        clock: Monotonic time source.
+    """
+
+    def __init__(
+        self,
+        name: str = "default",
+        failure_threshold: int = 5,
+        window: float = 30.0,
+        reset_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        on_state_change: StateListener | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+        if half_open_max_calls < 1:
+            raise ValueError("half_open_max_calls must be at least 1")
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.window = window
+        self.reset_timeout = reset_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._listeners: list[StateListener] = [on_state_change] if on_state_change is not None else []
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CircuitState.CLOSED
+        self._failures: deque[float] = deque()
+        self._opened_at = 0.0
+        self._probes = 0
+        self._probe_successes = 0
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} name={self.name!r} state={self.state.value!r}>"
+
+    @property
+    def state(self) -> CircuitState:
+        with self._lock:
+            transition = self._advance(self._clock())
+            state = self._state
+        self._notify(transition)
+        return state
+
+    def add_listener(self, listener: StateListener) -> None:
+        self._listeners.append(listener)
+
+    def breaker(self, endpoint: str) -> "CircuitBreaker":
+        """Return the breaker guarding ``endpoint``; a single breaker guards every endpoint."""
+        return self
+
+    def acquire(self) -> None:
+        """Admit a call, or raise :class:`CircuitOpenError` if the circuit does not allow it.
+
+        Every admitted call must be followed by :meth:`record_success` or :meth:`record_failure`.
+        """
+        retry_after = None
+        with self._lock:
+            now = self._clock()
+            transition = self._advance(now)
+            if self._state is CircuitState.HALF_OPEN and self._probes < self.half_open_max_calls:
+                self._probes += 1
+            elif self._state is not CircuitState.CLOSED:
+                # Half-open with every probe slot taken counts as open until the probes report back.
+                retry_after = max(0.0, self._opened_at + self.reset_timeout - now)
+        self._notify(transition)
+        if retry_after is not None:
+            raise CircuitOpenError(f"Circuit {self.name!r} is open", retry_after=retry_after)
+
+    def record_success(self) -> None:
+        with self._lock:
+            transition = None
+            if self._state is CircuitState.HALF_OPEN:
+                self._probe_successes += 1
+                if self._probe_successes >= self.half_open_max_calls:
+                    transition = self._transition(CircuitState.CLOSED)
+        self._notify(transition)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            now = self._clock()
+            transition = None
+            if self._state is CircuitState.HALF_OPEN:
+                transition = self._open(now)
+            elif self._state is CircuitState.CLOSED:
+                self._failures.append(now)
+                while self._failures and self._failures[0] <= now - self.window:
+                    self._failures.popleft()
+                if len(self._failures) >= self.failure_threshold:
+                    transition = self._open(now)
+        self._notify(transition)
+
+    def reset(self) -> None:
+        """Force the circuit closed and forget past failures."""
+        with self._lock:
+            transition = self._transition(CircuitState.CLOSED)
+        if transition[0] is not CircuitState.CLOSED:
+            self._notify(transition)
+
+    def _advance(self, now: float) -> tuple[CircuitState, CircuitState] | None:
+        if self._state is CircuitState.OPEN and now - self._opened_at >= self.reset_timeout:
+            return self._transition(CircuitState.HALF_OPEN)
+        return None
+
+    def _open(self, now: float) -> tuple[CircuitState, CircuitState]:
+        self._opened_at = now
+        return self._transition(CircuitState.OPEN)
+
+    def _transition(self, state: CircuitState) -> tuple[CircuitState, CircuitState]:
+        old_state, self._state = self._state, state
+        self._failures.clear()
+        self._probes = 0
+        self._probe_successes = 0
+        return old_state, state
+
+    def _notify(self, transition: tuple[CircuitState, CircuitState] | None) -> None:
+        # Listeners run outside the lock so they may inspect the breaker or shed load synchronously.
+        if transition is not None:
+            for listener in self._listeners:
+                listener(self, *transition)
+
+
+class CircuitBreakers:
+    """Separate circuit breakers per group of endpoints, so one failing feature does not trip the others.
+
+    Example:
+        ``CircuitBreakers({"send": ["sms/send", "sms/bulk"], "lookup": ["hlr/lookup", "mobile/check"]})``
+
+    Args:
+        groups: Group name to the endpoints it covers. Endpoints in no group share a ``"default"`` breaker.
+        factory: Builds the breaker for a group name; use it to tune thresholds or attach listeners.
+    """
+
+    def __init__(
+        self,
+        groups: Mapping[str, Iterable[str]],
+        factory: Callable[[str], CircuitBreaker] = CircuitBreaker,
+    ) -> None:
+        self._breakers: dict[str, CircuitBreaker] = {name: factory(name) for name in (*groups, "default")}
+        self._endpoints: dict[str, CircuitBreaker] = {
+            endpoint: self._breakers[name] for name, endpoints in groups.items() for endpoint in endpoints
+        }
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} groups={sorted(self._breakers)!r}>"
+
+    def __getitem__(self, name: str) -> CircuitBreaker:
+        return self._breakers[name]
+
+    @property
+    def states(self) -> dict[str, CircuitState]:
+        return {name: breaker.state for name, breaker in self._breakers.items()}
+
+    def breaker(self, endpoint: str) -> CircuitBreaker:
+        return self._endpoints.get(endpoint, self._breakers["default"])
@@ -0,0 +1,98 @@
+import asyncio
+import threading
+from collections.abc import Awaitable, Callable, Hashable, Iterable, Mapping
+from typing import Any
+
+from pysmscenter.endpoints import READ_ONLY_ENDPOINTS, RequestKey, request_key
+
+
+class _Call:
+    __slots__ = ("done", "error", "result")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+
+class SingleFlight:
+    """Collapse concurrent identical read calls into a single HTTP request.
+
+    The first caller for a given endpoint and parameter set performs the request; callers that arrive
+    while it is in flight wait for it and receive the same response object (or exception). Responses
+    are shared between waiters and should be treated as read-only.
+
+    Only endpoints in ``endpoints`` are eligible, so calls with side effects such as ``sms/send`` or
+    ``contact/add`` are never merged.
+
+    Args:
+        endpoints: Allowlist of endpoints that may be coalesced. Defaults to the read-only endpoints.
+    """
+
+    def __init__(self, endpoints: Iterable[str] = READ_ONLY_ENDPOINTS) -> None:
+        self.endpoints = frozenset(endpoints)
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self._async_calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} in_flight={len(self._calls) + len(self._async_calls)}>"
+
+    def key(self, method: str, endpoint: str, params: Mapping[str, Any] | None = None) -> RequestKey | None:
+        """Return the coalescing key for a call, or None if the call must not be shared."""
+        if method.upper() != "GET" or endpoint not in self.endpoints:
+            return None
+        return request_key(endpoint, params)
+
+    def do[T](self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run ``fn`` unless an identical call is already in flight, in which case wait for its result."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+    async def do_async[T](self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Async counterpart of :meth:`do` for calls made on a single event loop."""
+        future = self._async_calls.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        future = asyncio.get_running_loop().create_future()
+        self._async_calls[key] = future
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            # Mark the exception as retrieved so an unobserved follower-less failure is not logged.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._async_calls[key]
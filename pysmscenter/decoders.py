@@ -0,0 +1,58 @@
+import importlib
+import json
+from collections.abc import Callable
+from typing import Any
+
+type JSONDecoder = Callable[[bytes], Any]
+
+# Tried in order when the decoder is "auto"; the first importable backend wins.
+AUTO_BACKENDS: tuple[str, ...] = ("orjson", "msgspec", "json")
+
+
+def stdlib_loads(data: bytes) -> Any:
+    """Parse a JSON document with the standard library, straight from bytes."""
+    return json.loads(data)
+
+
+def _orjson_decoder() -> JSONDecoder:
+    orjson = importlib.import_module("orjson")
+    return orjson.loads
+
+
+def _msgspec_decoder() -> JSONDecoder:
+    msgspec_json = importlib.import_module("msgspec.json")
+    return msgspec_json.Decoder().decode
+
+
+_BACKENDS: dict[str, Callable[[], JSONDecoder]] = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": lambda: stdlib_loads,
+}
+
+
+def get_decoder(decoder: JSONDecoder | str = "auto") -> JSONDecoder:
+    """Resolve a JSON decoder that parses response bodies from bytes.
+
+    Args:
+        decoder: A callable taking ``bytes``, a backend name (``"orjson"``, ``"msgspec"``, ``"json"``)
+            or ``"auto"`` to pick the fastest installed backend.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+        ImportError: If an explicitly requested backend is not installed.
+
+    Returns:
+        JSONDecoder: Callable turning a response body into Python objects.
+    """
+    if callable(decoder):
+        return decoder
+    if decoder == "auto":
+        for name in AUTO_BACKENDS:
+            try:
+                return _BACKENDS[name]()
+            except ImportError:
+                continue
+    if decoder not in _BACKENDS:
+        raise ValueError(f"Unknown JSON decoder: {decoder!r}. Expected one of {sorted(_BACKENDS)} or 'auto'")
+    return _BACKENDS[decoder]()
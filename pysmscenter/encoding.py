@@ -0,0 +1,271 @@
+import enum
+import functools
+import itertools
+import threading
+import unicodedata
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+from typing import Any
+
+from pysmscenter.types import MobileRawData
+
+# GSM 03.38 default alphabet (without the escape character) and its extension table, whose characters
+# take two septets each. Greek capitals are written as escapes to keep them apart from Latin look-alikes.
+GSM7_BASIC = (
+    "@£$¥èéùìòÇ\nØø\rÅå\u0394_\u03a6\u0393\u039b\u03a9\u03a0\u03a8\u03a3\u0398\u039eÆæßÉ"
+    " !\"#¤%&'()*+,-./0123456789:;<=>?¡ABCDEFGHIJKLMNOPQRSTUVWXYZÄÖÑÜ§¿abcdefghijklmnopqrstuvwxyzäöñüà"
+)
+GSM7_EXTENSION = "\f^{}\\[~]|€"
+
+GSM7_SINGLE_SEGMENT = 160
+GSM7_MULTI_SEGMENT = 153
+UCS2_SINGLE_SEGMENT = 70
+UCS2_MULTI_SEGMENT = 67
+
+# str.translate tables: deleting every character of a table leaves only the characters outside it.
+_DROP_BASIC = dict.fromkeys(map(ord, GSM7_BASIC))
+_DROP_EXTENSION = dict.fromkeys(map(ord, GSM7_EXTENSION))
+
+
+class Encoding(enum.StrEnum):
+    GSM7 = "GSM-7"
+    UCS2 = "UCS-2"
+
+
+@dataclass(frozen=True, slots=True)
+class SegmentInfo:
+    """How a text is encoded and split into SMS segments.
+
+    ``length`` counts septets for GSM-7 (extension characters count twice) and UTF-16 code units
+    for UCS-2. ``remaining`` is how many more of those fit before another segment is needed.
+    """
+
+    encoding: Encoding
+    length: int
+    segments: int
+    remaining: int
+
+    @property
+    def ucs(self) -> bool:
+        return self.encoding is Encoding.UCS2
+
+
+@functools.lru_cache(maxsize=4096)
+def analyze(text: str) -> SegmentInfo:
+    """Work out the encoding, segment count and characters left for ``text``, without any request.
+
+    Results are cached, so analysing the same rendered message many times is cheap.
+    """
+    extended = text.translate(_DROP_BASIC)
+    if not extended.translate(_DROP_EXTENSION):
+        length = len(text) + len(extended)
+        return _segment(Encoding.GSM7, length, bool(extended), GSM7_SINGLE_SEGMENT, GSM7_MULTI_SEGMENT, text)
+    length = len(text.encode("utf-16-le")) // 2
+    return _segment(Encoding.UCS2, length, length != len(text), UCS2_SINGLE_SEGMENT, UCS2_MULTI_SEGMENT, text)
+
+
+def requires_ucs(text: str) -> bool:
+    """Return True if ``text`` cannot be sent in the GSM-7 alphabet."""
+    return analyze(text).ucs
+
+
+def _segment(encoding: Encoding, length: int, wide: bool, single: int, multi: int, text: str) -> SegmentInfo:
+    if length <= single:
+        return SegmentInfo(encoding, length, 1, single - length)
+    if not wide:
+        segments = -(-length // multi)
+        return SegmentInfo(encoding, length, segments, segments * multi - length)
+    # A two-unit character (GSM escape sequence, UTF-16 surrogate pair) is never split across segments,
+    # so the segments have to be packed one character at a time.
+    segments, used = 1, 0
+    for char in text:
+        width = _width(encoding, char)
+        if used + width > multi:
+            segments, used = segments + 1, 0
+        used += width
+    return SegmentInfo(encoding, length, segments, multi - used)
+
+
+def _width(encoding: Encoding, char: str) -> int:
+    if encoding is Encoding.GSM7:
+        return 2 if char in GSM7_EXTENSION else 1
+    return 2 if ord(char) > 0xFFFF else 1
+
+
+# Greek capitals that look like, and are read as, Latin ones; the rest (Γ Δ Θ Λ Ξ Π Σ Φ Ψ Ω) are in GSM-7.
+_GREEK_LATIN = dict(zip("ΑΒΕΖΗΙΚΜΝΟΡΤΥΧ", "ABEZHIKMNOPTYX", strict=True))  # noqa: RUF001
+_PUNCTUATION = {
+    "\u00a0": " ",
+    "\u0387": ";",
+    "\u2018": "'",
+    "\u2019": "'",
+    "\u201a": "'",
+    "\u201c": '"',
+    "\u201d": '"',
+    "\u201e": '"',
+    "\u00ab": '"',
+    "\u00bb": '"',
+    "\u2013": "-",
+    "\u2014": "-",
+    "\u2026": "...",
+}
+
+
+def _build_transliteration() -> dict[int, str]:
+    """Map every Greek letter (monotonic and polytonic) to an unaccented GSM-7 capital."""
+    table: dict[int, str] = {}
+    for codepoint in itertools.chain(range(0x0370, 0x0400), range(0x1F00, 0x2000)):
+        char = chr(codepoint)
+        if not unicodedata.name(char, "").startswith("GREEK"):
+            continue
+        base = unicodedata.normalize("NFD", char)[0].upper()
+        mapped = _GREEK_LATIN.get(base, base)
+        if mapped != char and len(mapped) == 1 and mapped in GSM7_BASIC:
+            table[codepoint] = mapped
+    table.update({ord(char): replacement for char, replacement in _PUNCTUATION.items()})
+    return table
+
+
+_TRANSLITERATION = _build_transliteration()
+
+
+def transliterate(text: str) -> str:
+    """Uppercase and de-accent Greek, and replace typographic punctuation, so ``text`` fits GSM-7 where it can."""
+    return text.translate(_TRANSLITERATION)
+
+
+@dataclass(slots=True)
+class TransliterationStats:
+    messages: int = 0
+    rewritten: int = 0
+    segments_before: int = 0
+    segments_after: int = 0
+
+    @property
+    def segments_saved(self) -> int:
+        return self.segments_before - self.segments_after
+
+
+class Transliterator:
+    """Rewrite Greek messages into GSM-7 before they are sent, roughly halving their segment count.
+
+    A lowercase or accented Greek letter forces the whole message into UCS-2 (70 characters per
+    segment instead of 160). The rewrite uppercases and de-accents Greek and uses Latin look-alikes
+    for the capitals GSM-7 lacks, so ``"Καλημέρα"`` goes out as ``"KAΛHMEPA"``.
+
+    Args:
+        only_if_shorter: Keep the original text unless the rewrite needs fewer segments, e.g. when
+            an emoji keeps the message in UCS-2 anyway.
+    """
+
+    def __init__(self, *, only_if_shorter: bool = True) -> None:
+        self.only_if_shorter = only_if_shorter
+        self.stats = TransliterationStats()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} segments_saved={self.stats.segments_saved}>"
+
+    def __call__(self, text: str) -> str:
+        before = analyze(text)
+        rewritten = transliterate(text)
+        after = analyze(rewritten)
+        if rewritten == text or (self.only_if_shorter and after.segments >= before.segments):
+            rewritten, after = text, before
+        with self._lock:
+            self.stats.messages += 1
+            self.stats.rewritten += rewritten is not text
+            self.stats.segments_before += before.segments
+            self.stats.segments_after += after.segments
+        return rewritten
+
+
+@dataclass(slots=True)
+class CostEstimate:
+    """Estimated outcome of sending a campaign, before any request is made."""
+
+    messages: int = 0
+    segments: int = 0
+    cost: Decimal = field(default_factory=Decimal)
+    unpriced: list[str] = field(default_factory=list[str])
+
+    @property
+    def complete(self) -> bool:
+        """Whether every recipient had a known price."""
+        return not self.unpriced
+
+
+class CostTable:
+    """Per-prefix SMS prices learned from ``mobile/check`` responses.
+
+    Prices are looked up by the longest known prefix of a recipient's digits, so a price learned for a
+    country code covers every number in it and a more specific prefix can override it.
+
+    Args:
+        prices: Initial prefix to price per segment.
+        default: Price used for recipients matching no prefix; ``None`` leaves them unpriced.
+    """
+
+    def __init__(
+        self, prices: Mapping[str, Decimal | int | str] | None = None, default: Decimal | None = None
+    ) -> None:
+        self.default = default
+        self._prices: dict[str, Decimal] = {}
+        self._max_prefix = 0
+        for prefix, price in (prices or {}).items():
+            self.set(prefix, Decimal(str(price)))
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} prefixes={len(self._prices)}>"
+
+    def __len__(self) -> int:
+        return len(self._prices)
+
+    def set(self, prefix: str, price: Decimal) -> None:
+        digits = "".join(char for char in prefix if char.isdigit())
+        if not digits:
+            raise ValueError(f"Invalid prefix: {prefix!r}")
+        self._prices[digits] = price
+        self._max_prefix = max(self._max_prefix, len(digits))
+
+    def learn(self, response: MobileRawData | Mapping[str, Any], prefix: str | None = None) -> None:
+        """Record the price reported by a ``mobile/check`` response.
+
+        Args:
+            response: Response of :meth:`MobileManager.check`.
+            prefix: Prefix the price applies to. Defaults to the number's country code.
+        """
+        mobile = response.get("mobile") or {}
+        if (prefix := prefix or str(mobile.get("countryCode") or "")) and mobile.get("cost") is not None:
+            try:
+                self.set(prefix, Decimal(str(mobile["cost"])))
+            except InvalidOperation:
+                return
+
+    def price(self, recipient: str) -> Decimal | None:
+        """Price of one segment to ``recipient``, or ``default`` if no prefix matches."""
+        digits = "".join(char for char in recipient if char.isdigit())
+        for length in range(min(len(digits), self._max_prefix), 0, -1):
+            price = self._prices.get(digits[:length])
+            if price is not None:
+                return price
+        return self.default
+
+    def estimate(self, recipients: Iterable[str], text: str) -> CostEstimate:
+        """Estimate the cost of sending ``text`` to every recipient."""
+        return self.estimate_messages((recipient, text) for recipient in recipients)
+
+    def estimate_messages(self, messages: Iterable[tuple[str, str]]) -> CostEstimate:
+        """Estimate the cost of ``(recipient, text)`` pairs, e.g. the rendered messages of a mail merge."""
+        estimate = CostEstimate()
+        for recipient, text in messages:
+            segments = analyze(text).segments
+            estimate.messages += 1
+            estimate.segments += segments
+            price = self.price(recipient)
+            if price is None:
+                estimate.unpriced.append(recipient)
+            else:
+                estimate.cost += price * segments
+        return estimate
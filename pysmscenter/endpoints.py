@@ -0,0 +1,57 @@
+"""Classification of API endpoints by their side effects.
+
+Every endpoint is called with ``GET``, so the HTTP method says nothing about whether a call is safe
+to repeat. Layers that replay or share responses (coalescing, caching, retries) consult these sets instead.
+"""
+
+from collections.abc import Mapping
+from typing import Any
+
+# ``status/get`` is left out on purpose: reading it drains the provider's pending report queue.
+READ_ONLY_ENDPOINTS: frozenset[str] = frozenset(
+    {
+        "me/balance",
+        "contact/list",
+        "contact/get",
+        "group/list",
+        "group/get",
+        "purchase/list",
+        "user/list",
+        "user/comment/list",
+        "history/single/list",
+        "history/group/list",
+        "status/sms",
+        "mobile/check",
+        "hlr/lookup",
+    }
+)
+
+# Endpoints whose effect is repeated when the call is: a second ``sms/send`` delivers and bills the
+# message twice, a second ``contact/add`` creates a duplicate contact. ``status/get`` is included
+# because a replayed read silently loses the reports the first call drained.
+NON_IDEMPOTENT_ENDPOINTS: frozenset[str] = frozenset(
+    {
+        "sms/send",
+        "sms/bulk",
+        "2fa/send",
+        "contact/add",
+        "group/add",
+        "user/add",
+        "user/topup",
+        "status/get",
+    }
+)
+
+# Read-only lookups on latency-sensitive paths; a duplicate request only costs load, so a slow call may be hedged.
+HEDGEABLE_ENDPOINTS: frozenset[str] = frozenset({"hlr/lookup", "mobile/check", "status/sms"})
+
+type RequestKey = tuple[str, tuple[tuple[str, str], ...]]
+
+
+def request_key(endpoint: str, params: Mapping[str, Any] | None = None) -> RequestKey:
+    """Build a hashable identity for a call from its endpoint and parameters.
+
+    The API key is left out; it is the same for every call made through one client.
+    """
+    items = tuple(sorted((name, str(value)) for name, value in (params or {}).items() if name != "key"))
+    return endpoint, items
@@ -1,5 +1,8 @@
 import typing
 
+if typing.TYPE_CHECKING:
+    from pysmscenter.priority import Priority
+
 
 class SMSClientError(Exception):
     def __init__(
@@ -49,3 +52,15 @@ class UserExceptionError(SMSClientError):
 
 class UserCommentExceptionError(SMSClientError):
     pass
+
+
+class CircuitOpenError(SMSClientError):
+    def __init__(self, message: str | None = None, retry_after: float | None = None) -> None:
+        self.retry_after = retry_after
+        super().__init__(message)
+
+
+class LoadShedError(SMSClientError):
+    def __init__(self, message: str | None = None, priority: "Priority | None" = None) -> None:
+        self.priority = priority
+        super().__init__(message)
@@ -0,0 +1,115 @@
+import threading
+from collections import deque
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from pysmscenter.endpoints import HEDGEABLE_ENDPOINTS
+
+
+@dataclass(slots=True)
+class HedgeStats:
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+
+    @property
+    def hedge_ratio(self) -> float:
+        return self.hedges / self.requests if self.requests else 0.0
+
+
+class HedgePolicy:
+    """Decide when a slow read-only call gets a backup request, and cap how often that happens.
+
+    A call that has not answered after :meth:`hedge_delay` seconds is sent a second time; whichever
+    response arrives first is used. The delay is ``delay`` when given, otherwise the ``quantile`` of
+    the latencies recently observed for the endpoint (``initial_delay`` until ``min_samples`` calls
+    have been seen), so only the slow tail is hedged.
+
+    Hedges draw from a budget that grows by ``max_hedge_ratio`` per call and holds at most ``burst``,
+    so over time no more than that fraction of calls is doubled, however slow the provider gets.
+
+    Note that ``hlr/lookup`` is billed per request: a hedged lookup may be charged twice.
+
+    Args:
+        delay: Fixed seconds to wait before hedging. ``None`` derives it from observed latencies.
+        endpoints: Endpoints eligible for hedging; they must be safe to send twice.
+        quantile: Latency quantile used as the adaptive delay.
+        initial_delay: Delay used until enough latencies have been observed.
+        min_samples: Observations needed before the adaptive delay is used.
+        sample_size: Latest observations kept per endpoint.
+        max_hedge_ratio: Long-run upper bound on hedged calls per call.
+        burst: Hedges that may be sent back to back when the budget is full.
+        max_workers: Threads the sync client uses to run hedged calls.
+    """
+
+    def __init__(
+        self,
+        delay: float | None = None,
+        *,
+        endpoints: Iterable[str] = HEDGEABLE_ENDPOINTS,
+        quantile: float = 0.95,
+        initial_delay: float = 1.0,
+        min_samples: int = 20,
+        sample_size: int = 256,
+        max_hedge_ratio: float = 0.1,
+        burst: float = 10.0,
+        max_workers: int = 16,
+    ) -> None:
+        if not 0 < quantile <= 1:
+            raise ValueError("quantile must be in (0, 1]")
+        if not 0 <= max_hedge_ratio <= 1:
+            raise ValueError("max_hedge_ratio must be in [0, 1]")
+        self.delay = delay
+        self.endpoints = frozenset(endpoints)
+        self.quantile = quantile
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.sample_size = sample_size
+        self.max_hedge_ratio = max_hedge_ratio
+        self.burst = burst
+        self.max_workers = max_workers
+        self.stats = HedgeStats()
+        self._latencies: dict[str, deque[float]] = {}
+        self._budget = burst
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} endpoints={sorted(self.endpoints)!r} ratio={self.max_hedge_ratio}>"
+
+    def applies(self, endpoint: str) -> bool:
+        return endpoint in self.endpoints
+
+    def hedge_delay(self, endpoint: str) -> float:
+        """Seconds to wait for the first response before sending a hedge."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            samples = sorted(self._latencies.get(endpoint, ()))
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+        return samples[min(len(samples) - 1, int(self.quantile * len(samples)))]
+
+    def admit(self) -> None:
+        """Count a hedgeable call, adding its share to the hedge budget."""
+        with self._lock:
+            self.stats.requests += 1
+            self._budget = min(self.burst, self._budget + self.max_hedge_ratio)
+
+    def try_hedge(self) -> bool:
+        """Take one hedge from the budget; return False if the cap has been reached."""
+        with self._lock:
+            if self._budget < 1:
+                return False
+            self._budget -= 1
+            self.stats.hedges += 1
+            return True
+
+    def observe(self, endpoint: str, latency: float, *, hedge_won: bool = False) -> None:
+        """Record the latency of a completed call."""
+        with self._lock:
+            samples = self._latencies.get(endpoint)
+            if samples is None:
+                samples = self._latencies[endpoint] = deque(maxlen=self.sample_size)
+            samples.append(latency)
+            if hedge_won:
+                self.stats.hedge_wins += 1
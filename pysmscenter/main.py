@@ -1,12 +1,24 @@
+import contextlib
+import threading
+import time
 import types
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from typing import Any, ClassVar, Self, cast
 from urllib.parse import urljoin
 
-from requests import Session
+from requests import HTTPError, RequestException, Session, Timeout as RequestTimeout
 from requests.adapters import HTTPAdapter
+from requests.exceptions import ConnectionError as RequestConnectionError
 from urllib3.util.retry import Retry
 
+from pysmscenter.cache import ResponseCache
+from pysmscenter.circuit_breaker import CircuitBreaker, CircuitBreakers
+from pysmscenter.coalesce import SingleFlight
+from pysmscenter.decoders import JSONDecoder, get_decoder
+from pysmscenter.encoding import Transliterator
+from pysmscenter.endpoints import NON_IDEMPOTENT_ENDPOINTS
+from pysmscenter.hedging import HedgePolicy
 from pysmscenter.managers.balance_manager import BalanceManager
 from pysmscenter.managers.contact_manager import ContactManager
 from pysmscenter.managers.group_manager import GroupManager
@@ -19,6 +31,11 @@ from pysmscenter.managers.sms_manager import SmsManager
 from pysmscenter.managers.status_manager import StatusManager
 from pysmscenter.managers.two_factor_manager import TwoFactorManager
 from pysmscenter.managers.user_manager import UserManager
+from pysmscenter.parallel import ParallelExecutor
+from pysmscenter.priority import PriorityScheduler
+from pysmscenter.rate_limit import RateLimiter, parse_retry_after
+from pysmscenter.reconcile import DEFAULT_RECONCILERS, HistoryReconciler
+from pysmscenter.streaming import iter_json_items
 from pysmscenter.types.key_types import KeyRawResponse
 
 from .exceptions import CredentialError
@@ -26,28 +43,111 @@ from .exceptions import CredentialError
 type Timeout = tuple[float, float]
 
 
-class BaseHTTPClient:
+class BaseClient:
     BASE_URL: str = "https://smscenter.gr/api/"
     DEFAULT_TYPE: str = "json"
     DEFAULT_TIMEOUT: ClassVar[Timeout] = (5.0, 30.0)
+    RETRY_STATUSES: ClassVar[tuple[int, ...]] = (429, 500, 502, 503, 504)
+    # A throttled call was rejected before it was processed, so even a send can safely be repeated.
+    UNSAFE_RETRY_STATUSES: ClassVar[tuple[int, ...]] = (429,)
+    STREAM_CHUNK_SIZE: ClassVar[int] = 64 * 1024
 
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} base_url={self.BASE_URL!r}>"
+
+    def _build_params(self, params: Mapping[str, Any] | None = None) -> dict[str, Any]:
+        params_dict = dict(params) if params is not None else {}
+        params_dict.setdefault("type", self.DEFAULT_TYPE)
+        return params_dict
+
+    def _retry_statuses(self, endpoint: str) -> tuple[int, ...]:
+        """Statuses a call to ``endpoint`` may be retried on without risking a repeated side effect."""
+        return self.UNSAFE_RETRY_STATUSES if endpoint in NON_IDEMPOTENT_ENDPOINTS else self.RETRY_STATUSES
+
+
+class APIKeyClient(BaseClient):
+    """Credential handling and call bookkeeping shared by the sync and async API key clients."""
+
+    api_key: str
+    rate_limiter: RateLimiter | None
+    circuit_breaker: CircuitBreaker | CircuitBreakers | None
+    transliterator: Transliterator | None
+    scheduler: PriorityScheduler | None
+
+    def _set_api_key(self, api_key: str) -> None:
+        self.api_key = api_key
+        if not api_key:
+            raise CredentialError("API key is required")
+
+    def _build_params(self, params: Mapping[str, Any] | None = None) -> dict[str, Any]:
+        params_dict = super()._build_params(params)
+        params_dict.update({"key": self.api_key})
+        return params_dict
+
+    @staticmethod
+    def _build_single_flight(coalesce: SingleFlight | bool) -> SingleFlight | None:
+        if isinstance(coalesce, SingleFlight):
+            return coalesce
+        return SingleFlight() if coalesce else None
+
+    @staticmethod
+    def _build_transliterator(transliterate: Transliterator | bool) -> Transliterator | None:
+        if isinstance(transliterate, Transliterator):
+            return transliterate
+        return Transliterator() if transliterate else None
+
+    @staticmethod
+    def _build_reconcilers(reconcile: Mapping[str, HistoryReconciler] | bool) -> dict[str, HistoryReconciler]:
+        if isinstance(reconcile, Mapping):
+            return dict(reconcile)
+        return dict(DEFAULT_RECONCILERS) if reconcile else {}
+
+    def _acquire_circuit(self, endpoint: str) -> CircuitBreaker | None:
+        """Fail fast with :class:`CircuitOpenError` if the circuit guarding ``endpoint`` is open."""
+        if self.circuit_breaker is None:
+            return None
+        breaker = self.circuit_breaker.breaker(endpoint)
+        breaker.acquire()
+        return breaker
+
+    def _record_success(self, endpoint: str, breaker: CircuitBreaker | None) -> None:
+        if self.rate_limiter is not None:
+            self.rate_limiter.succeeded(endpoint)
+        if breaker is not None:
+            breaker.record_success()
+
+    @staticmethod
+    def _raise_for_credential_error(response_json: Mapping[str, Any]) -> None:
+        if str(response_json.get("status")) == "0" and str(response_json.get("error")) == "101":
+            raise CredentialError(
+                response_json.get("remarks"),
+                code=str(response_json.get("error")),
+                response=dict(response_json),
+            )
+
+
+class BaseHTTPClient(BaseClient):
     def __init__(
-        self, max_retries: int = 0, timeout: Timeout | None = DEFAULT_TIMEOUT, backoff_factor: float = 0.5
+        self,
+        max_retries: int = 0,
+        timeout: Timeout | None = BaseClient.DEFAULT_TIMEOUT,
+        backoff_factor: float = 0.5,
+        decoder: JSONDecoder | str = "auto",
     ) -> None:
         self.max_retries = max_retries
         self.timeout = timeout
         self.backoff_factor = backoff_factor
+        self.decoder = get_decoder(decoder)
         self._session: Session = self._build_session()
+        self._local = threading.local()
         self._closed: bool = False
 
-    def __repr__(self) -> str:
-        return f"<{self.__class__.__name__} base_url={self.BASE_URL!r}>"
-
     @property
     def session(self) -> Session:
         if self._closed:
             raise RuntimeError("Session is closed")
-        return self._session
+        thread_session: Session | None = getattr(self._local, "session", None)
+        return thread_session if thread_session is not None else self._session
 
     def close(self) -> None:
         if not self._closed:
@@ -71,22 +171,55 @@ class BaseHTTPClient:
     def _build_session(self) -> Session:
         session = Session()
 
-        retry_strategy = Retry(
+        adapter = HTTPAdapter(max_retries=self._build_retry(idempotent=True))
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        # Requests picks the adapter with the longest matching prefix, so these take over for unsafe endpoints.
+        unsafe_adapter = HTTPAdapter(max_retries=self._build_retry(idempotent=False))
+        for endpoint in sorted(NON_IDEMPOTENT_ENDPOINTS):
+            session.mount(urljoin(self.BASE_URL, endpoint), unsafe_adapter)
+        return session
+
+    def _build_retry(self, *, idempotent: bool) -> Retry:
+        if idempotent:
+            return Retry(
+                total=self.max_retries,
+                backoff_factor=self.backoff_factor,
+                status_forcelist=list(self.RETRY_STATUSES),
+                allowed_methods=None,
+                raise_on_status=False,
+            )
+        # Only retry failures that prove the request was never processed: the connection could not be
+        # opened, or the provider throttled it. Read errors and 5xx may follow an accepted send.
+        return Retry(
             total=self.max_retries,
+            read=0,
+            other=0,
             backoff_factor=self.backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
+            status_forcelist=list(self.UNSAFE_RETRY_STATUSES),
             allowed_methods=None,
             raise_on_status=False,
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("http://", adapter)
-        session.mount("https://", adapter)
+
+    def _bind_thread_session(self) -> Session:
+        """Give the calling thread its own session, used instead of the shared one from then on."""
+        session = self._build_session()
+        self._local.session = session
         return session
 
-    def _build_params(self, params: Mapping[str, Any] | None = None) -> dict[str, Any]:
-        params_dict = dict(params) if params is not None else {}
-        params_dict.setdefault("type", self.DEFAULT_TYPE)
-        return params_dict
+    def parallel(self, max_workers: int = 10) -> ParallelExecutor:
+        """
+        Run calls concurrently on a thread pool with one HTTP session per worker thread.
+
+        Example:
+            ``client.parallel(max_workers=20).map(client.sms.send, jobs)``
+
+        Args:
+            max_workers (int, optional): Number of worker threads. Defaults to 10.
+        Returns:
+            ParallelExecutor: Executor bound to this client.
+        """
+        return ParallelExecutor(self, max_workers=max_workers)
 
     def _request(self, method: str, endpoint: str, params: Mapping[str, Any] | None = None) -> dict[str, Any]:
         url = urljoin(self.BASE_URL, endpoint)
@@ -94,7 +227,23 @@ class BaseHTTPClient:
         method = method.upper()
         response = self.session.request(method, url, params=request_params, timeout=self.timeout)
         response.raise_for_status()
-        return response.json()
+        # Parse the raw body directly instead of ``response.json()``, which decodes to text first.
+        return self.decoder(response.content)
+
+    def _stream(
+        self,
+        method: str,
+        endpoint: str,
+        path: Sequence[str],
+        params: Mapping[str, Any] | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> Iterator[Any]:
+        url = urljoin(self.BASE_URL, endpoint)
+        request_params = self._build_params(params)
+        method = method.upper()
+        with self.session.request(method, url, params=request_params, timeout=self.timeout, stream=True) as response:
+            response.raise_for_status()
+            yield from iter_json_items(response.iter_content(chunk_size=self.STREAM_CHUNK_SIZE), path, meta)
 
 
 class SMSAuthClient(BaseHTTPClient):
@@ -123,7 +272,7 @@ class SMSAuthClient(BaseHTTPClient):
         return cast(KeyRawResponse, response)
 
 
-class SMSClient(BaseHTTPClient):
+class SMSClient(APIKeyClient, BaseHTTPClient):
     mobile: "MobileManager"
     sms: "SmsManager"
     balance: "BalanceManager"
@@ -151,12 +300,33 @@ class SMSClient(BaseHTTPClient):
     ]
 
     def __init__(
-        self, api_key: str, max_retries: int = 0, timeout: Timeout | None = BaseHTTPClient.DEFAULT_TIMEOUT
+        self,
+        api_key: str,
+        max_retries: int = 0,
+        timeout: Timeout | None = BaseHTTPClient.DEFAULT_TIMEOUT,
+        *,
+        rate_limiter: RateLimiter | None = None,
+        coalesce: SingleFlight | bool = False,
+        cache: ResponseCache | None = None,
+        decoder: JSONDecoder | str = "auto",
+        reconcile: Mapping[str, HistoryReconciler] | bool = False,
+        circuit_breaker: CircuitBreaker | CircuitBreakers | None = None,
+        hedging: HedgePolicy | None = None,
+        transliterate: Transliterator | bool = False,
+        scheduler: PriorityScheduler | None = None,
     ) -> None:
-        super().__init__(max_retries=max_retries, timeout=timeout)
-        self.api_key = api_key
-        if not api_key:
-            raise CredentialError("API key is required")
+        super().__init__(max_retries=max_retries, timeout=timeout, decoder=decoder)
+        self._set_api_key(api_key)
+        self.rate_limiter = rate_limiter
+        self.circuit_breaker = circuit_breaker
+        self.hedging = hedging
+        self._hedge_executor: ParallelExecutor | None = None
+        self._hedge_lock = threading.Lock()
+        self.single_flight = self._build_single_flight(coalesce)
+        self.cache = cache
+        self.reconcilers = self._build_reconcilers(reconcile)
+        self.transliterator = self._build_transliterator(transliterate)
+        self.scheduler = scheduler
 
         self._setup_managers()
 
@@ -214,26 +384,190 @@ class SMSClient(BaseHTTPClient):
         for manager in self.managers:
             setattr(self, manager.name, manager(self))
 
+    def close(self) -> None:
+        with self._hedge_lock:
+            executor, self._hedge_executor = self._hedge_executor, None
+        if executor is not None:
+            executor.shutdown(wait=False)
+        super().close()
+
     def fetch_data(
         self,
         method: str,
         endpoint: str,
         params: Mapping[str, Any] | None = None,
     ) -> dict[str, Any]:
-        response_json = self._request(method, endpoint, params=params)
+        if self.cache is not None:
+            cached = self.cache.get(method, endpoint, params)
+            if cached is not None:
+                return cached
+
+        key = self.single_flight.key(method, endpoint, params) if self.single_flight is not None else None
+        if self.single_flight is not None and key is not None:
+            response_json = self.single_flight.do(key, lambda: self._fetch(method, endpoint, params))
+        else:
+            response_json = self._fetch(method, endpoint, params)
+
+        if self.cache is not None:
+            self.cache.update(method, endpoint, params, response_json)
+        return response_json
+
+    def _fetch(
+        self,
+        method: str,
+        endpoint: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        breaker = self._acquire_circuit(endpoint)
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint)
+            with self._slot(endpoint):
+                if self.hedging is not None and self.hedging.applies(endpoint):
+                    response_json = self._request_hedged(self.hedging, method, endpoint, params=params)
+                else:
+                    response_json = self._request_reconciled(method, endpoint, params=params)
+        except BaseException as exc:
+            self._record_failure(endpoint, breaker, exc)
+            raise
+        self._record_success(endpoint, breaker)
         self._raise_for_credential_error(response_json)
         return response_json
 
-    def _build_params(self, params: Mapping[str, Any] | None = None) -> dict[str, Any]:
-        params_dict = super()._build_params(params)
-        params_dict.update({"key": self.api_key})
-        return params_dict
+    def _slot(self, endpoint: str) -> contextlib.AbstractContextManager[object]:
+        """Hold a connection slot in the lane of ``endpoint`` while the request runs."""
+        if self.scheduler is None:
+            return contextlib.nullcontext()
+        return self.scheduler.slot(endpoint)
+
+    def _record_failure(self, endpoint: str, breaker: CircuitBreaker | None, exc: BaseException) -> None:
+        response = exc.response if isinstance(exc, HTTPError) else None
+        if self.rate_limiter is not None and response is not None and response.status_code == 429:
+            self.rate_limiter.throttled(endpoint, parse_retry_after(response.headers.get("Retry-After")))
+        if breaker is not None:
+            # Only an unreachable or failing provider counts against the circuit; a 4xx is a healthy answer.
+            if isinstance(exc, (RequestConnectionError, RequestTimeout)) or (
+                response is not None and response.status_code >= 500
+            ):
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+    def _request_hedged(
+        self,
+        policy: HedgePolicy,
+        method: str,
+        endpoint: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a request and, if it is slow to answer, a second identical one; the first response wins.
+
+        Both attempts run on the hedge pool, whose threads own their sessions. A losing attempt that is
+        already in flight cannot be interrupted with ``requests``; its response is discarded.
+        """
+        policy.admit()
+        executor = self._hedge_pool(policy)
+        started = time.monotonic()
+        attempts = [executor.submit(self._request, method, endpoint, params=params)]
+        done, _ = wait(attempts, timeout=policy.hedge_delay(endpoint))
+        if not done and policy.try_hedge():
+            attempts.append(executor.submit(self._request, method, endpoint, params=params))
+
+        pending: set[Future[dict[str, Any]]] = set(attempts)
+        errors: list[BaseException] = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for attempt in done:
+                error = attempt.exception()
+                if error is None:
+                    for loser in pending:
+                        loser.cancel()
+                    policy.observe(endpoint, time.monotonic() - started, hedge_won=attempt is not attempts[0])
+                    return attempt.result()
+                errors.append(error)
+        raise errors[0]
+
+    def _hedge_pool(self, policy: HedgePolicy) -> ParallelExecutor:
+        with self._hedge_lock:
+            if self._hedge_executor is None:
+                self._hedge_executor = ParallelExecutor(self, max_workers=policy.max_workers).start()
+            return self._hedge_executor
+
+    def _request_reconciled(
+        self,
+        method: str,
+        endpoint: str,
+        params: Mapping[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a request, retrying an ambiguous failure of an unsafe call once reconciliation proves it was lost."""
+        reconciler = self.reconcilers.get(endpoint)
+        attempt = 0
+        while True:
+            started = time.time()
+            try:
+                return self._request(method, endpoint, params=params)
+            except (HTTPError, RequestConnectionError, RequestTimeout) as exc:
+                if reconciler is None or attempt >= self.max_retries or not self._is_ambiguous(exc):
+                    raise
+                attempt += 1
+                time.sleep(reconciler.delay)
+                if self._was_accepted(reconciler, params, started):
+                    raise
+
+    def _was_accepted(
+        self,
+        reconciler: HistoryReconciler,
+        params: Mapping[str, Any] | None,
+        since: float,
+    ) -> bool:
+        try:
+            history = self._request("GET", reconciler.endpoint)
+        except (RequestException, ValueError):
+            # Without the history nothing is proven, so the send must be assumed accepted.
+            return True
+        return reconciler.accepted(history, params or {}, since)
 
     @staticmethod
-    def _raise_for_credential_error(response_json: Mapping[str, Any]) -> None:
-        if str(response_json.get("status")) == "0" and str(response_json.get("error")) == "101":
-            raise CredentialError(
-                response_json.get("remarks"),
-                code=str(response_json.get("error")),
-                response=dict(response_json),
-            )
+    def _is_ambiguous(exc: RequestException) -> bool:
+        if isinstance(exc, HTTPError):
+            return exc.response is not None and exc.response.status_code >= 500
+        return True
+
+    def stream_data(
+        self,
+        method: str,
+        endpoint: str,
+        path: Sequence[str],
+        params: Mapping[str, Any] | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> Iterator[Any]:
+        """
+        Stream the items of a list response as they arrive instead of loading the whole body.
+
+        Bypasses the response cache and request coalescing, which both need the complete response.
+
+        Args:
+            method (str): HTTP method.
+            endpoint (str): API endpoint.
+            path (Sequence[str]): Keys leading to the list to stream, e.g. ``("contacts",)``.
+            params (Mapping[str, Any], optional): Query parameters.
+            meta (dict, optional): Filled with the rest of the response (``status``, ``error``, ...).
+        Raises:
+            CircuitOpenError: If the circuit guarding the endpoint is open.
+            LoadShedError: If the scheduler sheds the call.
+            CredentialError: If the API key is rejected, once the response has been consumed.
+        Returns:
+            Iterator[Any]: The list items, in response order.
+        """
+        meta = meta if meta is not None else {}
+        breaker = self._acquire_circuit(endpoint)
+        try:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(endpoint)
+            with self._slot(endpoint):
+                yield from self._stream(method, endpoint, path, params=params, meta=meta)
+        except BaseException as exc:
+            self._record_failure(endpoint, breaker, exc)
+            raise
+        self._record_success(endpoint, breaker)
+        self._raise_for_credential_error(meta)
@@ -1,8 +1,9 @@
+from collections.abc import Iterator
 from datetime import date
 from typing import Any, cast
 
 from pysmscenter.exceptions import ContactExceptionError
-from pysmscenter.types import BaseResponse, ContactData, ContactDetail, ContactListData, DateLike
+from pysmscenter.types import BaseResponse, ContactData, ContactDetail, ContactListData, Contacts, DateLike
 from pysmscenter.utils import parse_date, raise_for_errors
 
 from .manager import Manager
@@ -45,17 +46,7 @@ class ContactManager(Manager):
         Returns:
            ContactData: Response from the API.
         """
-        params = {
-            "mobile": mobile,
-            "name": name,
-            "surname": surname,
-            "full_name": full_name,
-            "vname": vname,
-            "vusername": vusername,
-            "birthday": self._date_to_api(birthday),
-            "nameday": self._date_to_api(nameday),
-            **kwargs,
-        }
+        params = self._add_params(mobile, name, surname, full_name, vname, vusername, birthday, nameday, **kwargs)
 
         response = self.call("GET", "contact/add", params)
 
@@ -75,6 +66,21 @@ class ContactManager(Manager):
         response = self.call("GET", "contact/list")
         return cast(ContactListData, response)
 
+    def iter(self) -> Iterator[Contacts]:
+        """Iterate over all contacts, parsing them as they are received.
+
+        Unlike :meth:`list`, the response is never held in memory as a whole.
+
+        Raises:
+            ContactExceptionError: If the API response indicates an error, once the response has been consumed.
+
+        Returns:
+            Iterator[Contacts]: Contacts, in response order.
+        """
+        meta: dict[str, Any] = {}
+        yield from self.stream("GET", "contact/list", ("contacts",), meta=meta)
+        raise_for_errors(meta, ContactExceptionError)
+
     def get(self, contact_id: str) -> ContactDetail:
         """Get a contact's details.
 
@@ -144,6 +150,56 @@ class ContactManager(Manager):
             ContactData: Response from the API.
         """
 
+        params = self._update_params(
+            contact_id, mobile, name, surname, full_name, vname, vusername, birthday, nameday, **kwargs
+        )
+        response = self.call("GET", "contact/update", params)
+
+        raise_for_errors(response, ContactExceptionError)
+
+        return cast(ContactData, response)
+
+    @classmethod
+    def _add_params(
+        cls,
+        mobile: str,
+        name: str = "",
+        surname: str = "",
+        full_name: str = "",
+        vname: str = "",
+        vusername: str = "",
+        birthday: DateLike | None = None,
+        nameday: DateLike | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build the query parameters for ``contact/add``."""
+        return {
+            "mobile": mobile,
+            "name": name,
+            "surname": surname,
+            "full_name": full_name,
+            "vname": vname,
+            "vusername": vusername,
+            "birthday": cls._date_to_api(birthday),
+            "nameday": cls._date_to_api(nameday),
+            **kwargs,
+        }
+
+    @classmethod
+    def _update_params(
+        cls,
+        contact_id: str,
+        mobile: str | None = None,
+        name: str | None = None,
+        surname: str | None = None,
+        full_name: str | None = None,
+        vname: str | None = None,
+        vusername: str | None = None,
+        birthday: DateLike | None = None,
+        nameday: DateLike | None = None,
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """Build the query parameters for ``contact/update``, dropping fields that are not being changed."""
         params = {
             "contactId": contact_id,
             "mobile": mobile,
@@ -152,16 +208,11 @@ class ContactManager(Manager):
             "full_name": full_name,
             "vname": vname,
             "vusername": vusername,
-            "birthday": self._date_to_api(birthday),
-            "nameday": self._date_to_api(nameday),
+            "birthday": cls._date_to_api(birthday),
+            "nameday": cls._date_to_api(nameday),
             **kwargs,
         }
-        params = {key: value for key, value in params.items() if value is not None}
-        response = self.call("GET", "contact/update", params)
-
-        raise_for_errors(response, ContactExceptionError)
-
-        return cast(ContactData, response)
+        return {key: value for key, value in params.items() if value is not None}
 
     @staticmethod
     def _date_to_api(value: date | str | None) -> str | None:
@@ -1,7 +1,8 @@
-from typing import cast, overload
+from collections.abc import Iterator
+from typing import Any, cast, overload
 
 from pysmscenter.exceptions import GroupExceptionError
-from pysmscenter.types import BaseResponse, GroupAddContactData, GroupData, GroupGetData, GroupListData
+from pysmscenter.types import BaseResponse, GroupAddContactData, GroupContact, GroupData, GroupGetData, GroupListData
 from pysmscenter.utils import raise_for_errors
 
 from .manager import Manager
@@ -70,6 +71,25 @@ class GroupManager(Manager):
 
         return cast(GroupGetData, response)
 
+    def iter_contacts(self, group_id: str) -> Iterator[GroupContact]:
+        """
+        Iterate over the contacts of a group, parsing them as they are received.
+
+        Unlike :meth:`get`, the response is never held in memory as a whole.
+
+        Args:
+            group_id (str): The ID of the group whose contacts to iterate.
+
+        Raises:
+            GroupExceptionError: If the API response indicates an error, once the response has been consumed.
+
+        Returns:
+            Iterator[GroupContact]: Contacts of the group, in response order.
+        """
+        meta: dict[str, Any] = {}
+        yield from self.stream("GET", "group/get", ("group", "contacts"), {"groupId": group_id}, meta=meta)
+        raise_for_errors(meta, GroupExceptionError)
+
     def add_contact(self, group_id: str, contact_id: str) -> GroupAddContactData:
         """
         Add a contact to a group.
@@ -124,25 +144,7 @@ class GroupManager(Manager):
         Returns:
             BaseResponse: Response from the API.
         """
-        error_message = "Either contact_group_id or both group_id and contact_id must be provided."
-
-        has_group_and_contact = group_id is not None and contact_id is not None
-        has_contact_group_id = contact_group_id is not None
-        has_any_group_contact = group_id is not None or contact_id is not None
-
-        if not has_group_and_contact and not has_contact_group_id:
-            raise ValueError(error_message)
-
-        if has_contact_group_id and has_any_group_contact:
-            raise ValueError(error_message)
-
-        if contact_group_id is not None:
-            params = {"contactGroupId": contact_group_id}
-        else:
-            params = {
-                "groupId": group_id,
-                "contactId": contact_id,
-            }
+        params = self._delete_contact_params(group_id, contact_id, contact_group_id)
 
         response = self.call("GET", "group/deleteContact", params)
 
@@ -166,3 +168,29 @@ class GroupManager(Manager):
         raise_for_errors(response, GroupExceptionError)
 
         return cast(BaseResponse, response)
+
+    @staticmethod
+    def _delete_contact_params(
+        group_id: str | None = None,
+        contact_id: str | None = None,
+        contact_group_id: str | None = None,
+    ) -> dict[str, str | None]:
+        """Validate the ``group/deleteContact`` arguments and build its query parameters."""
+        error_message = "Either contact_group_id or both group_id and contact_id must be provided."
+
+        has_group_and_contact = group_id is not None and contact_id is not None
+        has_contact_group_id = contact_group_id is not None
+        has_any_group_contact = group_id is not None or contact_id is not None
+
+        if not has_group_and_contact and not has_contact_group_id:
+            raise ValueError(error_message)
+
+        if has_contact_group_id and has_any_group_contact:
+            raise ValueError(error_message)
+
+        if contact_group_id is not None:
+            return {"contactGroupId": contact_group_id}
+        return {
+            "groupId": group_id,
+            "contactId": contact_id,
+        }
@@ -1,6 +1,7 @@
+from collections.abc import Iterator
 from typing import cast
 
-from pysmscenter.types import GroupListHistoryRawResponse, SingleListHistoryRawData
+from pysmscenter.types import GroupListHistoryRawResponse, HistoryGroupItem, SingleListHistoryRawData, SmS
 
 from .manager import Manager
 
@@ -30,3 +31,21 @@ class HistoryManager(Manager):
         response = self.call("GET", "history/single/list")
 
         return cast(SingleListHistoryRawData, response)
+
+    def iter_single(self) -> Iterator[SmS]:
+        """Iterate over the single SMS history, parsing messages as they are received.
+
+        Unlike :meth:`single_list`, the response is never held in memory as a whole.
+
+        Returns:
+            Iterator[SmS]: Messages, in response order.
+        """
+        return self.stream("GET", "history/single/list", ("sms",))
+
+    def iter_groups(self) -> Iterator[HistoryGroupItem]:
+        """Iterate over the grouped SMS history, parsing groups as they are received.
+
+        Returns:
+            Iterator[HistoryGroupItem]: History groups, in response order.
+        """
+        return self.stream("GET", "history/group/list", ())
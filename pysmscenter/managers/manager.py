@@ -1,4 +1,4 @@
-from collections.abc import Mapping
+from collections.abc import Iterator, Mapping, Sequence
 from typing import Any, ClassVar, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -18,3 +18,13 @@ class Manager:
         params: Mapping[str, Any] | None = None,
     ) -> dict[str, Any]:
         return self.client.fetch_data(method, endpoint, params)
+
+    def stream(
+        self,
+        method: str,
+        endpoint: str,
+        path: Sequence[str],
+        params: Mapping[str, Any] | None = None,
+        meta: dict[str, Any] | None = None,
+    ) -> Iterator[Any]:
+        return self.client.stream_data(method, endpoint, path, params, meta)
@@ -1,12 +1,27 @@
-from collections.abc import Sequence
-from typing import cast
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any, TYPE_CHECKING, cast
+from urllib.parse import urlencode, urljoin
 
+from pysmscenter.bulk import (
+    BulkJob,
+    CampaignSummary,
+    DEFAULT_CHUNK_SIZE,
+    DEFAULT_MAX_IN_FLIGHT,
+    DEFAULT_MAX_URL_LENGTH,
+    chunk_recipients,
+)
+from pysmscenter.encoding import requires_ucs
 from pysmscenter.exceptions import SMSExceptionError
+from pysmscenter.merge import ContactSource, MergeGrouper, MessageTemplate, contact_rows, merge_chunks
+from pysmscenter.parallel import ParallelExecutor
 from pysmscenter.types import SMSBulkRawData, SMSCancelRawData, SMSRawData, Timestamp
 from pysmscenter.utils import bool2str, raise_for_errors, ts2epoch
 
 from .manager import Manager
 
+if TYPE_CHECKING:
+    from pysmscenter.main import APIKeyClient, BaseClient
+
 
 class SmsManager(Manager):
     name = "sms"
@@ -30,7 +45,7 @@ class SmsManager(Manager):
             to (str): Mobile number to send the sms to
             text (str): Text of the sms to send
             sender (str): Sender of the sms
-            ucs (bool, optional): Whether the sms is unicode. Defaults to None.
+            ucs (bool, optional): Whether the sms is unicode. Defaults to None, detected from the text.
             flash (bool, optional): Whether the sms is flash. Defaults to None.
             timestamp (Timestamp, optional): Timestamp for scheduled sending. Defaults to None.
             callback (str, optional): Callback URL for delivery reports. Defaults to None.
@@ -41,16 +56,8 @@ class SmsManager(Manager):
         Returns:
             SMSRawData: Response from the API.
         """
-        params = {
-            "to": to,
-            "text": text,
-            "from": sender,
-            "ucs": bool2str(ucs) if ucs is not None else None,
-            "flash": bool2str(flash) if flash is not None else None,
-            "timestamp": ts2epoch(timestamp) if timestamp is not None else None,
-            "callback": callback,
-        }
-        params = {key: value for key, value in params.items() if value is not None}
+        text = self._prepare_text(self.client, text)
+        params = self._send_params(to, text, sender, ucs, flash, timestamp, callback)
 
         response = self.call("GET", "sms/send", params)
 
@@ -73,7 +80,7 @@ class SmsManager(Manager):
             to (Sequence[str] | str): multiple mobiles to send the sms to
             text (str): Text of the sms to send
             sender (str): Sender of the sms
-            ucs (bool, optional): Whether the sms is unicode. Defaults to None.
+            ucs (bool, optional): Whether the sms is unicode. Defaults to None, detected from the text.
             flash (bool, optional): Whether the sms is flash. Defaults to None.
             timestamp (Timestamp, optional): Timestamp for scheduled sending. Defaults to None.
 
@@ -83,25 +90,132 @@ class SmsManager(Manager):
         Returns:
             SMSBulkRawData: Response from the API.
         """
-
-        if isinstance(to, list | tuple):
-            to = ",".join(to)
-
-        params = {
-            "to": to,
-            "text": text,
-            "from": sender,
-            "ucs": bool2str(ucs) if ucs is not None else None,
-            "flash": bool2str(flash) if flash is not None else None,
-            "timestamp": ts2epoch(timestamp) if timestamp is not None else None,
-        }
-        params = {key: value for key, value in params.items() if value is not None}
+        text = self._prepare_text(self.client, text)
+        params = self._bulk_params(to, text, sender, ucs, flash, timestamp)
 
         response = self.call("GET", "sms/bulk", params)
         raise_for_errors(response, SMSExceptionError)
 
         return cast(SMSBulkRawData, response)
 
+    def bulk_stream(
+        self,
+        recipients: Iterable[str],
+        text: str,
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> CampaignSummary:
+        """Send an SMS to any number of recipients, split into pipelined ``sms/bulk`` calls.
+
+        Recipients are consumed lazily and chunked by count and by URL length, and up to
+        ``max_in_flight`` chunks are sent concurrently. A failed chunk does not stop the campaign;
+        its recipients are reported in the summary together with those the provider rejected.
+
+        Args:
+            recipients (Iterable[str]): Mobile numbers to send the sms to. May be a lazy iterable.
+            text (str): Text of the sms to send
+            sender (str): Sender of the sms
+            ucs (bool, optional): Whether the sms is unicode. Defaults to None, detected from the text.
+            flash (bool, optional): Whether the sms is flash. Defaults to None.
+            timestamp (Timestamp, optional): Timestamp for scheduled sending. Defaults to None.
+            chunk_size (int, optional): Maximum recipients per call. Defaults to 1000.
+            max_url_length (int, optional): Maximum request URL length. Defaults to 8000.
+            max_in_flight (int, optional): Maximum concurrent calls. Defaults to 4.
+
+        Returns:
+            CampaignSummary: Merged results, including rejected recipients to retry.
+        """
+        text = self._prepare_text(self.client, text)
+        params = self._bulk_params("", text, sender, ucs, flash, timestamp)
+        chunks = chunk_recipients(recipients, self._bulk_base_length(self.client, params), chunk_size, max_url_length)
+        return self._send_chunks(((params, chunk) for chunk in chunks), max_in_flight)
+
+    def merge(
+        self,
+        template: MessageTemplate | str,
+        contacts: ContactSource,
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+        *,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+    ) -> CampaignSummary:
+        """Send a personalized SMS to every contact, one ``sms/bulk`` call per distinct rendered text.
+
+        The template is compiled once and rendered over the contacts in a single streaming pass.
+        Contacts whose messages come out identical share ``sms/bulk`` calls, so a campaign costs one
+        request per distinct message (per ``chunk_size`` recipients) instead of one per contact.
+
+        Args:
+            template (MessageTemplate | str): Message with ``{field}`` placeholders, e.g. ``"Hello {vname}!"``.
+            contacts (ContactSource): A group ID, a :meth:`ContactManager.list` response or any iterable of contacts.
+            sender (str): Sender of the sms
+            ucs (bool, optional): Whether the sms is unicode. Defaults to None, detected from the text.
+            flash (bool, optional): Whether the sms is flash. Defaults to None.
+            timestamp (Timestamp, optional): Timestamp for scheduled sending. Defaults to None.
+            chunk_size (int, optional): Maximum recipients per call. Defaults to 1000.
+            max_url_length (int, optional): Maximum request URL length. Defaults to 8000.
+            max_in_flight (int, optional): Maximum concurrent calls. Defaults to 4.
+
+        Raises:
+            ContactExceptionError: If ``contacts`` is a contact list response that indicates an error.
+
+        Returns:
+            CampaignSummary: Merged results, including rejected recipients to retry.
+        """
+        if isinstance(template, str):
+            template = MessageTemplate(template)
+
+        def params(text: str) -> dict[str, Any]:
+            return self._bulk_params("", text, sender, ucs, flash, timestamp)
+
+        grouper = MergeGrouper(
+            template,
+            lambda text: self._bulk_base_length(self.client, params(text)),
+            chunk_size,
+            max_url_length,
+            self.client.transliterator,
+        )
+        chunks = merge_chunks(self._merge_contacts(contacts), grouper)
+        return self._send_chunks(((params(text), chunk) for text, chunk in chunks), max_in_flight)
+
+    def _merge_contacts(self, contacts: ContactSource) -> Iterable[Mapping[str, Any]]:
+        if isinstance(contacts, str):
+            return self.client.group.iter_contacts(contacts)
+        return contact_rows(contacts)
+
+    def _send_chunks(self, jobs: Iterable[BulkJob], max_in_flight: int) -> CampaignSummary:
+        in_flight: dict[int, list[str]] = {}
+
+        def track(jobs: Iterable[BulkJob]) -> Iterator[tuple[list[str], Mapping[str, Any]]]:
+            for index, (params, chunk) in enumerate(jobs):
+                in_flight[index] = chunk
+                yield chunk, params
+
+        summary = CampaignSummary()
+        executor = ParallelExecutor(self.client, max_workers=max_in_flight, max_pending=max_in_flight)
+        for outcome in executor.as_completed(self._bulk_chunk, track(jobs)):
+            chunk = in_flight.pop(outcome.index)
+            if outcome.error is not None:
+                summary.add_failure(chunk, outcome.error)
+            else:
+                summary.add(chunk, outcome.result())
+        return summary
+
+    def _bulk_chunk(self, recipients: list[str], params: Mapping[str, Any]) -> SMSBulkRawData:
+        response = self.call("GET", "sms/bulk", {**params, "to": ",".join(recipients)})
+        raise_for_errors(response, SMSExceptionError)
+        return cast(SMSBulkRawData, response)
+
     def cancel(self, sms_id: str) -> SMSCancelRawData:
         """Cancel a scheduled SMS.
 
@@ -122,3 +236,69 @@ class SmsManager(Manager):
         response = self.call("GET", "sms/cancel", params)
         raise_for_errors(response, SMSExceptionError)
         return cast(SMSCancelRawData, response)
+
+    @staticmethod
+    def _send_params(
+        to: str,
+        text: str,
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+        callback: str | None = None,
+    ) -> dict[str, Any]:
+        """Build the query parameters for ``sms/send``, dropping unset options.
+
+        When ``ucs`` is not given it is turned on for texts that do not fit the GSM-7 alphabet.
+        """
+        if ucs is None and requires_ucs(text):
+            ucs = True
+        params = {
+            "to": to,
+            "text": text,
+            "from": sender,
+            "ucs": bool2str(ucs) if ucs is not None else None,
+            "flash": bool2str(flash) if flash is not None else None,
+            "timestamp": ts2epoch(timestamp) if timestamp is not None else None,
+            "callback": callback,
+        }
+        return {key: value for key, value in params.items() if value is not None}
+
+    @staticmethod
+    def _prepare_text(client: "APIKeyClient", text: str) -> str:
+        """Apply the client's transliteration, if enabled, to an outgoing text."""
+        return client.transliterator(text) if client.transliterator is not None else text
+
+    @staticmethod
+    def _bulk_base_length(client: "BaseClient", params: Mapping[str, Any]) -> int:
+        """Length of the ``sms/bulk`` URL for ``params`` before any recipient is added."""
+        query = urlencode(client._build_params({**params, "to": ""}))
+        return len(urljoin(client.BASE_URL, "sms/bulk")) + 1 + len(query)
+
+    @staticmethod
+    def _bulk_params(
+        to: Sequence[str] | str,
+        text: str,
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+    ) -> dict[str, Any]:
+        """Build the query parameters for ``sms/bulk``, joining multiple recipients with commas.
+
+        When ``ucs`` is not given it is turned on for texts that do not fit the GSM-7 alphabet.
+        """
+        if isinstance(to, list | tuple):
+            to = ",".join(to)
+        if ucs is None and requires_ucs(text):
+            ucs = True
+
+        params = {
+            "to": to,
+            "text": text,
+            "from": sender,
+            "ucs": bool2str(ucs) if ucs is not None else None,
+            "flash": bool2str(flash) if flash is not None else None,
+            "timestamp": ts2epoch(timestamp) if timestamp is not None else None,
+        }
+        return {key: value for key, value in params.items() if value is not None}
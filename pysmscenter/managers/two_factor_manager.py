@@ -1,4 +1,4 @@
-from typing import cast
+from typing import Any, cast
 
 from pysmscenter.exceptions import TwoFactorExceptionError
 from pysmscenter.types import TwoFactorCheckResponse, TwoFactorRawResponse
@@ -45,16 +45,7 @@ class TwoFactorManager(Manager):
             as soon as the delivery report arrives.
         """
 
-        params = {
-            "to": to,
-            "text": text,
-            "from": sender,
-            "wait": wait,
-            "callback": callback,
-            "ucs": bool2str(ucs) if ucs is not None else None,
-        }
-
-        params = {key: value for key, value in params.items() if value is not None}
+        params = self._send_params(to, text, sender, wait, callback, ucs)
 
         response = self.call("GET", "2fa/send", params=params)
         raise_for_errors(response, TwoFactorExceptionError)
@@ -77,3 +68,23 @@ class TwoFactorManager(Manager):
         response = self.call("GET", "2fa/check", params=params)
         raise_for_errors(response, TwoFactorExceptionError)
         return cast(TwoFactorCheckResponse, response)
+
+    @staticmethod
+    def _send_params(
+        to: str,
+        text: str | None = None,
+        sender: str | None = None,
+        wait: int | None = None,
+        callback: str | None = None,
+        ucs: bool | None = None,
+    ) -> dict[str, Any]:
+        """Build the query parameters for ``2fa/send``, dropping unset options."""
+        params = {
+            "to": to,
+            "text": text,
+            "from": sender,
+            "wait": wait,
+            "callback": callback,
+            "ucs": bool2str(ucs) if ucs is not None else None,
+        }
+        return {key: value for key, value in params.items() if value is not None}
@@ -0,0 +1,131 @@
+import string
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from typing import Any, cast
+
+from pysmscenter.bulk import DEFAULT_CHUNK_SIZE, DEFAULT_MAX_URL_LENGTH, chunk_recipients
+from pysmscenter.exceptions import ContactExceptionError
+from pysmscenter.utils import raise_for_errors
+
+type ContactSource = str | Mapping[str, Any] | Iterable[Mapping[str, Any]]
+
+_FORMATTER = string.Formatter()
+
+
+class MessageTemplate:
+    """A message with ``{field}`` placeholders, parsed once and rendered per contact.
+
+    Placeholders name contact fields such as ``name``, ``surname`` or ``vname`` (the vocative form
+    of the first name) and accept the usual format spec and conversion, e.g. ``{vname!s:>10}``.
+    A field the contact lacks renders as ``default``.
+
+    Example:
+        ``MessageTemplate("Happy name day, {vname}!").render({"vname": "George"})``
+
+    Args:
+        template: Message text with ``str.format``-style named placeholders.
+        default: Text used for fields that are missing or empty.
+    """
+
+    def __init__(self, template: str, default: str = "") -> None:
+        self.template = template
+        self.default = default
+        self._parts: list[tuple[str, str | None, str, str | None]] = []
+        for literal, field, spec, conversion in _FORMATTER.parse(template):
+            if field is not None and not field.isidentifier():
+                raise ValueError(f"Template placeholders must name a contact field, got {{{field}}}")
+            self._parts.append((literal, field, spec or "", conversion))
+        self.fields = frozenset(field for _, field, _, _ in self._parts if field is not None)
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} {self.template!r}>"
+
+    def render(self, contact: Mapping[str, Any]) -> str:
+        rendered: list[str] = []
+        for literal, field, spec, conversion in self._parts:
+            rendered.append(literal)
+            if field is None:
+                continue
+            value = contact.get(field)
+            if value is None or value == "":
+                rendered.append(self.default)
+            else:
+                rendered.append(format(_FORMATTER.convert_field(value, conversion), spec))
+        return "".join(rendered)
+
+
+class MergeGrouper:
+    """Group contacts by their rendered message, emitting ``(text, recipients)`` chunks for ``sms/bulk``.
+
+    Contacts are pushed one at a time with :meth:`feed`. Recipients are held per distinct text until
+    ``chunk_size`` of them have gathered, so memory stays bounded however long the contact source is;
+    :meth:`close` emits whatever is left.
+
+    Args:
+        template: Template rendered for each contact.
+        base_length: Length of the ``sms/bulk`` URL for a text before any recipient is added.
+        chunk_size: Maximum recipients per chunk.
+        max_url_length: Maximum URL length once a chunk's recipients are added.
+        normalize: Applied to each rendered text before grouping, e.g. a :class:`Transliterator`.
+    """
+
+    def __init__(
+        self,
+        template: MessageTemplate,
+        base_length: Callable[[str], int],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_url_length: int = DEFAULT_MAX_URL_LENGTH,
+        normalize: Callable[[str], str] | None = None,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        self.template = template
+        self.base_length = base_length
+        self.chunk_size = chunk_size
+        self.max_url_length = max_url_length
+        self.normalize = normalize
+        self._groups: dict[str, list[str]] = {}
+
+    def feed(self, contact: Mapping[str, Any]) -> list[tuple[str, list[str]]]:
+        """Add a contact; contacts without a mobile number are skipped."""
+        mobile = str(contact.get("mobile") or "").strip()
+        if not mobile:
+            return []
+        text = self.template.render(contact)
+        if self.normalize is not None:
+            text = self.normalize(text)
+        group = self._groups.setdefault(text, [])
+        group.append(mobile)
+        if len(group) < self.chunk_size:
+            return []
+        del self._groups[text]
+        return self._chunks(text, group)
+
+    def close(self) -> list[tuple[str, list[str]]]:
+        """Emit the recipients still held for every text."""
+        groups, self._groups = self._groups, {}
+        return [chunk for text, group in groups.items() for chunk in self._chunks(text, group)]
+
+    def _chunks(self, text: str, recipients: list[str]) -> list[tuple[str, list[str]]]:
+        # The text is part of the URL, so a long one can force a group into several calls.
+        chunks = chunk_recipients(recipients, self.base_length(text), self.chunk_size, self.max_url_length)
+        return [(text, chunk) for chunk in chunks]
+
+
+def merge_chunks(contacts: Iterable[Mapping[str, Any]], grouper: MergeGrouper) -> Iterator[tuple[str, list[str]]]:
+    """Render ``contacts`` in a single lazy pass, yielding ``(text, recipients)`` chunks as they fill up."""
+    for contact in contacts:
+        yield from grouper.feed(contact)
+    yield from grouper.close()
+
+
+def contact_rows(contacts: Mapping[str, Any] | Iterable[Mapping[str, Any]]) -> Iterable[Mapping[str, Any]]:
+    """Return the contacts of a contact list response, or ``contacts`` itself if it is already an iterable of them.
+
+    Raises:
+        ContactExceptionError: If ``contacts`` is a response that indicates an error.
+    """
+    if isinstance(contacts, Mapping):
+        response = cast(Mapping[str, Any], contacts)
+        raise_for_errors(dict(response), ContactExceptionError)
+        return response.get("contacts") or ()
+    return contacts
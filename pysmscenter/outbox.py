@@ -0,0 +1,432 @@
+import contextlib
+import enum
+import json
+import os
+import sqlite3
+import threading
+import time
+import types
+from collections.abc import Callable, Generator
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Self, TYPE_CHECKING
+
+from requests import RequestException
+
+from pysmscenter.exceptions import SMSExceptionError
+from pysmscenter.managers.sms_manager import SmsManager
+from pysmscenter.parallel import ParallelExecutor
+from pysmscenter.reconcile import HistoryReconciler
+from pysmscenter.types import Timestamp
+from pysmscenter.utils import raise_for_errors
+
+if TYPE_CHECKING:
+    from pysmscenter.main import SMSClient
+
+
+class OutboxState(enum.StrEnum):
+    QUEUED = "queued"
+    IN_FLIGHT = "in_flight"
+    ACCEPTED = "accepted"
+    FAILED = "failed"
+    DEAD_LETTER = "dead_letter"
+
+
+_SCHEMA = """
+PRAGMA journal_mode = WAL;
+PRAGMA synchronous = FULL;
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    recipient TEXT NOT NULL,
+    params TEXT NOT NULL,
+    state TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    sms_id TEXT,
+    cost TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    started_at REAL,
+    next_attempt_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (state, next_attempt_at);
+"""
+
+_CLAIM = """
+UPDATE outbox SET state = :in_flight, attempts = attempts + 1, started_at = :now, updated_at = :now
+WHERE id = (
+    SELECT id FROM outbox WHERE state IN (:queued, :failed) AND next_attempt_at <= :now
+    ORDER BY next_attempt_at, id LIMIT 1
+)
+RETURNING *
+"""
+
+_UNSETTLED = (OutboxState.QUEUED, OutboxState.IN_FLIGHT, OutboxState.FAILED)
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxMessage:
+    """A message stored in the outbox, with its delivery state."""
+
+    id: int
+    to: str
+    params: dict[str, Any]
+    state: OutboxState
+    attempts: int
+    sms_id: str | None
+    cost: str | None
+    error: str | None
+    created_at: float
+    updated_at: float
+    started_at: float | None
+
+    @property
+    def text(self) -> str:
+        return self.params["text"]
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> Self:
+        return cls(
+            id=row["id"],
+            to=row["recipient"],
+            params=json.loads(row["params"]),
+            state=OutboxState(row["state"]),
+            attempts=row["attempts"],
+            sms_id=row["sms_id"],
+            cost=row["cost"],
+            error=row["error"],
+            created_at=row["created_at"],
+            updated_at=row["updated_at"],
+            started_at=row["started_at"],
+        )
+
+
+class Outbox:
+    """Durable SQLite outbox for ``sms/send``, drained by a pool of worker threads.
+
+    :meth:`enqueue` only appends to memory; a writer thread commits queued messages in batches of
+    up to ``batch_size``, so a single fsync covers many messages and producers never wait on the
+    disk or the network. Workers then move each message through ``queued -> in_flight ->
+    accepted``. Failed attempts are retried with exponential backoff until ``max_attempts``,
+    after which the message becomes a dead letter, as does any message the provider rejects.
+
+    A send that fails ambiguously (timeout, dropped connection, 5xx) is reconciled against the
+    single SMS history before it is retried, and so is every message still ``in_flight`` when the
+    outbox is opened after a crash. A message whose fate cannot be established is dead-lettered
+    rather than risk sending it twice. Messages settled from the history have no ``sms_id``.
+
+    Args:
+        client: Client to send through.
+        path: SQLite database file; created if missing.
+        workers: Messages sent concurrently.
+        max_attempts: Attempts before a message is dead-lettered.
+        retry_delay: Seconds before the first retry; doubled on every further attempt.
+        batch_size: Messages committed per transaction.
+        flush_interval: Seconds the writer waits to fill a batch.
+        reconciler: Decides from the history whether an ambiguous send was accepted.
+        clock: Wall-clock time source, persisted in the database.
+    """
+
+    def __init__(
+        self,
+        client: "SMSClient",
+        path: str | os.PathLike[str],
+        *,
+        workers: int = 4,
+        max_attempts: int = 5,
+        retry_delay: float = 5.0,
+        batch_size: int = 500,
+        flush_interval: float = 0.01,
+        reconciler: HistoryReconciler | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.client = client
+        self.path = path
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.reconciler = reconciler if reconciler is not None else HistoryReconciler()
+        self._clock = clock
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(_SCHEMA)
+        self._db_lock = threading.Lock()
+        self._condition = threading.Condition()
+        self._pending: list[tuple[str, str, Future[int]]] = []
+        self._slots = threading.Semaphore(workers)
+        self._executor = ParallelExecutor(client, max_workers=workers)
+        self._threads: list[threading.Thread] = []
+        self._closed = False
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} path={os.fspath(self.path)!r} workers={self.workers}>"
+
+    def __enter__(self) -> Self:
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> bool:
+        self.close()
+        return False
+
+    def start(self) -> Self:
+        """Recover messages left in flight by a previous run and start draining the outbox."""
+        if self._threads:
+            return self
+        self._executor.start()
+        for message in self.messages(OutboxState.IN_FLIGHT):
+            self._executor.submit(self._recover, message)
+        for target in (self._run_writer, self._run_dispatcher):
+            thread = threading.Thread(target=target, name=f"pysmscenter-outbox-{target.__name__}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        return self
+
+    def enqueue(
+        self,
+        to: str,
+        text: str,
+        sender: str,
+        ucs: bool | None = None,
+        flash: bool | None = None,
+        timestamp: Timestamp | None = None,
+        callback: str | None = None,
+    ) -> Future[int]:
+        """Queue an SMS for sending; takes the same arguments as :meth:`SmsManager.send`.
+
+        Returns:
+            Future[int]: Resolves to the message ID once the message has been committed to disk.
+        """
+        text = SmsManager._prepare_text(self.client, text)
+        params = SmsManager._send_params(to, text, sender, ucs, flash, timestamp, callback)
+        future: Future[int] = Future()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("Outbox is closed")
+            self._pending.append((to, json.dumps(params), future))
+            self._condition.notify_all()
+        return future
+
+    def get(self, message_id: int) -> OutboxMessage | None:
+        with self._db_lock:
+            row = self._db.execute("SELECT * FROM outbox WHERE id = ?", (message_id,)).fetchone()
+        return OutboxMessage.from_row(row) if row is not None else None
+
+    def messages(self, state: OutboxState | None = None) -> list[OutboxMessage]:
+        """Return the stored messages, optionally only those in ``state``, oldest first."""
+        with self._db_lock:
+            if state is None:
+                rows = self._db.execute("SELECT * FROM outbox ORDER BY id").fetchall()
+            else:
+                rows = self._db.execute("SELECT * FROM outbox WHERE state = ? ORDER BY id", (state,)).fetchall()
+        return [OutboxMessage.from_row(row) for row in rows]
+
+    def counts(self) -> dict[OutboxState, int]:
+        with self._db_lock:
+            rows = self._db.execute("SELECT state, COUNT(*) FROM outbox GROUP BY state").fetchall()
+        counts = dict.fromkeys(OutboxState, 0)
+        counts.update({OutboxState(state): count for state, count in rows})
+        return counts
+
+    def retry_dead_letters(self) -> int:
+        """Queue every dead letter again with a fresh attempt budget; return how many were queued."""
+        with self._transaction() as db:
+            cursor = db.execute(
+                "UPDATE outbox SET state = ?, attempts = 0, next_attempt_at = ?, updated_at = ? WHERE state = ?",
+                (OutboxState.QUEUED, self._clock(), self._clock(), OutboxState.DEAD_LETTER),
+            )
+        self._notify()
+        return cursor.rowcount
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Wait until every message is accepted or dead-lettered; return False if ``timeout`` expires first."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while self._pending or self._unsettled():
+                remaining = 0.1 if deadline is None else min(0.1, deadline - time.monotonic())
+                if remaining <= 0:
+                    return False
+                self._condition.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        """Commit queued messages, wait for the sends in flight and close the database.
+
+        Messages not sent yet stay in the outbox and are picked up by the next :meth:`start`.
+        """
+        with self._condition:
+            if self._closed:
+                return
+            self._closed = True
+            self._condition.notify_all()
+        if not self._threads and self._pending:
+            self._write(self._pending)
+        for thread in self._threads:
+            thread.join()
+        self._executor.shutdown(wait=True)
+        self._db.close()
+
+    @contextlib.contextmanager
+    def _transaction(self) -> Generator[sqlite3.Connection]:
+        with self._db_lock:
+            self._db.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._db
+            except BaseException:
+                self._db.execute("ROLLBACK")
+                raise
+            self._db.execute("COMMIT")
+
+    def _notify(self) -> None:
+        with self._condition:
+            self._condition.notify_all()
+
+    def _unsettled(self) -> int:
+        with self._db_lock:
+            row = self._db.execute("SELECT COUNT(*) FROM outbox WHERE state IN (?, ?, ?)", _UNSETTLED).fetchone()
+        return row[0]
+
+    def _run_writer(self) -> None:
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                deadline = time.monotonic() + self.flush_interval
+                while len(self._pending) < self.batch_size and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                batch, self._pending = self._pending[: self.batch_size], self._pending[self.batch_size :]
+            self._write(batch)
+            self._notify()
+
+    def _write(self, batch: list[tuple[str, str, Future[int]]]) -> None:
+        now = self._clock()
+        try:
+            with self._transaction() as db:
+                ids = [
+                    db.execute(
+                        "INSERT INTO outbox (recipient, params, state, created_at, updated_at, next_attempt_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (to, params, OutboxState.QUEUED, now, now, now),
+                    ).lastrowid
+                    for to, params, _ in batch
+                ]
+        except sqlite3.Error as exc:
+            for _, _, future in batch:
+                future.set_exception(exc)
+            return
+        for (_, _, future), message_id in zip(batch, ids, strict=True):
+            future.set_result(message_id or 0)
+
+    def _run_dispatcher(self) -> None:
+        while True:
+            self._slots.acquire()
+            with self._condition:
+                while True:
+                    if self._closed:
+                        self._slots.release()
+                        return
+                    message = self._claim()
+                    if message is not None:
+                        break
+                    self._condition.wait(self._idle_timeout())
+            future = self._executor.submit(self._deliver, message)
+            future.add_done_callback(lambda _: self._slots.release())
+
+    def _claim(self) -> OutboxMessage | None:
+        names = {"in_flight": OutboxState.IN_FLIGHT, "queued": OutboxState.QUEUED, "failed": OutboxState.FAILED}
+        with self._transaction() as db:
+            row = db.execute(_CLAIM, {**names, "now": self._clock()}).fetchone()
+        return OutboxMessage.from_row(row) if row is not None else None
+
+    def _idle_timeout(self) -> float:
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT MIN(next_attempt_at) FROM outbox WHERE state = ?", (OutboxState.FAILED,)
+            ).fetchone()
+        if row[0] is None:
+            return 1.0
+        return min(1.0, max(0.0, row[0] - self._clock()))
+
+    def _deliver(self, message: OutboxMessage) -> None:
+        try:
+            response = self.client.sms.call("GET", "sms/send", message.params)
+            raise_for_errors(response, SMSExceptionError)
+        except SMSExceptionError as exc:
+            # The provider refused the message; sending it again would be refused too.
+            self._update(message, OutboxState.DEAD_LETTER, error=str(exc))
+        except RequestException as exc:
+            if not self.client._is_ambiguous(exc):
+                self._retry(message, exc)
+                return
+            time.sleep(self.reconciler.delay)
+            self._settle(message, exc, self._reconcile(message))
+        except Exception as exc:
+            self._retry(message, exc)
+        else:
+            cost = response.get("cost")
+            self._update(
+                message,
+                OutboxState.ACCEPTED,
+                sms_id=str(response.get("id", "")) or None,
+                cost=str(cost) if cost is not None else None,
+            )
+
+    def _recover(self, message: OutboxMessage) -> None:
+        self._settle(message, None, self._reconcile(message))
+
+    def _settle(self, message: OutboxMessage, error: BaseException | None, accepted: bool | None) -> None:
+        cause = repr(error) if error is not None else "an interrupted run"
+        if accepted is None:
+            self._update(message, OutboxState.DEAD_LETTER, error=f"Delivery could not be confirmed after {cause}")
+        elif accepted:
+            self._update(message, OutboxState.ACCEPTED, error=f"Confirmed from history after {cause}")
+        elif error is None:
+            self._update(message, OutboxState.QUEUED, next_attempt_at=self._clock())
+        else:
+            self._retry(message, error)
+
+    def _reconcile(self, message: OutboxMessage) -> bool | None:
+        """Whether the history shows ``message`` was accepted; ``None`` if the history cannot be read."""
+        try:
+            history = self.client._request("GET", self.reconciler.endpoint)
+        except (RequestException, ValueError):
+            return None
+        return self.reconciler.accepted(history, message.params, message.started_at or message.created_at)
+
+    def _retry(self, message: OutboxMessage, error: BaseException) -> None:
+        if message.attempts >= self.max_attempts:
+            self._update(message, OutboxState.DEAD_LETTER, error=repr(error))
+            return
+        delay = self.retry_delay * 2 ** (message.attempts - 1)
+        self._update(message, OutboxState.FAILED, error=repr(error), next_attempt_at=self._clock() + delay)
+
+    def _update(
+        self,
+        message: OutboxMessage,
+        state: OutboxState,
+        *,
+        sms_id: str | None = None,
+        cost: str | None = None,
+        error: str | None = None,
+        next_attempt_at: float | None = None,
+    ) -> None:
+        with self._transaction() as db:
+            db.execute(
+                "UPDATE outbox SET state = ?, sms_id = ?, cost = ?, error = ?, updated_at = ?, "
+                "next_attempt_at = COALESCE(?, next_attempt_at) WHERE id = ?",
+                (state, sms_id, cost, error, self._clock(), next_attempt_at, message.id),
+            )
+        self._notify()
@@ -0,0 +1,162 @@
+import threading
+import types
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Self, TYPE_CHECKING
+
+from requests import Session
+
+if TYPE_CHECKING:
+    from pysmscenter.main import BaseHTTPClient
+
+
+@dataclass(frozen=True, slots=True)
+class ParallelResult[T]:
+    """Outcome of a single job run by :class:`ParallelExecutor`."""
+
+    index: int
+    value: T | None = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def result(self) -> T:
+        """Return the job's value, re-raising its exception if it failed."""
+        if self.error is not None:
+            raise self.error
+        return self.value  # type: ignore[return-value]
+
+
+class ParallelExecutor:
+    """Run client calls on a thread pool where every worker owns its own HTTP session.
+
+    ``requests.Session`` is not guaranteed to be thread-safe, so each worker thread binds a
+    fresh session to the client on start-up; calls made from that thread use it transparently.
+
+    Used as a context manager the pool stays up across calls. Otherwise every
+    :meth:`map` / :meth:`as_completed` call spins up a pool and tears it down when it finishes.
+
+    Jobs are passed to ``fn`` as keyword arguments when they are mappings, as positional
+    arguments when they are tuples and as a single positional argument otherwise.
+    """
+
+    def __init__(self, client: "BaseHTTPClient", max_workers: int = 10, max_pending: int | None = None) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        self.client = client
+        self.max_workers = max_workers
+        self.max_pending = max_pending if max_pending is not None else max_workers * 2
+        self._executor: ThreadPoolExecutor | None = None
+        self._sessions: list[Session] = []
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} max_workers={self.max_workers}>"
+
+    def __enter__(self) -> Self:
+        self._start()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: types.TracebackType | None,
+    ) -> bool:
+        self.shutdown()
+        return False
+
+    def start(self) -> Self:
+        """Start the pool for use outside a ``with`` block; call :meth:`shutdown` when done."""
+        self._start()
+        return self
+
+    def submit[T](self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> Future[T]:
+        """Schedule a single call. Only available while the executor is open (see :meth:`start`)."""
+        if self._executor is None:
+            raise RuntimeError("submit() requires an open executor; use it as a context manager or call start()")
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def map[T](self, fn: Callable[..., T], jobs: Iterable[Any], *, return_exceptions: bool = False) -> list[Any]:
+        """Run ``fn`` over ``jobs`` and return the results in job order.
+
+        Args:
+            fn: Callable to run, typically a manager method such as ``client.sms.send``.
+            jobs: Arguments for each call.
+            return_exceptions: Place exceptions in the result list instead of raising the first one.
+
+        Returns:
+            list: One result (or exception) per job, in the order the jobs were given.
+        """
+        outcomes = sorted(self.as_completed(fn, jobs), key=lambda outcome: outcome.index)
+        if return_exceptions:
+            return [outcome.value if outcome.ok else outcome.error for outcome in outcomes]
+        return [outcome.result() for outcome in outcomes]
+
+    def as_completed[T](self, fn: Callable[..., T], jobs: Iterable[Any]) -> Iterator[ParallelResult[T]]:
+        """Run ``fn`` over ``jobs`` and yield a :class:`ParallelResult` for each one as it finishes.
+
+        At most ``max_pending`` jobs are submitted ahead of time, so ``jobs`` may be a lazy iterable.
+        """
+        owns_executor = self._executor is None
+        executor = self._start()
+        pending: dict[Future[T], int] = {}
+        try:
+            for index, job in enumerate(jobs):
+                if len(pending) >= self.max_pending:
+                    yield from self._drain(pending, FIRST_COMPLETED)
+                pending[executor.submit(self._invoke, fn, job)] = index
+            while pending:
+                yield from self._drain(pending, FIRST_COMPLETED)
+        finally:
+            for future in pending:
+                future.cancel()
+            if owns_executor:
+                self.shutdown()
+
+    def shutdown(self, wait: bool = True) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+    def _start(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="pysmscenter",
+                    initializer=self._init_worker,
+                )
+            return self._executor
+
+    def _init_worker(self) -> None:
+        session = self.client._bind_thread_session()
+        with self._lock:
+            self._sessions.append(session)
+
+    @staticmethod
+    def _invoke[T](fn: Callable[..., T], job: Any) -> T:
+        if isinstance(job, Mapping):
+            return fn(**job)
+        if isinstance(job, tuple):
+            return fn(*job)
+        return fn(job)
+
+    @staticmethod
+    def _drain[T](pending: dict[Future[T], int], return_when: str) -> Iterator[ParallelResult[T]]:
+        done, _ = wait(pending, return_when=return_when)
+        for future in done:
+            index = pending.pop(future)
+            error = future.exception()
+            if error is not None:
+                yield ParallelResult(index=index, error=error)
+            else:
+                yield ParallelResult(index=index, value=future.result())
@@ -0,0 +1,229 @@
+import asyncio
+import contextlib
+import enum
+import threading
+from collections import deque
+from collections.abc import AsyncGenerator, Generator, Mapping
+from dataclasses import dataclass
+
+from pysmscenter.exceptions import LoadShedError
+
+
+class Priority(enum.IntEnum):
+    """Request lanes, most urgent first."""
+
+    OTP = 0
+    TRANSACTIONAL = 1
+    BULK = 2
+
+
+# Endpoints not listed here run in the transactional lane.
+DEFAULT_PRIORITIES: Mapping[str, Priority] = {
+    "2fa/send": Priority.OTP,
+    "2fa/check": Priority.OTP,
+    "sms/bulk": Priority.BULK,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Lane:
+    """Capacity and queueing limits of one priority lane.
+
+    Args:
+        reserved: Slots only this lane may use, so it is never starved by the others.
+        max_queue: Calls that may wait for a slot; further calls are shed. ``None`` is unbounded.
+        max_wait: Seconds a call may wait for a slot before it is shed. ``None`` waits indefinitely.
+    """
+
+    reserved: int = 0
+    max_queue: int | None = None
+    max_wait: float | None = None
+
+
+DEFAULT_LANES: Mapping[Priority, Lane] = {
+    Priority.OTP: Lane(reserved=2),
+    Priority.TRANSACTIONAL: Lane(reserved=2),
+    Priority.BULK: Lane(),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class LaneStats:
+    in_flight: int
+    waiting: int
+    shed: int
+
+
+class _Waiter:
+    __slots__ = ("granted",)
+
+    def __init__(self) -> None:
+        self.granted = False
+
+    def wake(self) -> None:
+        self.granted = True
+
+
+class _ThreadWaiter(_Waiter):
+    __slots__ = ("event",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.event = threading.Event()
+
+    def wake(self) -> None:
+        super().wake()
+        self.event.set()
+
+
+class _TaskWaiter(_Waiter):
+    __slots__ = ("future", "loop")
+
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        super().__init__()
+        self.loop = loop
+        self.future: asyncio.Future[None] = loop.create_future()
+
+    def wake(self) -> None:
+        super().wake()
+        # Slots may be released from another thread than the one running the waiting loop.
+        self.loop.call_soon_threadsafe(_resolve, self.future)
+
+
+def _resolve(future: asyncio.Future[None]) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+class PriorityScheduler:
+    """Share a client's connections between priority lanes so urgent calls never queue behind bulk ones.
+
+    At most ``capacity`` calls are in flight at once. Each lane owns its ``reserved`` slots and the
+    lanes compete for the rest, which always go to the most urgent waiting call first. With the
+    defaults a campaign can hold at most six of ten slots, leaving two free for 2FA codes and two
+    for other sends however large the campaign is.
+
+    Keep ``capacity`` within the client's connection pool, or calls will queue there again.
+
+    Args:
+        capacity: Calls allowed in flight at the same time.
+        lanes: Limits per lane. Lanes left out get no reserved slots and an unbounded queue.
+        priorities: Lane of each endpoint; other endpoints use the transactional lane.
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10,
+        lanes: Mapping[Priority, Lane] = DEFAULT_LANES,
+        priorities: Mapping[str, Priority] = DEFAULT_PRIORITIES,
+    ) -> None:
+        self.lanes = {priority: lanes.get(priority, Lane()) for priority in Priority}
+        if sum(lane.reserved for lane in self.lanes.values()) > capacity:
+            raise ValueError("Reserved slots exceed the scheduler capacity")
+        self.capacity = capacity
+        self.priorities = dict(priorities)
+        self._lock = threading.Lock()
+        self._in_flight = dict.fromkeys(Priority, 0)
+        self._shed = dict.fromkeys(Priority, 0)
+        self._waiters: dict[Priority, deque[_Waiter]] = {priority: deque() for priority in Priority}
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} capacity={self.capacity} in_flight={sum(self._in_flight.values())}>"
+
+    def priority(self, endpoint: str) -> Priority:
+        return self.priorities.get(endpoint, Priority.TRANSACTIONAL)
+
+    def stats(self) -> dict[Priority, LaneStats]:
+        with self._lock:
+            return {
+                priority: LaneStats(self._in_flight[priority], len(self._waiters[priority]), self._shed[priority])
+                for priority in Priority
+            }
+
+    @contextlib.contextmanager
+    def slot(self, endpoint: str) -> Generator[Priority]:
+        """Hold a slot in the lane of ``endpoint`` for the duration of the block.
+
+        Raises:
+            LoadShedError: If the lane's queue is full or the wait exceeds its ``max_wait``.
+        """
+        priority = self.acquire(endpoint)
+        try:
+            yield priority
+        finally:
+            self.release(priority)
+
+    @contextlib.asynccontextmanager
+    async def slot_async(self, endpoint: str) -> AsyncGenerator[Priority]:
+        """Async counterpart of :meth:`slot`."""
+        priority = await self.acquire_async(endpoint)
+        try:
+            yield priority
+        finally:
+            self.release(priority)
+
+    def acquire(self, endpoint: str) -> Priority:
+        """Block until a slot in the lane of ``endpoint`` is free; every acquire must be released."""
+        priority = self.priority(endpoint)
+        waiter = self._enqueue(priority, _ThreadWaiter())
+        if not waiter.event.wait(self.lanes[priority].max_wait):
+            self._abandon(priority, waiter)
+        return priority
+
+    async def acquire_async(self, endpoint: str) -> Priority:
+        """Wait without blocking the event loop until a slot in the lane of ``endpoint`` is free."""
+        priority = self.priority(endpoint)
+        waiter = self._enqueue(priority, _TaskWaiter(asyncio.get_running_loop()))
+        try:
+            async with asyncio.timeout(self.lanes[priority].max_wait):
+                await waiter.future
+        except TimeoutError:
+            self._abandon(priority, waiter)
+        except asyncio.CancelledError:
+            with self._lock:
+                granted = waiter.granted
+                if not granted:
+                    self._waiters[priority].remove(waiter)
+            if granted:
+                self.release(priority)
+            raise
+        return priority
+
+    def release(self, priority: Priority) -> None:
+        with self._lock:
+            self._in_flight[priority] -= 1
+            self._grant()
+
+    def _enqueue[W: _Waiter](self, priority: Priority, waiter: W) -> W:
+        max_queue = self.lanes[priority].max_queue
+        with self._lock:
+            self._waiters[priority].append(waiter)
+            self._grant()
+            if not waiter.granted and max_queue is not None and len(self._waiters[priority]) > max_queue:
+                self._waiters[priority].remove(waiter)
+                self._shed[priority] += 1
+                raise LoadShedError(f"Too many {priority.name.lower()} calls waiting", priority=priority)
+        return waiter
+
+    def _abandon(self, priority: Priority, waiter: _Waiter) -> None:
+        """Give up on a timed-out wait, unless a slot was granted in the meantime."""
+        with self._lock:
+            if waiter.granted:
+                return
+            self._waiters[priority].remove(waiter)
+            self._shed[priority] += 1
+        raise LoadShedError(f"Timed out waiting for a {priority.name.lower()} slot", priority=priority)
+
+    def _grant(self) -> None:
+        # Lanes are served most urgent first, so a less urgent lane only gets what is left.
+        for priority in Priority:
+            waiters = self._waiters[priority]
+            while waiters and self._admits(priority):
+                self._in_flight[priority] += 1
+                waiters.popleft().wake()
+
+    def _admits(self, priority: Priority) -> bool:
+        if self._in_flight[priority] < self.lanes[priority].reserved:
+            return True
+        held = sum(max(self._in_flight[lane], self.lanes[lane].reserved) for lane in Priority)
+        return held < self.capacity
@@ -0,0 +1,177 @@
+import asyncio
+import email.utils
+import threading
+import time
+from collections.abc import Callable, Mapping
+
+
+def parse_retry_after(value: str | None, now: Callable[[], float] = time.time) -> float | None:
+    """Parse a ``Retry-After`` header into seconds.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP date.
+        now: Wall-clock source used for HTTP dates.
+
+    Returns:
+        Seconds to wait, or None if the header is missing or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - now())
+
+
+class TokenBucket:
+    """Token bucket that adapts its refill rate to throttling signals from the provider.
+
+    The bucket starts at ``rate`` tokens per second. Every throttled response lowers the rate and
+    records it as the observed ceiling, after which successes creep the rate back up to
+    ``headroom`` x ceiling and hold it there, so sustained throughput settles just under the
+    provider limit instead of repeatedly overshooting it. After ``recovery_window`` seconds without
+    throttling the ceiling is relaxed towards ``rate`` again in case the provider limit was raised.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: float | None = None,
+        *,
+        min_rate: float | None = None,
+        decrease_factor: float = 0.7,
+        headroom: float = 0.95,
+        increase_step: float | None = None,
+        recovery_window: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.min_rate = min_rate if min_rate is not None else rate / 100
+        self.decrease_factor = decrease_factor
+        self.headroom = headroom
+        self.increase_step = increase_step if increase_step is not None else rate / 100
+        self.recovery_window = recovery_window
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rate = rate
+        self._ceiling = rate
+        self._tokens = self.capacity
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._last_throttle = float("-inf")
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} rate={self._rate:.2f}/s ceiling={self._ceiling:.2f}/s>"
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def ceiling(self) -> float:
+        return self._ceiling
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take ``tokens`` from the bucket and return how many seconds the caller must wait before using them.
+
+        The tokens are reserved immediately, so concurrent callers queue up behind each other.
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= tokens
+            wait = 0.0 if self._tokens >= 0 else -self._tokens / self._rate
+            return max(wait, self._blocked_until - now)
+
+    def throttled(self, retry_after: float | None = None) -> None:
+        """Record a throttled (HTTP 429) response and slow the bucket down."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._ceiling = min(self._ceiling, self._rate)
+            self._rate = max(self.min_rate, self._rate * self.decrease_factor)
+            self._tokens = min(self._tokens, 0.0)
+            self._last_throttle = now
+            if retry_after is not None:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+
+    def succeeded(self) -> None:
+        """Record a successful response, letting the rate recover towards the observed ceiling."""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if now - self._last_throttle >= self.recovery_window and self._ceiling < self.max_rate:
+                self._ceiling = min(self.max_rate, self._ceiling / self.headroom)
+                self._last_throttle = now
+            target = self._ceiling * self.headroom if self._ceiling < self.max_rate else self.max_rate
+            if self._rate < target:
+                self._rate = min(target, self._rate + self.increase_step)
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self._rate)
+            self._updated = now
+
+
+class RateLimiter:
+    """Per-endpoint token buckets consulted before every API call.
+
+    Args:
+        limits: Requests per second (or a preconfigured :class:`TokenBucket`) keyed by endpoint,
+            e.g. ``{"sms/bulk": 2, "sms/send": 20, "hlr/lookup": 5, "2fa/send": 10}``.
+        default: Requests per second for endpoints without their own budget. ``None`` leaves them unlimited.
+    """
+
+    def __init__(self, limits: Mapping[str, float | TokenBucket] | None = None, default: float | None = None) -> None:
+        self._buckets: dict[str, TokenBucket] = {
+            endpoint: limit if isinstance(limit, TokenBucket) else TokenBucket(limit)
+            for endpoint, limit in (limits or {}).items()
+        }
+        self._default_rate = default
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} endpoints={sorted(self._buckets)!r}>"
+
+    def bucket(self, endpoint: str) -> TokenBucket | None:
+        bucket = self._buckets.get(endpoint)
+        if bucket is None and self._default_rate is not None:
+            with self._lock:
+                bucket = self._buckets.setdefault(endpoint, TokenBucket(self._default_rate))
+        return bucket
+
+    def acquire(self, endpoint: str) -> None:
+        """Block until a token for ``endpoint`` is available."""
+        bucket = self.bucket(endpoint)
+        if bucket is not None:
+            wait = bucket.reserve()
+            if wait > 0:
+                time.sleep(wait)
+
+    async def acquire_async(self, endpoint: str) -> None:
+        """Wait without blocking the event loop until a token for ``endpoint`` is available."""
+        bucket = self.bucket(endpoint)
+        if bucket is not None:
+            wait = bucket.reserve()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+    def throttled(self, endpoint: str, retry_after: float | None = None) -> None:
+        bucket = self.bucket(endpoint)
+        if bucket is not None:
+            bucket.throttled(retry_after)
+
+    def succeeded(self, endpoint: str) -> None:
+        bucket = self.bucket(endpoint)
+        if bucket is not None:
+            bucket.succeeded()
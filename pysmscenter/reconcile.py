@@ -0,0 +1,66 @@
+import datetime
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from pysmscenter.utils import msisdn_key
+
+
+@dataclass(frozen=True, slots=True)
+class HistoryReconciler:
+    """Decide from the single SMS history whether an ambiguous send was accepted by the provider.
+
+    A send is ambiguous when the request may have reached the provider but no usable response came
+    back (a read timeout, a dropped connection, a 5xx). Repeating it blindly risks delivering and
+    billing the message twice, so the client only retries once the history proves no message with the
+    same recipient and text was recorded since the failed attempt started.
+
+    Args:
+        delay: Seconds to wait before reading the history, giving the provider time to record the message.
+        skew: Seconds of clock difference tolerated when comparing history timestamps to the attempt.
+    """
+
+    endpoint: ClassVar[str] = "history/single/list"
+
+    delay: float = 2.0
+    skew: float = 120.0
+
+    def accepted(self, history: Mapping[str, Any], params: Mapping[str, Any], since: float) -> bool:
+        """Return True unless ``history`` proves the send described by ``params`` was not accepted.
+
+        Args:
+            history: Response of ``history/single/list``.
+            params: Parameters of the ambiguous ``sms/send`` or ``sms/bulk`` call.
+            since: Wall-clock time the ambiguous attempt started.
+        """
+        if str(history.get("status")) != "1":
+            return True
+        recipients = {msisdn_key(to) for to in str(params.get("to", "")).split(",") if to.strip()}
+        text = params.get("text")
+        for sms in history.get("sms") or ():
+            if sms.get("text") != text or msisdn_key(str(sms.get("to", ""))) not in recipients:
+                continue
+            sent_at = _parse_timestamp(sms.get("timestamp"))
+            # A message we cannot date could be the one we are looking for.
+            if sent_at is None or sent_at >= since - self.skew:
+                return True
+        return False
+
+
+DEFAULT_RECONCILERS: Mapping[str, HistoryReconciler] = {
+    "sms/send": HistoryReconciler(),
+    "sms/bulk": HistoryReconciler(),
+}
+
+
+def _parse_timestamp(value: Any) -> float | None:
+    if value is None or value == "":
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return None
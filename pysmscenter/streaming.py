@@ -0,0 +1,194 @@
+import codecs
+import json
+from collections.abc import Generator, Iterable, Iterator, Sequence
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+_COMPACT_THRESHOLD = 1 << 16
+
+
+class _NeedData:
+    __slots__ = ()
+
+
+_NEED_DATA = _NeedData()
+
+type _Parse[T] = Generator[Any, None, T]
+
+
+class JSONItemParser:
+    """Incremental JSON parser that emits the items of one container as soon as each is complete.
+
+    ``path`` names the keys leading from the top-level object to the container to stream. If the
+    container is an array every element is emitted; if it is an object every value that is itself an
+    object is emitted (as in ``history/group/list``, whose groups are keyed ``"0"``, ``"1"``, ...).
+    An empty path streams the top-level container. Everything else in the document is parsed normally and
+    collected into :attr:`meta`, mirroring the document's structure, so fields such as ``status`` and
+    ``error`` can be checked once the stream ends.
+
+    Only the item currently being parsed is buffered, so memory stays flat however large the container is.
+
+    Args:
+        path: Keys leading to the container to stream, e.g. ``("group", "contacts")``.
+        meta: Dictionary to collect the non-streamed fields into. A new one is created if omitted.
+    """
+
+    def __init__(self, path: Sequence[str] = (), meta: dict[str, Any] | None = None) -> None:
+        self.path = tuple(path)
+        self.meta: dict[str, Any] = meta if meta is not None else {}
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._scan = json.JSONDecoder().raw_decode
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._done = False
+        self._parser = self._parse()
+
+    def feed(self, data: bytes) -> list[Any]:
+        """Add a chunk of the body and return the items it completed."""
+        if self._pos > _COMPACT_THRESHOLD:
+            self._buffer = self._buffer[self._pos :]
+            self._pos = 0
+        self._buffer += self._text.decode(data)
+        return self._run()
+
+    def close(self) -> list[Any]:
+        """Signal the end of the body and return any remaining items.
+
+        Raises:
+            ValueError: If the document is truncated or malformed.
+        """
+        self._buffer += self._text.decode(b"", final=True)
+        self._eof = True
+        items = self._run()
+        if not self._done:
+            raise ValueError("Incomplete JSON document")
+        return items
+
+    def _run(self) -> list[Any]:
+        items: list[Any] = []
+        while not self._done:
+            try:
+                item = next(self._parser)
+            except StopIteration:
+                self._done = True
+                break
+            if item is _NEED_DATA:
+                break
+            items.append(item)
+        return items
+
+    def _parse(self) -> _Parse[None]:
+        if self.path:
+            yield from self._walk(self.path, self.meta)
+        else:
+            yield from self._stream_container(self.meta, None)
+
+    def _walk(self, path: tuple[str, ...], meta: dict[str, Any]) -> _Parse[None]:
+        yield from self._expect("{")
+        if (yield from self._peek()) == "}":
+            self._pos += 1
+            return
+        while True:
+            key = yield from self._read_value()
+            yield from self._expect(":")
+            if key != path[0]:
+                meta[key] = yield from self._read_value()
+            elif len(path) == 1:
+                yield from self._stream_container(meta, key)
+            elif (yield from self._peek()) == "{":
+                yield from self._walk(path[1:], meta.setdefault(key, {}))
+            else:
+                meta[key] = yield from self._read_value()
+            if (yield from self._separator("}")):
+                return
+
+    def _stream_container(self, meta: dict[str, Any], key: str | None) -> _Parse[None]:
+        opener = yield from self._peek()
+        if opener == "[":
+            self._pos += 1
+            if (yield from self._peek()) == "]":
+                self._pos += 1
+                return
+            while True:
+                yield (yield from self._read_value())
+                if (yield from self._separator("]")):
+                    return
+        elif opener == "{":
+            self._pos += 1
+            scalars = meta if key is None else meta.setdefault(key, {})
+            if (yield from self._peek()) == "}":
+                self._pos += 1
+                return
+            while True:
+                name = yield from self._read_value()
+                yield from self._expect(":")
+                if (yield from self._peek()) == "{":
+                    yield (yield from self._read_value())
+                else:
+                    scalars[name] = yield from self._read_value()
+                if (yield from self._separator("}")):
+                    return
+        elif key is None:
+            raise ValueError("Expected a JSON object or array at the top level")
+        else:
+            meta[key] = yield from self._read_value()
+
+    def _separator(self, closer: str) -> _Parse[bool]:
+        """Consume a ``,`` or ``closer`` and return True when the container is closed."""
+        char = yield from self._peek()
+        self._pos += 1
+        if char == closer:
+            return True
+        if char != ",":
+            raise ValueError(f"Expected ',' or {closer!r} at position {self._pos - 1}, got {char!r}")
+        return False
+
+    def _expect(self, char: str) -> _Parse[None]:
+        found = yield from self._peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r} at position {self._pos}, got {found!r}")
+        self._pos += 1
+
+    def _peek(self) -> _Parse[str]:
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if self._eof:
+                raise ValueError("Unexpected end of JSON document")
+            yield _NEED_DATA
+
+    def _read_value(self) -> _Parse[Any]:
+        yield from self._peek()
+        while True:
+            try:
+                value, end = self._scan(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if self._eof:
+                    raise
+                yield _NEED_DATA
+                continue
+            # A number that runs up to the end of the buffer may continue in the next chunk.
+            if end == len(self._buffer) and not self._eof:
+                yield _NEED_DATA
+                continue
+            self._pos = end
+            return value
+
+
+def iter_json_items(
+    chunks: Iterable[bytes], path: Sequence[str] = (), meta: dict[str, Any] | None = None
+) -> Iterator[Any]:
+    """Stream the items of the container at ``path`` out of a chunked JSON body.
+
+    See :class:`JSONItemParser` for how ``path`` and ``meta`` are interpreted.
+    """
+    parser = JSONItemParser(path, meta)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
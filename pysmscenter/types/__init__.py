@@ -32,7 +32,7 @@ from pysmscenter.types.hlr_types import HLRLookupRawResponse
 from pysmscenter.types.key_types import KeyRawResponse
 from pysmscenter.types.mobile_types import MobileData, MobileRawData
 from pysmscenter.types.purchase_types import PurchaseItem, PurchaseRawResponse
-from pysmscenter.types.sms_types import SMSBulkRawData, SMSCancelRawData, SMSRawData, Timestamp
+from pysmscenter.types.sms_types import SMSBulkItem, SMSBulkRawData, SMSCancelRawData, SMSRawData, Timestamp
 from pysmscenter.types.status_types import StatusRawResponse
 from pysmscenter.types.two_factor_types import TwoFactorCheckResponse, TwoFactorRawResponse
 from pysmscenter.types.user_types import (
@@ -71,6 +71,7 @@ __all__ = [
     "MobileRawData",
     "PurchaseItem",
     "PurchaseRawResponse",
+    "SMSBulkItem",
     "SMSBulkRawData",
     "SMSCancelRawData",
     "SMSRawData",
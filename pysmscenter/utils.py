@@ -40,3 +40,12 @@ def ts2epoch(value: int | datetime.datetime) -> int:
     if value.tzinfo is None:
         value = value.replace(tzinfo=datetime.UTC)
     return int(value.timestamp())
+
+
+# Trailing digits compared when matching numbers across formats.
+_MSISDN_KEY_DIGITS = 10
+
+
+def msisdn_key(value: str) -> str:
+    """Comparison key for a mobile number: "6900000000", "306900000000" and "+30 690 000 0000" share one."""
+    return "".join(char for char in value if char.isdigit())[-_MSISDN_KEY_DIGITS:]
@@ -0,0 +1,8 @@
+import pytest
+
+from pysmscenter.aio import AsyncSMSClient
+
+
+@pytest.fixture
+def async_client() -> AsyncSMSClient:
+    return AsyncSMSClient("test-api-key")
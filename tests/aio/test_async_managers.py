@@ -0,0 +1,109 @@
+import asyncio
+import re
+from typing import Any
+
+import pytest
+
+from pysmscenter.aio import AsyncSMSClient
+from pysmscenter.exceptions import ContactExceptionError, GroupExceptionError, SMSExceptionError
+
+SUCCESS = {"status": "1", "remarks": "Success", "error": "0"}
+
+
+@pytest.mark.parametrize(
+    ("manager", "method", "args", "kwargs", "expected_call"),
+    [
+        ("balance", "check", (), {}, ("GET", "me/balance")),
+        ("purchase", "list", (), {}, ("GET", "purchase/list")),
+        ("history", "single_list", (), {}, ("GET", "history/single/list")),
+        ("history", "group_list", (), {}, ("GET", "history/group/list")),
+        ("status", "get", (), {}, ("GET", "status/get")),
+        ("status", "sms", ("1",), {}, ("GET", "status/sms", {"smsId": "1"})),
+        ("mobile", "check", ("306912345678",), {}, ("GET", "mobile/check", {"mobile": "306912345678"})),
+        ("contact", "list", (), {}, ("GET", "contact/list")),
+        ("contact", "delete", ("12",), {}, ("GET", "contact/delete", {"contactId": "12"})),
+        ("group", "get", ("7",), {}, ("GET", "group/get", {"groupId": "7"})),
+        (
+            "group",
+            "delete_contact",
+            (),
+            {"contact_group_id": "99"},
+            ("GET", "group/deleteContact", {"contactGroupId": "99"}),
+        ),
+        (
+            "sms",
+            "send",
+            (),
+            {"to": "6912345678", "text": "Test message", "sender": "SMSCenter", "ucs": True},
+            ("GET", "sms/send", {"to": "6912345678", "text": "Test message", "from": "SMSCenter", "ucs": "true"}),
+        ),
+        (
+            "sms",
+            "bulk",
+            (),
+            {"to": ["6912345678", "6912345679"], "text": "Bulk test", "sender": "SMSCenter"},
+            ("GET", "sms/bulk", {"to": "6912345678,6912345679", "text": "Bulk test", "from": "SMSCenter"}),
+        ),
+        (
+            "contact",
+            "update",
+            ("12",),
+            {"name": "Updated"},
+            ("GET", "contact/update", {"contactId": "12", "name": "Updated"}),
+        ),
+    ],
+)
+def test_async_manager_calls_match_sync_params(
+    async_client: AsyncSMSClient,
+    mocker: Any,
+    manager: str,
+    method: str,
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    expected_call: tuple[Any, ...],
+) -> None:
+    manager_obj = getattr(async_client, manager)
+    call_mock = mocker.patch.object(manager_obj, "call", return_value=SUCCESS)
+
+    response = asyncio.run(getattr(manager_obj, method)(*args, **kwargs))
+
+    call_mock.assert_awaited_once_with(*expected_call)
+    assert response == SUCCESS
+
+
+def test_async_two_factor_send_params(async_client: AsyncSMSClient, mocker: Any) -> None:
+    call_mock = mocker.patch.object(async_client.two_factor, "call", return_value=SUCCESS)
+
+    asyncio.run(async_client.two_factor.send(to="6912345678", text="Code: %%code%%"))
+
+    call_mock.assert_awaited_once_with("GET", "2fa/send", params={"to": "6912345678", "text": "Code: %%code%%"})
+
+
+@pytest.mark.parametrize(
+    ("manager", "method", "args", "exc"),
+    [
+        ("sms", "send", ("6912345678", "text", "SMSCenter"), SMSExceptionError),
+        ("sms", "cancel", ("123",), SMSExceptionError),
+        ("contact", "get", ("12",), ContactExceptionError),
+        ("group", "add", ("Customers",), GroupExceptionError),
+    ],
+)
+def test_async_manager_raises_domain_errors(
+    async_client: AsyncSMSClient,
+    mocker: Any,
+    manager: str,
+    method: str,
+    args: tuple[Any, ...],
+    exc: type[Exception],
+) -> None:
+    error_response = {"status": "0", "remarks": "Error: Something went wrong", "error": "106"}
+    manager_obj = getattr(async_client, manager)
+    mocker.patch.object(manager_obj, "call", return_value=error_response)
+
+    with pytest.raises(exc, match=re.escape("Error: Something went wrong")):
+        asyncio.run(getattr(manager_obj, method)(*args))
+
+
+def test_async_group_delete_contact_validates_arguments(async_client: AsyncSMSClient) -> None:
+    with pytest.raises(ValueError, match="Either contact_group_id"):
+        asyncio.run(async_client.group.delete_contact(group_id="1"))  # type: ignore[call-overload]
@@ -0,0 +1,211 @@
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+
+from pysmscenter import SMSClient
+from pysmscenter.aio import AsyncSMSClient
+from pysmscenter.aio.client import AsyncSMSAuthClient
+from pysmscenter.exceptions import CredentialError, GroupExceptionError
+from pysmscenter.reconcile import HistoryReconciler
+
+
+def _mock_session(handler: Any) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+class TestAsyncSMSClient:
+    def test_init_requires_api_key(self) -> None:
+        with pytest.raises(CredentialError, match="API key is required"):
+            AsyncSMSClient("")
+
+    def test_repr(self, async_client: AsyncSMSClient) -> None:
+        assert repr(async_client) == f"<AsyncSMSClient base_url={AsyncSMSClient.BASE_URL!r}>"
+
+    def test_setup_managers(self, async_client: AsyncSMSClient) -> None:
+        for manager_cls in AsyncSMSClient.managers:
+            manager = getattr(async_client, manager_cls.name)
+            assert isinstance(manager, manager_cls)
+            assert manager.client is async_client
+
+    def test_manager_surface_matches_sync_client(self) -> None:
+        assert [manager.name for manager in AsyncSMSClient.managers] == [
+            manager.name for manager in SMSClient.managers
+        ]
+
+    def test_fetch_data_sets_defaults_and_drops_none(self, async_client: AsyncSMSClient) -> None:
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"status": "1", "balance": "2", "remarks": "Success", "error": "0"})
+
+        async_client._session = _mock_session(handler)
+
+        result = asyncio.run(
+            async_client.fetch_data("GET", "me/balance", params={"key": "override", "foo": "bar", "skip": None})
+        )
+
+        assert result["balance"] == "2"
+        assert len(requests) == 1
+        assert str(requests[0].url).startswith(AsyncSMSClient.BASE_URL + "me/balance")
+        assert dict(requests[0].url.params) == {"foo": "bar", "type": "json", "key": "test-api-key"}
+
+    def test_fetch_data_raises_credential_error(self, async_client: AsyncSMSClient) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json={"status": 0, "error": 101, "remarks": "Invalid API key"})
+
+        async_client._session = _mock_session(handler)
+
+        with pytest.raises(CredentialError, match="Invalid API key") as exc:
+            asyncio.run(async_client.fetch_data("GET", "me/balance"))
+
+        assert exc.value.code == "101"
+
+    def test_request_retries_retryable_statuses(self) -> None:
+        client = AsyncSMSClient("test-api-key", max_retries=2)
+        client.backoff_factor = 0
+        statuses = iter([503, 429, 200])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(next(statuses), json={"status": "1", "remarks": "Success", "error": "0"})
+
+        client._session = _mock_session(handler)
+
+        result = asyncio.run(client.fetch_data("GET", "me/balance"))
+
+        assert result["status"] == "1"
+
+    def test_request_raises_after_exhausting_retries(self) -> None:
+        client = AsyncSMSClient("test-api-key", max_retries=1)
+        client.backoff_factor = 0
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(503)
+
+        client._session = _mock_session(handler)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(client.fetch_data("GET", "me/balance"))
+
+    def test_aclose_and_context_manager(self, async_client: AsyncSMSClient) -> None:
+        async def run() -> None:
+            async with async_client as entered:
+                assert entered is async_client
+
+        asyncio.run(run())
+
+        assert async_client._closed is True
+        with pytest.raises(RuntimeError, match="Session is closed"):
+            _ = async_client.session
+
+    def test_from_credentials_uses_auth_client(self, mocker: Any) -> None:
+        get_key = mocker.patch.object(
+            AsyncSMSAuthClient,
+            "get_key",
+            return_value={"status": "1", "remarks": "Success", "key": "fake_api_key", "error": "0"},
+        )
+
+        client = asyncio.run(AsyncSMSClient.from_credentials("user", "pass"))
+
+        get_key.assert_called_once_with("user", "pass")
+        assert client.api_key == "fake_api_key"
+
+    def test_from_credentials_raises_when_missing_key(self, mocker: Any) -> None:
+        mocker.patch.object(
+            AsyncSMSAuthClient,
+            "get_key",
+            return_value={"status": "0", "remarks": "Error: Check your credentials", "error": "101"},
+        )
+
+        with pytest.raises(CredentialError, match="Failed to retrieve API key"):
+            asyncio.run(AsyncSMSClient.from_credentials("user", "pass"))
+
+
+class TestAsyncStreamData:
+    @staticmethod
+    async def _collect(iterator: Any) -> list[Any]:
+        return [item async for item in iterator]
+
+    def test_contact_iter(self, async_client: AsyncSMSClient) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.path == "/api/contact/list"
+            return httpx.Response(200, json={"status": "1", "contacts": [{"contactId": "1"}, {"contactId": "2"}]})
+
+        async_client._session = _mock_session(handler)
+
+        contacts = asyncio.run(self._collect(async_client.contact.iter()))
+
+        assert [contact["contactId"] for contact in contacts] == ["1", "2"]
+
+    def test_group_iter_contacts_raises_on_error(self, async_client: AsyncSMSClient) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            assert request.url.params["groupId"] == "7"
+            return httpx.Response(200, json={"status": "0", "error": "304", "remarks": "Invalid group"})
+
+        async_client._session = _mock_session(handler)
+
+        with pytest.raises(GroupExceptionError, match="Invalid group"):
+            asyncio.run(self._collect(async_client.group.iter_contacts("7")))
+
+    def test_history_iter_groups(self, async_client: AsyncSMSClient) -> None:
+        document = {"0": {"groupId": "10"}, "1": {"groupId": "11"}, "status": "1"}
+        async_client._session = _mock_session(lambda request: httpx.Response(200, json=document))
+
+        groups = asyncio.run(self._collect(async_client.history.iter_groups()))
+
+        assert [group["groupId"] for group in groups] == ["10", "11"]
+
+    def test_stream_data_raises_credential_error(self, async_client: AsyncSMSClient) -> None:
+        document = {"status": "0", "error": "101", "remarks": "Invalid key"}
+        async_client._session = _mock_session(lambda request: httpx.Response(200, json=document))
+
+        with pytest.raises(CredentialError, match="Invalid key"):
+            asyncio.run(self._collect(async_client.stream_data("GET", "contact/list", ("contacts",))))
+
+
+class TestAsyncIdempotentRetries:
+    @pytest.mark.parametrize(("endpoint", "expected_calls"), [("me/balance", 3), ("sms/send", 1)])
+    def test_server_errors_only_retried_for_safe_endpoints(self, endpoint: str, expected_calls: int) -> None:
+        client = AsyncSMSClient("test-api-key", max_retries=2)
+        client.backoff_factor = 0
+        calls: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(503)
+
+        client._session = _mock_session(handler)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            asyncio.run(client.fetch_data("GET", endpoint))
+        assert len(calls) == expected_calls
+
+    def test_throttled_send_is_retried(self) -> None:
+        client = AsyncSMSClient("test-api-key", max_retries=1)
+        client.backoff_factor = 0
+        responses = [httpx.Response(429), httpx.Response(200, json={"status": "1", "id": "1"})]
+        client._session = _mock_session(lambda request: responses.pop(0))
+
+        assert asyncio.run(client.fetch_data("GET", "sms/send"))["id"] == "1"
+
+    def test_retries_send_lost_before_acceptance(self) -> None:
+        client = AsyncSMSClient("test-api-key", max_retries=1, reconcile={"sms/send": HistoryReconciler(delay=0)})
+        paths: list[str] = []
+        sent = False
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal sent
+            paths.append(request.url.path)
+            if request.url.path.endswith("history/single/list"):
+                return httpx.Response(200, json={"status": "1", "sms": []})
+            if not sent:
+                sent = True
+                raise httpx.ReadTimeout("timed out", request=request)
+            return httpx.Response(200, json={"status": "1", "id": "1"})
+
+        client._session = _mock_session(handler)
+
+        assert asyncio.run(client.fetch_data("GET", "sms/send", {"to": "6900000000", "text": "hi"}))["id"] == "1"
+        assert paths == ["/api/sms/send", "/api/history/single/list", "/api/sms/send"]
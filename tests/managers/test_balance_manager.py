@@ -1,3 +1,4 @@
+import json
 from typing import Any
 
 import pytest
@@ -40,7 +41,7 @@ class TestBalanceManager:
         }
 
         mock_response = mocker.Mock()
-        mock_response.json.return_value = fake_response
+        mock_response.content = json.dumps(fake_response).encode()
         mock_response.raise_for_status.return_value = None
 
         mocker.patch.object(client.session, "request", return_value=mock_response)
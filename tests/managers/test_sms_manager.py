@@ -44,6 +44,23 @@ class TestSMSManager:
 
         assert response == fake_response
 
+    @pytest.mark.parametrize(
+        ("text", "ucs", "expected"),
+        [
+            ("\u039a\u03b1\u03bb\u03b7\u03bc\u03ad\u03c1\u03b1", None, "true"),
+            ("Plain text {}", None, None),
+            ("\u039a\u03b1\u03bb\u03b7\u03bc\u03ad\u03c1\u03b1", False, "false"),
+        ],
+    )
+    def test_send_sms_detects_ucs(
+        self, client: SMSClient, mocker: Any, text: str, ucs: bool | None, expected: str | None
+    ):
+        call_mock = mocker.patch.object(client.sms, "call", return_value={"status": "1"})
+
+        client.sms.send(to="6912345678", text=text, sender="SMSCenter", ucs=ucs)
+
+        assert call_mock.call_args.args[2].get("ucs") == expected
+
     @pytest.mark.parametrize(
         ("error_code", "error_response"),
         [
@@ -0,0 +1,198 @@
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from pysmscenter import SMSClient
+from pysmscenter.aio import AsyncSMSClient
+from pysmscenter.aio.batching import AsyncBatchingSender
+from pysmscenter.batching import Batch, BatchingSender, batch_key
+from pysmscenter.exceptions import SMSExceptionError
+
+
+def _fake_bulk(rejected: set[str] | None = None) -> Any:
+    def call(method: str, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+        recipients = params["to"].split(",")
+        accepted = [to for to in recipients if to not in (rejected or set())]
+        return {
+            "status": "1",
+            "remarks": "Success",
+            "error": "0",
+            "sms": [{"id": "1", "smsId": f"id-{to}", "msisdn": f"30{to}"} for to in accepted],
+        }
+
+    return call
+
+
+class TestBatch:
+    def test_resolves_each_recipient_by_msisdn(self) -> None:
+        batch: Batch[Any] = Batch({}, 0.0)
+        sinks = [_Sink(), _Sink()]
+        batch.add("6900000000", sinks[0])
+        batch.add("+30 690 000 0001", sinks[1])
+
+        batch.resolve({"sms": [{"smsId": "b", "msisdn": "306900000001"}, {"smsId": "a", "msisdn": "306900000000"}]})
+
+        assert sinks[0].result == {"smsId": "a", "msisdn": "306900000000"}
+        assert sinks[1].result == {"smsId": "b", "msisdn": "306900000001"}
+
+    def test_missing_recipient_gets_error(self) -> None:
+        batch: Batch[Any] = Batch({}, 0.0)
+        sinks = [_Sink(), _Sink()]
+        batch.add("6900000000", sinks[0])
+        batch.add("6900000001", sinks[1])
+
+        batch.resolve({"status": "1", "sms": [{"smsId": "a", "msisdn": "306900000000"}]})
+
+        assert sinks[0].result is not None
+        assert isinstance(sinks[1].error, SMSExceptionError)
+
+    def test_batch_key_ignores_recipient(self) -> None:
+        assert batch_key({"to": "1", "text": "Hi", "from": "S"}) == batch_key({"from": "S", "text": "Hi", "to": "2"})
+        assert batch_key({"text": "Hi"}) != batch_key({"text": "Hi", "flash": 1})
+
+
+class _Sink:
+    def __init__(self) -> None:
+        self.result: Any = None
+        self.error: BaseException | None = None
+
+    def done(self) -> bool:
+        return self.result is not None or self.error is not None
+
+    def set_result(self, result: Any) -> None:
+        self.result = result
+
+    def set_exception(self, exception: BaseException) -> None:
+        self.error = exception
+
+
+class TestBatchingSender:
+    def test_concurrent_sends_share_one_bulk_call(self, client: SMSClient, mocker: Any) -> None:
+        call = mocker.patch.object(client.sms, "call", side_effect=_fake_bulk())
+        recipients = [f"69{index:08d}" for index in range(5)]
+        results: dict[str, Any] = {}
+
+        with BatchingSender(client, max_delay=0.2) as sender:
+            barrier = threading.Barrier(len(recipients))
+
+            def send(to: str) -> None:
+                barrier.wait()
+                results[to] = sender.send(to, "Hello", "Sender")
+
+            threads = [threading.Thread(target=send, args=(to,)) for to in recipients]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert call.call_count == 1
+        assert call.call_args.args[1] == "sms/bulk"
+        assert sorted(call.call_args.args[2]["to"].split(",")) == recipients
+        assert {to: result.get("smsId") for to, result in results.items()} == {to: f"id-{to}" for to in recipients}
+
+    def test_different_messages_are_not_merged(self, client: SMSClient, mocker: Any) -> None:
+        call = mocker.patch.object(client.sms, "call", side_effect=_fake_bulk())
+
+        sender = BatchingSender(client, max_delay=10)
+        first = sender.submit("6900000000", "Hello", "Sender")
+        second = sender.submit("6900000001", "Hello", "Sender", flash=True)
+        sender.close()
+
+        assert first.result().get("smsId") == "id-6900000000"
+        assert second.result().get("smsId") == "id-6900000001"
+        assert call.call_count == 2
+
+    def test_full_batch_is_sent_without_waiting(self, client: SMSClient, mocker: Any) -> None:
+        mocker.patch.object(client.sms, "call", side_effect=_fake_bulk())
+
+        with BatchingSender(client, max_delay=60, max_batch=2) as sender:
+            futures = [sender.submit(f"69{index:08d}", "Hello", "Sender") for index in range(2)]
+
+            assert [future.result(timeout=5).get("smsId") for future in futures] == ["id-6900000000", "id-6900000001"]
+
+    def test_repeated_recipient_starts_a_new_batch(self, client: SMSClient, mocker: Any) -> None:
+        call = mocker.patch.object(client.sms, "call", side_effect=_fake_bulk())
+
+        sender = BatchingSender(client, max_delay=10)
+        first = sender.submit("6900000000", "Hello", "Sender")
+        second = sender.submit("+306900000000", "Hello", "Sender")
+        sender.close()
+
+        assert first.result().get("smsId") == "id-6900000000"
+        assert second.result().get("smsId") == "id-+306900000000"
+        assert call.call_count == 2
+
+    def test_rejected_recipient_and_failed_batch(self, client: SMSClient, mocker: Any) -> None:
+        mocker.patch.object(client.sms, "call", side_effect=_fake_bulk(rejected={"6900000001"}))
+
+        sender = BatchingSender(client, max_delay=10)
+        accepted = sender.submit("6900000000", "Hello", "Sender")
+        rejected = sender.submit("6900000001", "Hello", "Sender")
+        sender.close()
+
+        assert accepted.result().get("smsId") == "id-6900000000"
+        with pytest.raises(SMSExceptionError, match="6900000001"):
+            rejected.result()
+
+        mocker.patch.object(client.sms, "call", return_value={"status": "0", "remarks": "Failure", "error": "200"})
+        sender = BatchingSender(client, max_delay=10)
+        failed = sender.submit("6900000000", "Hello", "Sender")
+        sender.close()
+
+        with pytest.raises(SMSExceptionError):
+            failed.result()
+
+    def test_closed_sender_refuses_sends(self, client: SMSClient) -> None:
+        sender = BatchingSender(client)
+        sender.close()
+
+        with pytest.raises(RuntimeError, match="closed"):
+            sender.submit("6900000000", "Hello", "Sender")
+
+
+class TestAsyncBatchingSender:
+    def test_concurrent_sends_share_one_bulk_call(self, mocker: Any) -> None:
+        async_client = AsyncSMSClient("test-api-key")
+        fake = _fake_bulk(rejected={"6900000002"})
+
+        async def call(method: str, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+            await asyncio.sleep(0)
+            return fake(method, endpoint, params)
+
+        mock_call = mocker.patch.object(async_client.sms, "call", side_effect=call)
+        recipients = [f"69{index:08d}" for index in range(3)]
+
+        async def main() -> list[Any]:
+            sender = AsyncBatchingSender(async_client, max_delay=0.01)
+            try:
+                return await asyncio.gather(
+                    *(sender.send(to, "Hello", "Sender") for to in recipients), return_exceptions=True
+                )
+            finally:
+                await sender.aclose()
+
+        results = asyncio.run(main())
+
+        assert mock_call.call_count == 1
+        assert [result.get("smsId") for result in results[:2]] == ["id-6900000000", "id-6900000001"]
+        assert isinstance(results[2], SMSExceptionError)
+
+    def test_full_batch_and_flush_on_close(self, mocker: Any) -> None:
+        async_client = AsyncSMSClient("test-api-key")
+        fake = _fake_bulk()
+
+        async def call(method: str, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+            return fake(method, endpoint, params)
+
+        mock_call = mocker.patch.object(async_client.sms, "call", side_effect=call)
+
+        async def main() -> list[Any]:
+            sender = AsyncBatchingSender(async_client, max_delay=60, max_batch=2)
+            futures = [sender.submit(f"69{index:08d}", "Hello", "Sender") for index in range(3)]
+            await sender.aclose()
+            return [future.result().get("smsId") for future in futures]
+
+        assert asyncio.run(main()) == ["id-6900000000", "id-6900000001", "id-6900000002"]
+        assert mock_call.call_count == 2
@@ -0,0 +1,156 @@
+import asyncio
+from decimal import Decimal
+from typing import Any
+from urllib.parse import quote
+
+import pytest
+
+from pysmscenter import SMSClient
+from pysmscenter.aio import AsyncSMSClient
+from pysmscenter.bulk import CampaignSummary, chunk_recipients
+from pysmscenter.exceptions import SMSExceptionError
+
+GREEK_TEXT = "Γειά σου κόσμε "  # noqa: RUF001
+
+
+def _bulk_response(recipients: list[str], rejected: set[str] | None = None) -> dict[str, Any]:
+    accepted = [recipient for recipient in recipients if recipient not in (rejected or set())]
+    return {
+        "status": "1",
+        "remarks": "Success",
+        "error": "0",
+        "sms": [{"id": "1", "smsId": str(index), "msisdn": f"30{to}"} for index, to in enumerate(accepted)],
+        "accepted": str(len(accepted)),
+        "rejected": str(len(recipients) - len(accepted)),
+        "cost": f"{len(accepted) * 0.03:.2f}",
+        "balance": "100",
+    }
+
+
+def _fake_bulk(rejected: set[str] | None = None, fail: set[str] | None = None) -> Any:
+    def call(method: str, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+        recipients = params["to"].split(",")
+        if fail and fail & set(recipients):
+            return {"status": "0", "remarks": "Failure", "error": "200"}
+        return _bulk_response(recipients, rejected)
+
+    return call
+
+
+class TestChunkRecipients:
+    def test_chunks_by_count(self) -> None:
+        chunks = list(chunk_recipients((f"69{index:08d}" for index in range(5)), chunk_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+    def test_chunks_by_url_length(self) -> None:
+        number_length = len("6900000000")
+        separator = len(quote(","))
+        limit = 100 + 3 * number_length + 2 * separator
+
+        chunks = list(chunk_recipients(["6900000000"] * 7, base_length=100, max_url_length=limit))
+
+        assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+
+    def test_skips_blank_recipients(self) -> None:
+        assert list(chunk_recipients([" 6900000000 ", "", "  "])) == [["6900000000"]]
+
+    def test_oversized_recipient_is_sent_alone(self) -> None:
+        assert list(chunk_recipients(["6900000000", "6900000001"], base_length=100, max_url_length=50)) == [
+            ["6900000000"],
+            ["6900000001"],
+        ]
+
+    def test_rejects_invalid_chunk_size(self) -> None:
+        with pytest.raises(ValueError, match="chunk_size"):
+            list(chunk_recipients(["6900000000"], chunk_size=0))
+
+
+class TestCampaignSummary:
+    def test_merges_chunks_and_identifies_rejected(self) -> None:
+        summary = CampaignSummary()
+
+        summary.add(["6900000000", "6900000001"], _bulk_response(["6900000000", "6900000001"], {"6900000001"}))
+        summary.add(["6900000002"], _bulk_response(["6900000002"]))
+
+        assert summary.chunks == 2
+        assert summary.accepted == 2
+        assert summary.rejected == 1
+        assert summary.cost == Decimal("0.06")
+        assert summary.balance == "100"
+        assert summary.rejected_recipients == ["6900000001"]
+        assert len(summary.sms) == 2
+        assert not summary.ok
+
+    def test_failed_chunk_is_reported(self) -> None:
+        summary = CampaignSummary()
+        error = SMSExceptionError("Failure")
+
+        summary.add_failure(["6900000000"], error)
+
+        assert summary.rejected_recipients == ["6900000000"]
+        assert summary.failures[0].error is error
+
+    def test_response_without_msisdns_does_not_guess(self) -> None:
+        summary = CampaignSummary()
+
+        summary.add(["6900000000"], {"status": "1", "id": ["1"], "cost": "0.03"})
+
+        assert summary.rejected_recipients == []
+        assert summary.ok
+
+
+class TestBulkStream:
+    def test_sends_chunks_and_merges_results(self, client: SMSClient, mocker: Any) -> None:
+        call = mocker.patch.object(client.sms, "call", side_effect=_fake_bulk(rejected={"6900000003"}))
+        recipients = (f"69{index:08d}" for index in range(10))
+
+        summary = client.sms.bulk_stream(recipients, "Hello", "Sender", chunk_size=4, max_in_flight=2)
+
+        assert call.call_count == 3
+        assert {call.args[1] for call in call.call_args_list} == {"sms/bulk"}
+        assert call.call_args_list[0].args[2]["text"] == "Hello"
+        assert call.call_args_list[0].args[2]["from"] == "Sender"
+        assert summary.chunks == 3
+        assert summary.accepted == 9
+        assert summary.rejected_recipients == ["6900000003"]
+
+    def test_failed_chunk_does_not_stop_campaign(self, client: SMSClient, mocker: Any) -> None:
+        mocker.patch.object(client.sms, "call", side_effect=_fake_bulk(fail={"6900000000"}))
+
+        summary = client.sms.bulk_stream(["6900000000", "6900000001"], "Hello", "Sender", chunk_size=1)
+
+        assert summary.accepted == 1
+        assert summary.rejected_recipients == ["6900000000"]
+        assert isinstance(summary.failures[0].error, SMSExceptionError)
+
+    def test_url_length_accounts_for_text(self, client: SMSClient, mocker: Any) -> None:
+        call = mocker.patch.object(client.sms, "call", side_effect=_fake_bulk())
+        text = GREEK_TEXT * 20
+
+        client.sms.bulk_stream([f"69{index:08d}" for index in range(100)], text, "Sender", max_url_length=2500)
+
+        assert call.call_count > 1
+        for recorded in call.call_args_list:
+            query_length = client.sms._bulk_base_length(client, {**recorded.args[2], "to": ""})
+            assert query_length + len(quote(recorded.args[2]["to"], safe="")) <= 2500
+
+    def test_async_bulk_stream(self, mocker: Any) -> None:
+        async_client = AsyncSMSClient("test-api-key")
+        fake = _fake_bulk(rejected={"6900000001"})
+
+        async def call(method: str, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+            await asyncio.sleep(0)
+            return fake(method, endpoint, params)
+
+        mock_call = mocker.patch.object(async_client.sms, "call", side_effect=call)
+
+        summary = asyncio.run(
+            async_client.sms.bulk_stream(
+                (f"69{index:08d}" for index in range(5)), "Hello", "Sender", chunk_size=2, max_in_flight=2
+            )
+        )
+
+        assert mock_call.call_count == 3
+        assert summary.accepted == 4
+        assert summary.rejected_recipients == ["6900000001"]
@@ -0,0 +1,156 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from pysmscenter import SMSClient
+from pysmscenter.aio import AsyncSMSClient
+from pysmscenter.cache import ResponseCache, TTLCache
+
+SUCCESS = {"status": "1", "remarks": "Success", "error": "0"}
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+class TestTTLCache:
+    def test_miss_then_hit(self, clock: FakeClock) -> None:
+        cache = TTLCache(clock=clock)
+
+        assert cache.get("GET", "me/balance") is None
+        cache.update("GET", "me/balance", None, {**SUCCESS, "balance": "5"})
+
+        assert cache.get("GET", "me/balance") == {**SUCCESS, "balance": "5"}
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_ratio == 0.5
+
+    def test_entries_expire_after_ttl(self, clock: FakeClock) -> None:
+        cache = TTLCache(ttls={"me/balance": 10}, clock=clock)
+        cache.update("GET", "me/balance", None, SUCCESS)
+
+        clock.now = 9.9
+        assert cache.get("GET", "me/balance") is not None
+        clock.now = 10
+        assert cache.get("GET", "me/balance") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self, clock: FakeClock) -> None:
+        cache = TTLCache(maxsize=2, clock=clock)
+        for group_id in ("1", "2"):
+            cache.update("GET", "group/get", {"groupId": group_id}, SUCCESS)
+        cache.get("GET", "group/get", {"groupId": "1"})
+
+        cache.update("GET", "group/get", {"groupId": "3"}, SUCCESS)
+
+        assert cache.get("GET", "group/get", {"groupId": "1"}) is not None
+        assert cache.get("GET", "group/get", {"groupId": "2"}) is None
+        assert cache.stats.evictions == 1
+
+    def test_uncacheable_endpoints_and_errors_are_skipped(self, clock: FakeClock) -> None:
+        cache = TTLCache(clock=clock)
+        cache.update("GET", "history/single/list", None, SUCCESS)
+        cache.update("GET", "contact/get", {"contactId": "1"}, {"status": "0", "error": "301", "remarks": "x"})
+
+        assert cache.get("GET", "history/single/list") is None
+        assert cache.get("GET", "contact/get", {"contactId": "1"}) is None
+        assert len(cache) == 0
+
+    def test_api_key_is_not_part_of_the_key(self, clock: FakeClock) -> None:
+        cache = TTLCache(clock=clock)
+        cache.update("GET", "group/list", {"key": "a"}, SUCCESS)
+
+        assert cache.get("GET", "group/list", {"key": "b"}) == SUCCESS
+
+    @pytest.mark.parametrize("mutation", ["contact/add", "contact/update", "contact/delete"])
+    def test_contact_mutations_invalidate_contact_reads(self, clock: FakeClock, mutation: str) -> None:
+        cache = TTLCache(clock=clock)
+        cache.update("GET", "contact/list", None, SUCCESS)
+        cache.update("GET", "contact/get", {"contactId": "7"}, SUCCESS)
+        cache.update("GET", "group/list", None, SUCCESS)
+
+        cache.update("GET", mutation, {"contactId": "7"}, SUCCESS)
+
+        assert cache.get("GET", "contact/list") is None
+        assert cache.get("GET", "contact/get", {"contactId": "7"}) is None
+        assert cache.get("GET", "group/list") is not None
+
+    def test_group_add_contact_only_invalidates_that_group(self, clock: FakeClock) -> None:
+        cache = TTLCache(clock=clock)
+        cache.update("GET", "group/get", {"groupId": "1"}, SUCCESS)
+        cache.update("GET", "group/get", {"groupId": "2"}, SUCCESS)
+
+        cache.update("GET", "group/addContact", {"groupId": "1", "contactId": "9"}, SUCCESS)
+
+        assert cache.get("GET", "group/get", {"groupId": "1"}) is None
+        assert cache.get("GET", "group/get", {"groupId": "2"}) is not None
+        assert cache.stats.invalidations == 1
+
+    def test_delete_contact_by_link_id_invalidates_every_group(self, clock: FakeClock) -> None:
+        cache = TTLCache(clock=clock)
+        cache.update("GET", "group/get", {"groupId": "1"}, SUCCESS)
+        cache.update("GET", "group/get", {"groupId": "2"}, SUCCESS)
+
+        cache.update("GET", "group/deleteContact", {"contactGroupId": "55"}, SUCCESS)
+
+        assert len(cache) == 0
+
+    def test_clear(self, clock: FakeClock) -> None:
+        cache = TTLCache(clock=clock)
+        cache.update("GET", "me/balance", None, SUCCESS)
+
+        cache.clear()
+
+        assert len(cache) == 0
+
+    def test_rejects_invalid_maxsize(self) -> None:
+        with pytest.raises(ValueError, match="maxsize"):
+            TTLCache(maxsize=0)
+
+    def test_base_class_requires_storage(self) -> None:
+        with pytest.raises(NotImplementedError):
+            ResponseCache().get("GET", "me/balance")
+
+
+class TestClientCache:
+    def test_repeated_reads_hit_the_network_once(self, mocker: Any) -> None:
+        client = SMSClient("test-api-key", cache=TTLCache())
+        request = mocker.patch.object(client, "_request", return_value={**SUCCESS, "balance": "3"})
+
+        first = client.balance.check()
+        second = client.balance.check()
+
+        assert first == second
+        request.assert_called_once()
+
+    def test_mutation_invalidates_on_the_same_client(self, mocker: Any) -> None:
+        client = SMSClient("test-api-key", cache=TTLCache())
+        request = mocker.patch.object(client, "_request", return_value={**SUCCESS, "contacts": []})
+
+        client.contact.list()
+        client.contact.add(mobile="306912345678", name="John")
+        client.contact.list()
+
+        assert [call.args[1] for call in request.call_args_list] == ["contact/list", "contact/add", "contact/list"]
+
+    def test_async_client_uses_cache(self, mocker: Any) -> None:
+        client = AsyncSMSClient("test-api-key", cache=TTLCache())
+        request = mocker.patch.object(client, "_request", return_value={**SUCCESS, "groups": []})
+
+        async def run() -> None:
+            await client.group.list()
+            await client.group.list()
+
+        asyncio.run(run())
+
+        assert request.await_count == 1
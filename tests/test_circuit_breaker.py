@@ -0,0 +1,197 @@
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+from requests import ConnectionError as RequestConnectionError, HTTPError
+
+from pysmscenter import SMSClient
+from pysmscenter.aio import AsyncSMSClient
+from pysmscenter.circuit_breaker import CircuitBreaker, CircuitBreakers, CircuitState
+from pysmscenter.exceptions import CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def _http_error(mocker: Any, status: int) -> HTTPError:
+    response = mocker.Mock()
+    response.status_code = status
+    return HTTPError(response=response)
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_within_window(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=3, window=10, clock=clock)
+
+        for _ in range(2):
+            breaker.acquire()
+            breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+        breaker.acquire()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+
+    def test_failures_outside_window_are_forgotten(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=2, window=10, clock=clock)
+
+        breaker.record_failure()
+        clock.now = 11
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_open_circuit_fails_fast(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+
+        with pytest.raises(CircuitOpenError) as exc_info:
+            breaker.acquire()
+
+        assert exc_info.value.retry_after == pytest.approx(20)
+
+    def test_half_open_limits_probes_and_closes_after_successes(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, half_open_max_calls=2, clock=clock)
+        breaker.record_failure()
+        clock.now = 30
+
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.acquire()
+        breaker.acquire()
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()
+
+        breaker.record_success()
+        assert breaker.state is CircuitState.HALF_OPEN
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_failed_probe_reopens(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now = 30
+        breaker.acquire()
+
+        breaker.record_failure()
+
+        assert breaker.state is CircuitState.OPEN
+        clock.now = 59
+        with pytest.raises(CircuitOpenError):
+            breaker.acquire()
+
+    def test_listeners_receive_transitions(self, clock: FakeClock) -> None:
+        transitions: list[tuple[str, CircuitState, CircuitState]] = []
+        breaker = CircuitBreaker(
+            "send",
+            failure_threshold=1,
+            reset_timeout=5,
+            on_state_change=lambda breaker, old, new: transitions.append((breaker.name, old, new)),
+            clock=clock,
+        )
+
+        breaker.record_failure()
+        clock.now = 5
+        breaker.acquire()
+        breaker.record_success()
+
+        assert transitions == [
+            ("send", CircuitState.CLOSED, CircuitState.OPEN),
+            ("send", CircuitState.OPEN, CircuitState.HALF_OPEN),
+            ("send", CircuitState.HALF_OPEN, CircuitState.CLOSED),
+        ]
+
+    def test_reset(self, clock: FakeClock) -> None:
+        breaker = CircuitBreaker(failure_threshold=1, clock=clock)
+        breaker.record_failure()
+
+        breaker.reset()
+
+        assert breaker.state is CircuitState.CLOSED
+        breaker.acquire()
+
+    @pytest.mark.parametrize(("failure_threshold", "half_open_max_calls"), [(0, 1), (1, 0)])
+    def test_rejects_invalid_settings(self, failure_threshold: int, half_open_max_calls: int) -> None:
+        with pytest.raises(ValueError, match="must be at least 1"):
+            CircuitBreaker(failure_threshold=failure_threshold, half_open_max_calls=half_open_max_calls)
+
+
+class TestCircuitBreakers:
+    def test_routes_endpoints_to_groups(self) -> None:
+        breakers = CircuitBreakers({"send": ["sms/send", "sms/bulk"]})
+
+        assert breakers.breaker("sms/bulk") is breakers["send"]
+        assert breakers.breaker("me/balance") is breakers["default"]
+        assert breakers.states == {"send": CircuitState.CLOSED, "default": CircuitState.CLOSED}
+
+    def test_factory_configures_each_group(self) -> None:
+        breakers = CircuitBreakers({"send": ["sms/send"]}, factory=lambda name: CircuitBreaker(name, 1))
+
+        breakers.breaker("sms/send").record_failure()
+
+        assert breakers.states == {"send": CircuitState.OPEN, "default": CircuitState.CLOSED}
+
+
+class TestClientCircuitBreaker:
+    def test_outages_open_the_circuit(self, mocker: Any) -> None:
+        client = SMSClient("test-api-key", circuit_breaker=CircuitBreaker(failure_threshold=2))
+        request = mocker.patch.object(
+            client, "_request", side_effect=[RequestConnectionError(), _http_error(mocker, 503)]
+        )
+
+        for error in (RequestConnectionError, HTTPError):
+            with pytest.raises(error):
+                client.fetch_data("GET", "me/balance")
+        with pytest.raises(CircuitOpenError):
+            client.fetch_data("GET", "me/balance")
+
+        assert request.call_count == 2
+
+    def test_client_errors_do_not_count(self, mocker: Any) -> None:
+        breaker = CircuitBreaker(failure_threshold=1)
+        client = SMSClient("test-api-key", circuit_breaker=breaker)
+        mocker.patch.object(client, "_request", side_effect=_http_error(mocker, 400))
+
+        with pytest.raises(HTTPError):
+            client.fetch_data("GET", "me/balance")
+
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_groups_isolate_failures(self, mocker: Any) -> None:
+        breakers = CircuitBreakers({"send": ["sms/send"]}, factory=lambda name: CircuitBreaker(name, 1))
+        client = SMSClient("test-api-key", circuit_breaker=breakers)
+        mocker.patch.object(client, "_request", side_effect=[RequestConnectionError(), {"status": "1"}])
+
+        with pytest.raises(RequestConnectionError):
+            client.fetch_data("GET", "sms/send")
+
+        assert client.fetch_data("GET", "me/balance") == {"status": "1"}
+        with pytest.raises(CircuitOpenError):
+            client.fetch_data("GET", "sms/send")
+
+    def test_async_client_fails_fast(self) -> None:
+        client = AsyncSMSClient("test-api-key", circuit_breaker=CircuitBreaker(failure_threshold=1))
+        calls: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            raise httpx.ConnectTimeout("timed out", request=request)
+
+        client._session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        with pytest.raises(httpx.ConnectTimeout):
+            asyncio.run(client.fetch_data("GET", "me/balance"))
+        with pytest.raises(CircuitOpenError):
+            asyncio.run(client.fetch_data("GET", "me/balance"))
+        assert len(calls) == 1
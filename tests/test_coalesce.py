@@ -0,0 +1,148 @@
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from pysmscenter import SMSClient
+from pysmscenter.aio import AsyncSMSClient
+from pysmscenter.coalesce import SingleFlight
+from pysmscenter.exceptions import SMSClientError
+
+BALANCE = {"status": "1", "balance": "42", "remarks": "Success", "error": "0"}
+
+
+class TestSingleFlightKey:
+    def test_key_ignores_api_key_and_param_order(self) -> None:
+        flight = SingleFlight()
+
+        first = flight.key("GET", "group/get", {"groupId": "1", "type": "json", "key": "a"})
+        second = flight.key("get", "group/get", {"type": "json", "groupId": "1", "key": "b"})
+
+        assert first is not None
+        assert first == second
+
+    @pytest.mark.parametrize("endpoint", ["sms/send", "sms/bulk", "contact/add", "2fa/send", "status/get"])
+    def test_side_effect_endpoints_are_never_coalesced(self, endpoint: str) -> None:
+        assert SingleFlight().key("GET", endpoint, {"to": "1"}) is None
+
+    def test_custom_allowlist(self) -> None:
+        flight = SingleFlight(endpoints={"me/balance"})
+
+        assert flight.key("GET", "me/balance") is not None
+        assert flight.key("GET", "contact/list") is None
+
+
+class TestSingleFlightDo:
+    def test_concurrent_callers_share_one_call(self) -> None:
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = 0
+
+        def fetch() -> dict[str, str]:
+            nonlocal calls
+            calls += 1
+            release.wait(timeout=5)
+            return BALANCE
+
+        results: list[Any] = []
+        threads = [threading.Thread(target=lambda: results.append(flight.do("k", fetch))) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        while flight.coalesced < 7:
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert calls == 1
+        assert results == [BALANCE] * 8
+
+    def test_errors_reach_every_waiter(self) -> None:
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def fetch() -> None:
+            release.wait(timeout=5)
+            raise SMSClientError("down")
+
+        errors: list[BaseException] = []
+
+        def worker() -> None:
+            try:
+                flight.do("k", fetch)
+            except SMSClientError as exc:
+                errors.append(exc)
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        while flight.coalesced < 2:
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(errors) == 3
+
+    def test_sequential_calls_are_not_cached(self) -> None:
+        flight = SingleFlight()
+        calls = 0
+
+        def fetch() -> int:
+            nonlocal calls
+            calls += 1
+            return calls
+
+        assert flight.do("k", fetch) == 1
+        assert flight.do("k", fetch) == 2
+
+    def test_do_async_shares_one_call(self) -> None:
+        flight = SingleFlight()
+        calls = 0
+
+        async def fetch() -> dict[str, str]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return BALANCE
+
+        async def run() -> list[dict[str, str]]:
+            return await asyncio.gather(*(flight.do_async("k", fetch) for _ in range(10)))
+
+        assert asyncio.run(run()) == [BALANCE] * 10
+        assert calls == 1
+        assert flight.coalesced == 9
+
+
+class TestClientCoalescing:
+    def test_disabled_by_default(self, client: SMSClient) -> None:
+        assert client.single_flight is None
+
+    def test_fetch_data_routes_reads_through_single_flight(self, mocker: Any) -> None:
+        client = SMSClient("test-api-key", coalesce=True)
+        assert client.single_flight is not None
+        do = mocker.spy(client.single_flight, "do")
+        mocker.patch.object(client, "_request", return_value=BALANCE)
+
+        client.balance.check()
+        client.sms.send(to="6912345678", text="hi", sender="MyApp")
+
+        do.assert_called_once()
+        assert do.call_args.args[0] == ("me/balance", ())
+
+    def test_async_client_coalesces_concurrent_reads(self, mocker: Any) -> None:
+        client = AsyncSMSClient("test-api-key", coalesce=True)
+
+        async def slow_request(*args: Any, **kwargs: Any) -> dict[str, str]:
+            await asyncio.sleep(0.01)
+            return BALANCE
+
+        request = mocker.patch.object(client, "_request", side_effect=slow_request)
+
+        async def run() -> None:
+            await asyncio.gather(*(client.balance.check() for _ in range(5)))
+
+        asyncio.run(run())
+
+        assert request.await_count == 1
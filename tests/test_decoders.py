@@ -0,0 +1,69 @@
+import json
+from typing import Any
+
+import pytest
+
+from pysmscenter import SMSClient
+from pysmscenter.decoders import get_decoder, stdlib_loads
+
+GREEK_TEXT = "Γειά σου"  # noqa: RUF001
+PAYLOAD = {"status": "1", "remarks": "Success", "error": "0", "sms": [{"smsId": "1", "text": GREEK_TEXT}]}
+BODY = json.dumps(PAYLOAD, ensure_ascii=False).encode()
+
+
+def _block_imports(mocker: Any, *blocked: str) -> None:
+    real_import = __import__("importlib").import_module
+
+    def import_module(name: str, package: str | None = None) -> Any:
+        if name.split(".", maxsplit=1)[0] in blocked:
+            raise ImportError(name)
+        return real_import(name, package)
+
+    mocker.patch("pysmscenter.decoders.importlib.import_module", side_effect=import_module)
+
+
+class TestGetDecoder:
+    @pytest.mark.parametrize("name", ["auto", "json", "orjson", "msgspec"])
+    def test_backends_parse_utf8_bytes(self, name: str) -> None:
+        if name in {"orjson", "msgspec"}:
+            pytest.importorskip(name)
+
+        assert get_decoder(name)(BODY) == PAYLOAD
+
+    def test_auto_falls_back_to_stdlib(self, mocker: Any) -> None:
+        _block_imports(mocker, "orjson", "msgspec")
+
+        assert get_decoder("auto") is stdlib_loads
+
+    def test_auto_prefers_orjson(self, mocker: Any) -> None:
+        orjson = pytest.importorskip("orjson")
+
+        assert get_decoder("auto") is orjson.loads
+
+    def test_explicit_missing_backend_raises(self, mocker: Any) -> None:
+        _block_imports(mocker, "orjson")
+
+        with pytest.raises(ImportError):
+            get_decoder("orjson")
+
+    def test_unknown_backend(self) -> None:
+        with pytest.raises(ValueError, match="Unknown JSON decoder"):
+            get_decoder("yaml")
+
+    def test_callable_is_used_as_is(self) -> None:
+        def decoder(data: bytes) -> Any:
+            return {"raw": data}
+
+        assert get_decoder(decoder) is decoder
+
+
+class TestClientDecoder:
+    def test_request_decodes_response_content(self, mocker: Any) -> None:
+        decoder = mocker.Mock(return_value=PAYLOAD)
+        client = SMSClient("test-api-key", decoder=decoder)
+        response = mocker.Mock(content=BODY)
+        client._session = mocker.Mock(request=mocker.Mock(return_value=response))
+
+        assert client.fetch_data("GET", "history/single/list") == PAYLOAD
+        decoder.assert_called_once_with(BODY)
+        response.json.assert_not_called()
@@ -0,0 +1,147 @@
+from decimal import Decimal
+from typing import Any
+
+import pytest
+
+from pysmscenter import SMSClient
+from pysmscenter.encoding import (
+    CostTable,
+    Encoding,
+    GSM7_BASIC,
+    GSM7_EXTENSION,
+    Transliterator,
+    analyze,
+    requires_ucs,
+    transliterate,
+)
+
+GREEK_LOWER = "καλημέρα"
+GREEK_UPPER_GSM = "ΔΦΓΛΩΠΨΣΘΞ"
+GREEK_ALPHA = "\u03b1"
+GREEK_NOTICE = "Καλημέρα σας, η παραγγελία σας έχει αποσταλεί και θα παραδοθεί αύριο το πρωί στη διεύθυνσή σας."
+
+
+class TestAnalyze:
+    def test_tables(self) -> None:
+        assert len(GSM7_BASIC) == 127
+        assert not set(GSM7_BASIC) & set(GSM7_EXTENSION)
+
+    @pytest.mark.parametrize(
+        ("text", "encoding", "length", "segments", "remaining"),
+        [
+            ("", Encoding.GSM7, 0, 1, 160),
+            ("Hello", Encoding.GSM7, 5, 1, 155),
+            ("a" * 160, Encoding.GSM7, 160, 1, 0),
+            ("a" * 161, Encoding.GSM7, 161, 2, 145),
+            ("a" * 306, Encoding.GSM7, 306, 2, 0),
+            ("€" * 80, Encoding.GSM7, 160, 1, 0),
+            (GREEK_UPPER_GSM, Encoding.GSM7, 10, 1, 150),
+            (GREEK_LOWER, Encoding.UCS2, 8, 1, 62),
+            ("x" * 70 + GREEK_ALPHA, Encoding.UCS2, 71, 2, 63),
+            ("\U0001f600" * 35, Encoding.UCS2, 70, 1, 0),
+        ],
+    )
+    def test_segments(self, text: str, encoding: Encoding, length: int, segments: int, remaining: int) -> None:
+        info = analyze(text)
+
+        assert (info.encoding, info.length, info.segments, info.remaining) == (encoding, length, segments, remaining)
+
+    def test_escape_sequence_is_not_split_across_segments(self) -> None:
+        # 152 septets, then a two-septet character that does not fit in the first segment's last septet.
+        info = analyze("a" * 152 + "{" + "a" * 10)
+
+        assert info.length == 164
+        assert info.segments == 2
+        assert info.remaining == 153 - 12
+
+    def test_surrogate_pair_is_not_split_across_segments(self) -> None:
+        info = analyze(GREEK_ALPHA * 66 + "\U0001f600" + GREEK_ALPHA * 10)
+
+        assert info.length == 78
+        assert info.segments == 2
+        assert info.remaining == 67 - 12
+
+    def test_requires_ucs(self) -> None:
+        assert requires_ucs(GREEK_LOWER)
+        assert not requires_ucs("Price: 10€ [50% off]")
+
+
+class TestCostTable:
+    def test_learns_prices_from_mobile_check(self) -> None:
+        table = CostTable()
+
+        table.learn({"status": "1", "mobile": {"cost": 3, "countryCode": 30, "msisdn": "306900000000"}})
+
+        assert table.price("+30 690 000 0000") == Decimal(3)
+        assert table.price("447700900000") is None
+
+    def test_longest_prefix_wins(self) -> None:
+        table = CostTable({"30": 3, "3069": "2.5"}, default=Decimal(9))
+
+        assert table.price("306900000000") == Decimal("2.5")
+        assert table.price("302100000000") == Decimal(3)
+        assert table.price("447700900000") == Decimal(9)
+
+    def test_ignores_responses_without_a_price(self) -> None:
+        table = CostTable()
+
+        table.learn({"status": "0", "error": "100"})
+
+        assert len(table) == 0
+
+    def test_estimate(self) -> None:
+        table = CostTable({"30": 3})
+
+        estimate = table.estimate(["306900000000", "306900000001", "447700900000"], "a" * 161)
+
+        assert estimate.messages == 3
+        assert estimate.segments == 6
+        assert estimate.cost == Decimal(12)
+        assert estimate.unpriced == ["447700900000"]
+        assert not estimate.complete
+
+    def test_estimate_messages(self) -> None:
+        table = CostTable({"30": 1})
+
+        estimate = table.estimate_messages([("306900000000", "Hi"), ("306900000001", GREEK_LOWER * 10)])
+
+        assert estimate.segments == 3
+        assert estimate.cost == Decimal(3)
+        assert estimate.complete
+
+
+class TestTransliteration:
+    def test_uppercases_and_deaccents_greek(self) -> None:
+        assert transliterate("Καλημέρα, Γιώργο! ΐ ϋ ς") == "KAΛHMEPA, ΓIΩPΓO! I Y Σ"
+
+    def test_polytonic_and_punctuation(self) -> None:
+        assert transliterate("ᾠδή «test» \u2014 \u2026") == 'ΩΔH "test" - ...'
+
+    def test_latin_text_is_untouched(self) -> None:
+        assert transliterate("Hello {name} 10€") == "Hello {name} 10€"
+
+    def test_output_fits_gsm7(self) -> None:
+        assert not requires_ucs(transliterate(GREEK_NOTICE))
+
+    def test_rewrites_only_when_segments_are_saved(self) -> None:
+        transliterator = Transliterator()
+
+        assert transliterator("Καλημέρα") == "Καλημέρα"
+        assert not requires_ucs(transliterator(GREEK_NOTICE))
+        assert transliterator.stats.messages == 2
+        assert transliterator.stats.rewritten == 1
+        assert transliterator.stats.segments_saved == 1
+
+    def test_always_rewrite(self) -> None:
+        assert Transliterator(only_if_shorter=False)("Καλημέρα") == "KAΛHMEPA"
+
+    def test_client_applies_transliteration(self, mocker: Any) -> None:
+        client = SMSClient("test-api-key", transliterate=True)
+        call = mocker.patch.object(client.sms, "call", return_value={"status": "1"})
+
+        client.sms.send("6900000000", GREEK_NOTICE, "Sender")
+
+        assert not requires_ucs(call.call_args.args[2]["text"])
+        assert "ucs" not in call.call_args.args[2]
+        assert client.transliterator is not None
+        assert client.transliterator.stats.segments_saved == 1
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+from typing import Any
+
+import httpx
+import pytest
+
+from pysmscenter import SMSClient
+from pysmscenter.aio import AsyncSMSClient
+from pysmscenter.hedging import HedgePolicy
+
+
+class TestHedgePolicy:
+    def test_fixed_delay(self) -> None:
+        assert HedgePolicy(delay=0.2).hedge_delay("hlr/lookup") == 0.2
+
+    def test_adaptive_delay_uses_observed_quantile(self) -> None:
+        policy = HedgePolicy(quantile=0.9, initial_delay=5.0, min_samples=10)
+
+        for latency in range(1, 10):
+            policy.observe("hlr/lookup", latency / 10)
+        assert policy.hedge_delay("hlr/lookup") == 5.0
+
+        policy.observe("hlr/lookup", 1.0)
+        assert policy.hedge_delay("hlr/lookup") == pytest.approx(1.0)
+        assert policy.hedge_delay("mobile/check") == 5.0
+
+    def test_sample_size_bounds_history(self) -> None:
+        policy = HedgePolicy(quantile=1.0, min_samples=1, sample_size=2)
+
+        for latency in (9.0, 1.0, 2.0):
+            policy.observe("status/sms", latency)
+
+        assert policy.hedge_delay("status/sms") == 2.0
+
+    def test_budget_caps_hedge_rate(self) -> None:
+        policy = HedgePolicy(max_hedge_ratio=0.25, burst=1)
+
+        hedged = 0
+        for _ in range(100):
+            policy.admit()
+            hedged += policy.try_hedge()
+
+        assert hedged == 25
+        assert policy.stats.requests == 100
+        assert policy.stats.hedge_ratio == 0.25
+
+    def test_applies_only_to_configured_endpoints(self) -> None:
+        policy = HedgePolicy()
+
+        assert policy.applies("hlr/lookup")
+        assert not policy.applies("sms/send")
+
+    @pytest.mark.parametrize(("quantile", "ratio"), [(0.0, 0.1), (0.95, 1.5)])
+    def test_rejects_invalid_settings(self, quantile: float, ratio: float) -> None:
+        with pytest.raises(ValueError, match="must be in"):
+            HedgePolicy(quantile=quantile, max_hedge_ratio=ratio)
+
+
+class TestSyncHedging:
+    def test_slow_call_is_hedged_and_hedge_wins(self, mocker: Any) -> None:
+        policy = HedgePolicy(delay=0.01)
+        client = SMSClient("test-api-key", hedging=policy)
+        release = threading.Event()
+        calls: list[str] = []
+
+        def request(method: str, endpoint: str, params: Any = None) -> dict[str, Any]:
+            calls.append(endpoint)
+            if len(calls) == 1:
+                release.wait(5)
+                return {"status": "1", "attempt": "primary"}
+            return {"status": "1", "attempt": "hedge"}
+
+        mocker.patch.object(client, "_request", side_effect=request)
+
+        try:
+            assert client.fetch_data("GET", "hlr/lookup", {"mobile": "306900000000"})["attempt"] == "hedge"
+        finally:
+            release.set()
+            client.close()
+
+        assert calls == ["hlr/lookup", "hlr/lookup"]
+        assert policy.stats.hedges == 1
+        assert policy.stats.hedge_wins == 1
+
+    def test_fast_call_is_not_hedged(self, mocker: Any) -> None:
+        policy = HedgePolicy(delay=5)
+        client = SMSClient("test-api-key", hedging=policy)
+        request = mocker.patch.object(client, "_request", return_value={"status": "1"})
+
+        with client:
+            assert client.fetch_data("GET", "mobile/check") == {"status": "1"}
+
+        request.assert_called_once()
+        assert policy.stats.hedges == 0
+
+    def test_other_endpoints_are_not_hedged(self, mocker: Any) -> None:
+        client = SMSClient("test-api-key", hedging=HedgePolicy(delay=0))
+        hedged = mocker.patch.object(client, "_request_hedged")
+        mocker.patch.object(client, "_request", return_value={"status": "1"})
+
+        client.fetch_data("GET", "sms/send")
+
+        hedged.assert_not_called()
+
+    def test_error_is_raised_when_every_attempt_fails(self, mocker: Any) -> None:
+        client = SMSClient("test-api-key", hedging=HedgePolicy(delay=5))
+        mocker.patch.object(client, "_request", side_effect=ConnectionError("down"))
+
+        with client, pytest.raises(ConnectionError, match="down"):
+            client.fetch_data("GET", "status/sms")
+
+
+class TestAsyncHedging:
+    def test_hedge_wins_and_loser_is_cancelled(self) -> None:
+        policy = HedgePolicy(delay=0.01)
+        client = AsyncSMSClient("test-api-key", hedging=policy)
+        cancelled = False
+        calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal cancelled, calls
+            calls += 1
+            if calls == 1:
+                try:
+                    await asyncio.sleep(5)
+                except asyncio.CancelledError:
+                    cancelled = True
+                    raise
+            return httpx.Response(200, json={"status": "1", "attempt": str(calls)})
+
+        client._session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        result = asyncio.run(client.fetch_data("GET", "hlr/lookup"))
+
+        assert result["attempt"] == "2"
+        assert cancelled
+        assert policy.stats.hedge_wins == 1
+
+    def test_budget_exhausted_waits_for_primary(self) -> None:
+        policy = HedgePolicy(delay=0, max_hedge_ratio=0, burst=0)
+        client = AsyncSMSClient("test-api-key", hedging=policy)
+        calls = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={"status": "1"})
+
+        client._session = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+        assert asyncio.run(client.fetch_data("GET", "mobile/check")) == {"status": "1"}
+        assert calls == 1
+        assert policy.stats.hedges == 0
@@ -0,0 +1,156 @@
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+from typing import Any
+
+import pytest
+
+from pysmscenter import SMSClient
+from pysmscenter.aio import AsyncSMSClient
+from pysmscenter.exceptions import ContactExceptionError
+from pysmscenter.merge import MergeGrouper, MessageTemplate, contact_rows, merge_chunks
+
+NAMEDAY_TEMPLATE = "Χρόνια πολλά {vname}!"
+NAMEDAY_GIORGO = "Χρόνια πολλά Γιώργο!"
+
+
+def _contacts() -> list[dict[str, str]]:
+    return [
+        {"mobile": "6900000000", "vname": "Γιώργο"},
+        {"mobile": "6900000001", "vname": "Μαρία"},
+        {"mobile": "6900000002", "vname": "Γιώργο"},
+        {"mobile": "", "vname": "Νίκο"},
+    ]
+
+
+def _fake_bulk(method: str, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+    recipients = params["to"].split(",")
+    return {
+        "status": "1",
+        "sms": [{"smsId": to, "msisdn": f"30{to}"} for to in recipients],
+        "accepted": str(len(recipients)),
+        "cost": "0.03",
+    }
+
+
+class TestMessageTemplate:
+    def test_renders_fields(self) -> None:
+        template = MessageTemplate(NAMEDAY_TEMPLATE)
+
+        assert template.render({"vname": "Γιώργο", "name": "Γιώργος"}) == NAMEDAY_GIORGO
+        assert template.fields == {"vname"}
+
+    def test_missing_fields_use_default(self) -> None:
+        template = MessageTemplate("Hi {name}{surname}", default="friend")
+
+        assert template.render({"surname": ""}) == "Hi friendfriend"
+
+    def test_format_spec_and_conversion(self) -> None:
+        assert MessageTemplate("{name!r:>8}|{smscost:.2f}").render({"name": "Ann", "smscost": 0.5}) == "   'Ann'|0.50"
+
+    @pytest.mark.parametrize("template", ["Hi {}", "Hi {0}", "Hi {contact.name}", "Hi {names[0]}"])
+    def test_rejects_non_field_placeholders(self, template: str) -> None:
+        with pytest.raises(ValueError, match="contact field"):
+            MessageTemplate(template)
+
+
+class TestMergeGrouper:
+    def test_groups_identical_texts(self) -> None:
+        grouper = MergeGrouper(MessageTemplate(NAMEDAY_TEMPLATE), lambda text: 0)
+
+        chunks = list(merge_chunks(_contacts(), grouper))
+
+        assert sorted(chunks) == sorted(
+            [(NAMEDAY_GIORGO, ["6900000000", "6900000002"]), ("Χρόνια πολλά Μαρία!", ["6900000001"])]
+        )
+
+    def test_full_groups_are_emitted_while_streaming(self) -> None:
+        grouper = MergeGrouper(MessageTemplate("Hi"), lambda text: 0, chunk_size=2)
+        seen: list[int] = []
+
+        def contacts() -> Iterator[dict[str, str]]:
+            for index in range(5):
+                seen.append(index)
+                yield {"mobile": f"69{index:08d}"}
+
+        chunks = merge_chunks(contacts(), grouper)
+
+        assert next(chunks) == ("Hi", ["6900000000", "6900000001"])
+        assert seen == [0, 1]
+        assert [chunk for _, chunk in chunks] == [["6900000002", "6900000003"], ["6900000004"]]
+
+    def test_long_text_splits_by_url_length(self) -> None:
+        grouper = MergeGrouper(MessageTemplate("{text}"), len, max_url_length=30)
+
+        chunks = grouper.feed({"mobile": "6900000000", "text": "x" * 20}) + grouper.close()
+        chunks += grouper.feed({"mobile": "6900000001", "text": "y" * 15})
+        chunks += grouper.feed({"mobile": "6900000002", "text": "y" * 15}) + grouper.close()
+
+        assert [len(chunk) for _, chunk in chunks] == [1, 1, 1]
+
+    def test_contact_rows_accepts_list_response(self) -> None:
+        assert list(contact_rows({"status": "1", "contacts": [{"mobile": "1"}]})) == [{"mobile": "1"}]
+
+        with pytest.raises(ContactExceptionError):
+            contact_rows({"status": "0", "error": "100", "remarks": "Failure"})
+
+
+class TestSmsMerge:
+    def test_sends_one_call_per_distinct_text(self, client: SMSClient, mocker: Any) -> None:
+        call = mocker.patch.object(client.sms, "call", side_effect=_fake_bulk)
+
+        summary = client.sms.merge(NAMEDAY_TEMPLATE, _contacts(), "Sender", ucs=True)
+
+        assert call.call_count == 2
+        sent = {recorded.args[2]["text"]: recorded.args[2]["to"] for recorded in call.call_args_list}
+        assert sent[NAMEDAY_GIORGO] == "6900000000,6900000002"
+        assert {recorded.args[2]["ucs"] for recorded in call.call_args_list} == {"true"}
+        assert summary.accepted == 3
+        assert summary.ok
+
+    def test_contacts_from_group(self, client: SMSClient, mocker: Any) -> None:
+        iter_contacts = mocker.patch.object(client.group, "iter_contacts", return_value=iter(_contacts()))
+        call = mocker.patch.object(client.sms, "call", side_effect=_fake_bulk)
+
+        summary = client.sms.merge(NAMEDAY_TEMPLATE, "7", "Sender")
+
+        iter_contacts.assert_called_once_with("7")
+        assert call.call_count == 2
+        assert summary.accepted == 3
+
+    def test_contacts_from_list_response(self, client: SMSClient, mocker: Any) -> None:
+        call = mocker.patch.object(client.sms, "call", side_effect=_fake_bulk)
+
+        client.sms.merge("Hello {name}", {"status": "1", "contacts": [{"mobile": "6900000000", "name": "A"}]}, "S")
+
+        assert call.call_args.args[2]["text"] == "Hello A"
+
+    def test_async_merge_from_group(self, mocker: Any) -> None:
+        async_client = AsyncSMSClient("test-api-key")
+
+        async def contacts(group_id: str) -> AsyncIterator[dict[str, str]]:
+            for contact in _contacts():
+                yield contact
+
+        async def call(method: str, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+            return _fake_bulk(method, endpoint, params)
+
+        mocker.patch.object(async_client.group, "iter_contacts", side_effect=contacts)
+        mock_call = mocker.patch.object(async_client.sms, "call", side_effect=call)
+
+        summary = asyncio.run(async_client.sms.merge(NAMEDAY_TEMPLATE, "7", "Sender"))
+
+        assert mock_call.call_count == 2
+        assert summary.accepted == 3
+
+    def test_async_merge_from_iterable(self, mocker: Any) -> None:
+        async_client = AsyncSMSClient("test-api-key")
+
+        async def call(method: str, endpoint: str, params: dict[str, Any]) -> dict[str, Any]:
+            return _fake_bulk(method, endpoint, params)
+
+        mock_call = mocker.patch.object(async_client.sms, "call", side_effect=call)
+
+        summary = asyncio.run(async_client.sms.merge("Hi {vname}", _contacts(), "Sender", chunk_size=1))
+
+        assert mock_call.call_count == 3
+        assert summary.chunks == 3
@@ -0,0 +1,168 @@
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+import pytest
+from requests import ConnectionError as RequestConnectionError
+
+from pysmscenter import SMSClient
+from pysmscenter.outbox import Outbox, OutboxState
+from pysmscenter.reconcile import HistoryReconciler
+
+ACCEPTED = {"status": "1", "id": "123", "cost": "1", "balance": "10"}
+EMPTY_HISTORY = {"status": "1", "sms": []}
+
+
+def _history(to: str, text: str) -> dict[str, Any]:
+    return {"status": "1", "sms": [{"to": to, "text": text}]}
+
+
+def _outbox(client: SMSClient, path: Path, **kwargs: Any) -> Outbox:
+    options: dict[str, Any] = {"workers": 2, "retry_delay": 0, "reconciler": HistoryReconciler(delay=0), **kwargs}
+    return Outbox(client, path / "outbox.db", **options)
+
+
+def _mark_in_flight(path: Path) -> None:
+    with sqlite3.connect(path / "outbox.db") as db:
+        db.execute("UPDATE outbox SET state = 'in_flight', attempts = 1, started_at = created_at")
+
+
+class TestOutbox:
+    def test_sends_and_records_acceptance(self, client: SMSClient, mocker: Any, tmp_path: Path) -> None:
+        call = mocker.patch.object(client.sms, "call", return_value=ACCEPTED)
+
+        with _outbox(client, tmp_path) as outbox:
+            futures = [outbox.enqueue(f"69{index:08d}", "Hello", "Sender") for index in range(5)]
+            assert outbox.drain(timeout=5)
+            messages = outbox.messages()
+
+            assert sorted(future.result() for future in futures) == [message.id for message in messages]
+            assert call.call_count == 5
+            assert call.call_args.args[:2] == ("GET", "sms/send")
+            assert {message.state for message in messages} == {OutboxState.ACCEPTED}
+            assert messages[0].sms_id == "123"
+            assert messages[0].cost == "1"
+            assert messages[0].attempts == 1
+
+    def test_rejected_message_is_dead_lettered(self, client: SMSClient, mocker: Any, tmp_path: Path) -> None:
+        mocker.patch.object(client.sms, "call", return_value={"status": "0", "error": "103", "remarks": "Bad"})
+
+        with _outbox(client, tmp_path) as outbox:
+            outbox.enqueue("6900000000", "Hello", "Sender")
+            assert outbox.drain(timeout=5)
+            counts = outbox.counts()
+
+            assert counts[OutboxState.DEAD_LETTER] == 1
+
+    def test_failures_are_retried_until_max_attempts(self, client: SMSClient, mocker: Any, tmp_path: Path) -> None:
+        call = mocker.patch.object(client.sms, "call", side_effect=ValueError("bad json"))
+
+        with _outbox(client, tmp_path, max_attempts=3) as outbox:
+            outbox.enqueue("6900000000", "Hello", "Sender")
+            assert outbox.drain(timeout=5)
+            [message] = outbox.messages()
+
+            assert call.call_count == 3
+            assert message.state is OutboxState.DEAD_LETTER
+            assert message.attempts == 3
+            assert message.error is not None
+            assert "bad json" in message.error
+
+    def test_ambiguous_failure_is_resent_once_history_proves_it_lost(
+        self, client: SMSClient, mocker: Any, tmp_path: Path
+    ) -> None:
+        call = mocker.patch.object(client.sms, "call", side_effect=[RequestConnectionError("reset"), ACCEPTED])
+        mocker.patch.object(client, "_request", return_value=EMPTY_HISTORY)
+
+        with _outbox(client, tmp_path) as outbox:
+            outbox.enqueue("6900000000", "Hello", "Sender")
+            assert outbox.drain(timeout=5)
+            [message] = outbox.messages()
+
+            assert call.call_count == 2
+            assert message.state is OutboxState.ACCEPTED
+            assert message.sms_id == "123"
+
+    def test_ambiguous_failure_found_in_history_is_not_resent(
+        self, client: SMSClient, mocker: Any, tmp_path: Path
+    ) -> None:
+        call = mocker.patch.object(client.sms, "call", side_effect=RequestConnectionError("reset"))
+        mocker.patch.object(client, "_request", return_value=_history("6900000000", "Hello"))
+
+        with _outbox(client, tmp_path) as outbox:
+            outbox.enqueue("6900000000", "Hello", "Sender")
+            assert outbox.drain(timeout=5)
+            [message] = outbox.messages()
+
+            assert call.call_count == 1
+            assert message.state is OutboxState.ACCEPTED
+            assert message.sms_id is None
+
+    def test_unconfirmed_send_is_dead_lettered(self, client: SMSClient, mocker: Any, tmp_path: Path) -> None:
+        mocker.patch.object(client.sms, "call", side_effect=RequestConnectionError("reset"))
+        mocker.patch.object(client, "_request", side_effect=RequestConnectionError("still down"))
+
+        with _outbox(client, tmp_path) as outbox:
+            outbox.enqueue("6900000000", "Hello", "Sender")
+            assert outbox.drain(timeout=5)
+            [message] = outbox.messages()
+
+            assert message.state is OutboxState.DEAD_LETTER
+            assert message.error is not None
+            assert "could not be confirmed" in message.error
+
+    def test_retry_dead_letters(self, client: SMSClient, mocker: Any, tmp_path: Path) -> None:
+        mocker.patch.object(client.sms, "call", side_effect=[{"status": "0", "error": "103"}, ACCEPTED])
+
+        with _outbox(client, tmp_path) as outbox:
+            outbox.enqueue("6900000000", "Hello", "Sender")
+            assert outbox.drain(timeout=5)
+
+            assert outbox.retry_dead_letters() == 1
+            assert outbox.drain(timeout=5)
+            [message] = outbox.messages()
+
+            assert message.state is OutboxState.ACCEPTED
+
+
+class TestOutboxRecovery:
+    def test_queued_messages_survive_a_restart(self, client: SMSClient, mocker: Any, tmp_path: Path) -> None:
+        call = mocker.patch.object(client.sms, "call", return_value=ACCEPTED)
+        outbox = _outbox(client, tmp_path)
+        outbox.enqueue("6900000000", "Hello", "Sender")
+        outbox.close()
+
+        assert call.call_count == 0
+        with _outbox(client, tmp_path) as reopened:
+            assert reopened.drain(timeout=5)
+            assert reopened.counts()[OutboxState.ACCEPTED] == 1
+
+    @pytest.mark.parametrize(
+        ("history", "expected_calls", "expected_state"),
+        [
+            (EMPTY_HISTORY, 1, OutboxState.ACCEPTED),
+            (_history("6900000000", "Hello"), 0, OutboxState.ACCEPTED),
+        ],
+    )
+    def test_in_flight_messages_are_reconciled_on_start(
+        self,
+        client: SMSClient,
+        mocker: Any,
+        tmp_path: Path,
+        history: dict[str, Any],
+        expected_calls: int,
+        expected_state: OutboxState,
+    ) -> None:
+        call = mocker.patch.object(client.sms, "call", return_value=ACCEPTED)
+        mocker.patch.object(client, "_request", return_value=history)
+        outbox = _outbox(client, tmp_path)
+        outbox.enqueue("6900000000", "Hello", "Sender")
+        outbox.close()
+        _mark_in_flight(tmp_path)
+
+        with _outbox(client, tmp_path) as reopened:
+            assert reopened.drain(timeout=5)
+            [message] = reopened.messages()
+
+            assert call.call_count == expected_calls
+            assert message.state is expected_state
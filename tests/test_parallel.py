@@ -0,0 +1,111 @@
+import threading
+import time
+from typing import Any
+
+import pytest
+
+from pysmscenter import SMSClient
+from pysmscenter.exceptions import SMSExceptionError
+from pysmscenter.parallel import ParallelExecutor, ParallelResult
+
+
+def _echo(value: int) -> int:
+    time.sleep(0.001 * (5 - value % 5))
+    return value * 2
+
+
+def _fail_on_three(value: int) -> int:
+    if value == 3:
+        raise SMSExceptionError("boom", code="106")
+    return value
+
+
+class TestParallelExecutor:
+    def test_client_parallel_returns_executor(self, client: SMSClient) -> None:
+        executor = client.parallel(max_workers=4)
+
+        assert isinstance(executor, ParallelExecutor)
+        assert executor.client is client
+        assert executor.max_workers == 4
+
+    def test_rejects_invalid_worker_count(self, client: SMSClient) -> None:
+        with pytest.raises(ValueError, match="max_workers"):
+            client.parallel(max_workers=0)
+
+    def test_map_preserves_job_order(self, client: SMSClient) -> None:
+        assert client.parallel(max_workers=4).map(_echo, range(20)) == [value * 2 for value in range(20)]
+
+    def test_map_raises_first_error_in_order(self, client: SMSClient) -> None:
+        with pytest.raises(SMSExceptionError, match="boom"):
+            client.parallel(max_workers=4).map(_fail_on_three, range(6))
+
+    def test_map_return_exceptions(self, client: SMSClient) -> None:
+        results = client.parallel(max_workers=4).map(_fail_on_three, range(5), return_exceptions=True)
+
+        assert results[:3] == [0, 1, 2]
+        assert isinstance(results[3], SMSExceptionError)
+        assert results[4] == 4
+
+    def test_as_completed_yields_every_job(self, client: SMSClient) -> None:
+        outcomes = list(client.parallel(max_workers=3).as_completed(_fail_on_three, range(10)))
+
+        assert sorted(outcome.index for outcome in outcomes) == list(range(10))
+        failed = [outcome for outcome in outcomes if not outcome.ok]
+        assert len(failed) == 1
+        assert failed[0].index == 3
+        with pytest.raises(SMSExceptionError):
+            failed[0].result()
+
+    def test_jobs_unpack_mappings_and_tuples(self, client: SMSClient) -> None:
+        def join(a: str, b: str = "-") -> str:
+            return a + b
+
+        results = client.parallel(max_workers=2).map(join, [{"a": "x", "b": "y"}, ("p", "q"), "z"])
+
+        assert results == ["xy", "pq", "z-"]
+
+    def test_manager_calls_use_per_thread_sessions(self, client: SMSClient, mocker: Any) -> None:
+        sessions: dict[int, Any] = {}
+        lock = threading.Lock()
+
+        def request(*args: Any, **kwargs: Any) -> Any:
+            with lock:
+                sessions[threading.get_ident()] = client.session
+            response = mocker.Mock()
+            response.content = b'{"status": "1", "remarks": "Success", "error": "0", "id": "1"}'
+            return response
+
+        def build_session() -> Any:
+            session = mocker.Mock()
+            session.request.side_effect = request
+            return session
+
+        mocker.patch.object(client, "_build_session", side_effect=build_session)
+
+        jobs = [{"to": f"69123456{i:02d}", "text": "hi", "sender": "MyApp"} for i in range(12)]
+        worker_sessions: list[Any] = []
+        with client.parallel(max_workers=3) as executor:
+            results = executor.map(client.sms.send, jobs)
+            worker_sessions.extend(executor._sessions)
+
+        assert len(results) == 12  # pyright: ignore[reportPossiblyUnboundVariable]
+        used = list(sessions.values())
+        assert client._session not in used
+        assert len({id(session) for session in used}) == len(used)
+        assert all(session in worker_sessions for session in used)
+        for session in worker_sessions:
+            session.close.assert_called_once_with()
+
+    def test_submit_requires_context_manager(self, client: SMSClient) -> None:
+        executor = client.parallel(max_workers=1)
+
+        with pytest.raises(RuntimeError, match="context manager"):
+            executor.submit(_echo, 1)
+
+        with executor:
+            assert executor.submit(_echo, 2).result() == 4
+
+    def test_parallel_result_result(self) -> None:
+        assert ParallelResult(index=0, value=5).result() == 5
+        with pytest.raises(ValueError, match="bad"):
+            ParallelResult(index=1, error=ValueError("bad")).result()
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+from typing import Any
+
+import pytest
+
+from pysmscenter import SMSClient
+from pysmscenter.aio.client import AsyncSMSClient
+from pysmscenter.exceptions import LoadShedError
+from pysmscenter.priority import Lane, Priority, PriorityScheduler
+
+BALANCE = {"status": "1", "balance": "10"}
+
+
+def _wait_for(predicate: Any) -> None:
+    for _ in range(1000):
+        if predicate():
+            return
+        threading.Event().wait(0.001)
+    raise AssertionError("condition not reached")
+
+
+class TestPriorityScheduler:
+    def test_lanes_by_endpoint(self) -> None:
+        scheduler = PriorityScheduler()
+
+        assert scheduler.priority("2fa/send") is Priority.OTP
+        assert scheduler.priority("sms/bulk") is Priority.BULK
+        assert scheduler.priority("sms/send") is Priority.TRANSACTIONAL
+
+    def test_bulk_cannot_take_reserved_slots(self) -> None:
+        scheduler = PriorityScheduler(
+            capacity=4, lanes={Priority.OTP: Lane(reserved=1), Priority.BULK: Lane(max_queue=0)}
+        )
+
+        for _ in range(3):
+            scheduler.acquire("sms/bulk")
+        with pytest.raises(LoadShedError) as exc_info:
+            scheduler.acquire("sms/bulk")
+
+        assert exc_info.value.priority is Priority.BULK
+        assert scheduler.acquire("2fa/send") is Priority.OTP
+        assert scheduler.stats()[Priority.BULK].shed == 1
+
+    def test_most_urgent_waiter_is_served_first(self) -> None:
+        scheduler = PriorityScheduler(capacity=1, lanes={})
+        scheduler.acquire("sms/bulk")
+        order: list[Priority] = []
+
+        def wait(endpoint: str) -> None:
+            with scheduler.slot(endpoint) as priority:
+                order.append(priority)
+
+        threads = [threading.Thread(target=wait, args=(endpoint,)) for endpoint in ("sms/bulk", "2fa/send")]
+        for thread in threads:
+            thread.start()
+            _wait_for(lambda: sum(lane.waiting for lane in scheduler.stats().values()) == len(order) + 1)
+        scheduler.release(Priority.BULK)
+        for thread in threads:
+            thread.join(timeout=5)
+
+        assert order == [Priority.OTP, Priority.BULK]
+        assert scheduler.stats()[Priority.BULK].in_flight == 0
+
+    def test_wait_timeout_sheds(self) -> None:
+        scheduler = PriorityScheduler(capacity=1, lanes={Priority.BULK: Lane(max_wait=0.01)})
+        scheduler.acquire("sms/send")
+
+        with pytest.raises(LoadShedError, match="Timed out"):
+            scheduler.acquire("sms/bulk")
+
+        assert scheduler.stats()[Priority.BULK].waiting == 0
+
+    def test_rejects_over_reservation(self) -> None:
+        with pytest.raises(ValueError, match="exceed"):
+            PriorityScheduler(capacity=1, lanes={Priority.OTP: Lane(reserved=2)})
+
+    def test_async_slots(self) -> None:
+        scheduler = PriorityScheduler(capacity=1, lanes={})
+
+        async def run() -> list[Priority]:
+            order: list[Priority] = []
+
+            async def wait(endpoint: str) -> None:
+                async with scheduler.slot_async(endpoint) as priority:
+                    order.append(priority)
+
+            await scheduler.acquire_async("sms/bulk")
+            tasks = [asyncio.create_task(wait(endpoint)) for endpoint in ("sms/bulk", "sms/send", "2fa/send")]
+            await asyncio.sleep(0)
+            scheduler.release(Priority.BULK)
+            await asyncio.gather(*tasks)
+            return order
+
+        assert asyncio.run(run()) == [Priority.OTP, Priority.TRANSACTIONAL, Priority.BULK]
+
+    def test_cancelled_async_waiter_leaves_the_queue(self) -> None:
+        scheduler = PriorityScheduler(capacity=1, lanes={})
+
+        async def run() -> None:
+            await scheduler.acquire_async("sms/send")
+            task = asyncio.create_task(scheduler.acquire_async("sms/bulk"))
+            await asyncio.sleep(0)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(run())
+
+        assert scheduler.stats()[Priority.BULK].waiting == 0
+
+
+class TestClientScheduling:
+    def test_calls_hold_a_slot(self, mocker: Any) -> None:
+        scheduler = PriorityScheduler()
+        client = SMSClient("test-api-key", scheduler=scheduler)
+        seen: list[int] = []
+        mocker.patch.object(
+            client,
+            "_request",
+            side_effect=lambda *args, **kwargs: seen.append(scheduler.stats()[Priority.OTP].in_flight) or BALANCE,
+        )
+
+        client.fetch_data("GET", "2fa/send")
+
+        assert seen == [1]
+        assert scheduler.stats()[Priority.OTP].in_flight == 0
+
+    def test_shed_call_is_not_sent(self, mocker: Any) -> None:
+        scheduler = PriorityScheduler(capacity=1, lanes={Priority.BULK: Lane(max_queue=0)})
+        client = SMSClient("test-api-key", scheduler=scheduler)
+        request = mocker.patch.object(client, "_request", return_value=BALANCE)
+        scheduler.acquire("2fa/send")
+
+        with pytest.raises(LoadShedError):
+            client.fetch_data("GET", "sms/bulk")
+
+        request.assert_not_called()
+
+
+def test_async_client_holds_a_slot(mocker: Any) -> None:
+    scheduler = PriorityScheduler()
+    client = AsyncSMSClient("test-api-key", scheduler=scheduler)
+    seen: list[int] = []
+
+    async def request(*args: Any, **kwargs: Any) -> dict[str, Any]:
+        seen.append(scheduler.stats()[Priority.BULK].in_flight)
+        return BALANCE
+
+    mocker.patch.object(client, "_request", side_effect=request)
+
+    asyncio.run(client.fetch_data("GET", "sms/bulk"))
+
+    assert seen == [1]
+    assert scheduler.stats()[Priority.BULK].in_flight == 0
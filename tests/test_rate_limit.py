@@ -0,0 +1,157 @@
+import asyncio
+import datetime
+from typing import Any
+
+import pytest
+from requests import HTTPError
+
+from pysmscenter import SMSClient
+from pysmscenter.rate_limit import RateLimiter, TokenBucket, parse_retry_after
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+class TestParseRetryAfter:
+    @pytest.mark.parametrize(("value", "expected"), [("5", 5.0), ("0.5", 0.5), ("-3", 0.0), (None, None), ("", None)])
+    def test_delta_seconds(self, value: str | None, expected: float | None) -> None:
+        assert parse_retry_after(value) == expected
+
+    def test_http_date(self) -> None:
+        retry_at = datetime.datetime(2030, 1, 1, 0, 0, 10, tzinfo=datetime.UTC)
+        now = datetime.datetime(2030, 1, 1, 0, 0, 0, tzinfo=datetime.UTC).timestamp()
+
+        assert parse_retry_after("Tue, 01 Jan 2030 00:00:10 GMT", now=lambda: now) == pytest.approx(
+            retry_at.timestamp() - now
+        )
+
+    def test_garbage(self) -> None:
+        assert parse_retry_after("soon") is None
+
+
+class TestTokenBucket:
+    def test_burst_then_wait(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=2, capacity=2, clock=clock)
+
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == 0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_refills_over_time(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=10, capacity=1, clock=clock)
+        bucket.reserve()
+
+        clock.now = 0.1
+
+        assert bucket.reserve() == 0
+
+    def test_rejects_non_positive_rate(self) -> None:
+        with pytest.raises(ValueError, match="rate must be positive"):
+            TokenBucket(rate=0)
+
+    def test_throttled_honours_retry_after_and_slows_down(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=10, capacity=10, clock=clock)
+
+        bucket.throttled(retry_after=3)
+
+        assert bucket.rate == pytest.approx(7)
+        assert bucket.ceiling == pytest.approx(10)
+        assert bucket.reserve() == pytest.approx(3)
+
+    def test_rate_settles_under_observed_ceiling(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=100, increase_step=5, recovery_window=1e9, clock=clock)
+        bucket.throttled()
+        bucket.succeeded()  # ramps back up towards the limit that was hit
+        bucket.throttled()
+
+        ceiling = bucket.ceiling
+        for _ in range(100):
+            bucket.succeeded()
+
+        assert bucket.rate == pytest.approx(ceiling * bucket.headroom)
+        assert bucket.rate < ceiling
+
+    def test_ceiling_recovers_after_quiet_window(self, clock: FakeClock) -> None:
+        bucket = TokenBucket(rate=100, recovery_window=10, clock=clock)
+        bucket.throttled()
+        ceiling = bucket.ceiling
+        bucket.throttled()
+        lowered = bucket.ceiling
+
+        clock.now = 11
+        bucket.succeeded()
+
+        assert lowered < bucket.ceiling <= ceiling
+
+
+class TestRateLimiter:
+    def test_unlisted_endpoints_are_unlimited_without_default(self) -> None:
+        limiter = RateLimiter({"sms/send": 5})
+
+        assert limiter.bucket("sms/send") is not None
+        assert limiter.bucket("me/balance") is None
+
+    def test_default_budget_is_per_endpoint(self) -> None:
+        limiter = RateLimiter(default=3)
+
+        first = limiter.bucket("hlr/lookup")
+
+        assert first is not None
+        assert first is limiter.bucket("hlr/lookup")
+        assert first is not limiter.bucket("mobile/check")
+
+    def test_acquire_sleeps_for_reserved_wait(self, mocker: Any, clock: FakeClock) -> None:
+        sleep = mocker.patch("pysmscenter.rate_limit.time.sleep")
+        limiter = RateLimiter({"sms/bulk": TokenBucket(rate=1, capacity=1, clock=clock)})
+
+        limiter.acquire("sms/bulk")
+        limiter.acquire("sms/bulk")
+
+        sleep.assert_called_once_with(pytest.approx(1.0))
+
+    def test_acquire_async_awaits(self, mocker: Any, clock: FakeClock) -> None:
+        sleep = mocker.patch("pysmscenter.rate_limit.asyncio.sleep")
+        limiter = RateLimiter({"2fa/send": TokenBucket(rate=2, capacity=1, clock=clock)})
+
+        async def run() -> None:
+            await limiter.acquire_async("2fa/send")
+            await limiter.acquire_async("2fa/send")
+
+        asyncio.run(run())
+
+        sleep.assert_awaited_once_with(pytest.approx(0.5))
+
+
+class TestClientRateLimiting:
+    def test_fetch_data_acquires_and_reports_success(self, mocker: Any) -> None:
+        limiter = mocker.Mock(spec=RateLimiter)
+        client = SMSClient("test-api-key", rate_limiter=limiter)
+        mocker.patch.object(client, "_request", return_value={"status": "1", "error": "0", "remarks": "Success"})
+
+        client.sms.send(to="6912345678", text="hi", sender="MyApp")
+
+        limiter.acquire.assert_called_once_with("sms/send")
+        limiter.succeeded.assert_called_once_with("sms/send")
+
+    def test_fetch_data_retunes_on_429(self, mocker: Any) -> None:
+        limiter = mocker.Mock(spec=RateLimiter)
+        client = SMSClient("test-api-key", rate_limiter=limiter)
+        response = mocker.Mock(status_code=429, headers={"Retry-After": "2"})
+        mocker.patch.object(client, "_request", side_effect=HTTPError(response=response))
+
+        with pytest.raises(HTTPError):
+            client.fetch_data("GET", "sms/bulk")
+
+        limiter.throttled.assert_called_once_with("sms/bulk", 2.0)
+        limiter.succeeded.assert_not_called()
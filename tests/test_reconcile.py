@@ -0,0 +1,121 @@
+from typing import Any
+from urllib.parse import urljoin
+
+import pytest
+from requests import HTTPError, ReadTimeout
+from requests.adapters import HTTPAdapter
+
+from pysmscenter import SMSClient
+from pysmscenter.reconcile import HistoryReconciler
+
+SEND_PARAMS = {"to": "6900000000", "text": "hello", "from": "Sender"}
+
+
+def _history(*sms: dict[str, Any]) -> dict[str, Any]:
+    return {"status": "1", "remarks": "Success", "error": "0", "sms": list(sms)}
+
+
+def _http_error(mocker: Any, status: int) -> HTTPError:
+    response = mocker.Mock()
+    response.status_code = status
+    return HTTPError(response=response)
+
+
+class TestHistoryReconciler:
+    def test_not_accepted_when_history_has_no_match(self) -> None:
+        history = _history({"to": "306911111111", "text": "hello", "timestamp": "1000"})
+
+        assert HistoryReconciler().accepted(history, SEND_PARAMS, since=1000.0) is False
+
+    def test_accepted_when_recipient_and_text_match(self) -> None:
+        history = _history({"to": "306900000000", "text": "hello", "timestamp": "1000"})
+
+        assert HistoryReconciler().accepted(history, SEND_PARAMS, since=1000.0) is True
+
+    def test_ignores_matches_older_than_the_attempt(self) -> None:
+        history = _history({"to": "306900000000", "text": "hello", "timestamp": "100"})
+
+        assert HistoryReconciler(skew=60).accepted(history, SEND_PARAMS, since=1000.0) is False
+
+    @pytest.mark.parametrize("timestamp", [None, "", "yesterday"])
+    def test_undated_match_counts_as_accepted(self, timestamp: str | None) -> None:
+        history = _history({"to": "306900000000", "text": "hello", "timestamp": timestamp})
+
+        assert HistoryReconciler().accepted(history, SEND_PARAMS, since=1000.0) is True
+
+    def test_iso_timestamps(self) -> None:
+        history = _history({"to": "306900000000", "text": "hello", "timestamp": "1970-01-01T00:00:00+00:00"})
+
+        assert HistoryReconciler(skew=0).accepted(history, SEND_PARAMS, since=10.0) is False
+
+    def test_bulk_recipients(self) -> None:
+        history = _history({"to": "+30 690 000 0002", "text": "hello", "timestamp": "1000"})
+        params = {"to": "6900000001,6900000002", "text": "hello"}
+
+        assert HistoryReconciler().accepted(history, params, since=1000.0) is True
+
+    def test_failed_history_counts_as_accepted(self) -> None:
+        history = {"status": "0", "remarks": "Failure", "error": "200"}
+
+        assert HistoryReconciler().accepted(history, SEND_PARAMS, since=1000.0) is True
+
+
+class TestIdempotentRetries:
+    def test_unsafe_endpoints_only_retry_unsent_requests(self) -> None:
+        client = SMSClient("test-api-key", max_retries=3)
+
+        safe = client.session.get_adapter(urljoin(client.BASE_URL, "me/balance"))
+        unsafe = client.session.get_adapter(urljoin(client.BASE_URL, "sms/send") + "?to=6900000000")
+
+        assert isinstance(safe, HTTPAdapter)
+        assert isinstance(unsafe, HTTPAdapter)
+        assert safe is not unsafe
+        assert list(safe.max_retries.status_forcelist or ()) == list(client.RETRY_STATUSES)
+        assert unsafe.max_retries.read == 0
+        assert unsafe.max_retries.total == 3
+        assert list(unsafe.max_retries.status_forcelist or ()) == [429]
+
+    def test_retries_send_lost_before_acceptance(self, mocker: Any) -> None:
+        client = SMSClient("test-api-key", max_retries=1, reconcile={"sms/send": HistoryReconciler(delay=0)})
+        sent = {"status": "1", "id": "1", "remarks": "Success", "error": "0"}
+        request = mocker.patch.object(client, "_request", side_effect=[ReadTimeout(), _history(), sent])
+
+        assert client.fetch_data("GET", "sms/send", SEND_PARAMS) == sent
+        assert [call.args[1] for call in request.call_args_list] == ["sms/send", "history/single/list", "sms/send"]
+
+    def test_does_not_resend_accepted_message(self, mocker: Any) -> None:
+        client = SMSClient("test-api-key", max_retries=3, reconcile={"sms/send": HistoryReconciler(delay=0)})
+        history = _history({"to": "306900000000", "text": "hello", "timestamp": None})
+        request = mocker.patch.object(client, "_request", side_effect=[ReadTimeout(), history])
+
+        with pytest.raises(ReadTimeout):
+            client.fetch_data("GET", "sms/send", SEND_PARAMS)
+        assert request.call_count == 2
+
+    def test_does_not_resend_when_history_is_unavailable(self, mocker: Any) -> None:
+        client = SMSClient("test-api-key", max_retries=3, reconcile={"sms/send": HistoryReconciler(delay=0)})
+        request = mocker.patch.object(client, "_request", side_effect=[_http_error(mocker, 502), ReadTimeout()])
+
+        with pytest.raises(HTTPError):
+            client.fetch_data("GET", "sms/send", SEND_PARAMS)
+        assert request.call_count == 2
+
+    def test_client_errors_are_not_reconciled(self, mocker: Any) -> None:
+        client = SMSClient("test-api-key", max_retries=3, reconcile=True)
+        request = mocker.patch.object(client, "_request", side_effect=_http_error(mocker, 400))
+
+        with pytest.raises(HTTPError):
+            client.fetch_data("GET", "sms/send", SEND_PARAMS)
+        request.assert_called_once()
+
+    def test_reconciliation_is_opt_in(self, client: SMSClient, mocker: Any) -> None:
+        request = mocker.patch.object(client, "_request", side_effect=ReadTimeout())
+
+        with pytest.raises(ReadTimeout):
+            client.fetch_data("GET", "sms/send", SEND_PARAMS)
+        request.assert_called_once()
+
+    def test_reconcile_true_uses_default_reconcilers(self) -> None:
+        client = SMSClient("test-api-key", reconcile=True)
+
+        assert set(client.reconcilers) == {"sms/send", "sms/bulk"}
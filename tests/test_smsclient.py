@@ -1,3 +1,4 @@
+import json
 from typing import Any
 from urllib.parse import urljoin
 
@@ -5,6 +6,7 @@ import pytest
 from urllib3.util.retry import Retry
 
 from pysmscenter import SMSClient
+from pysmscenter.endpoints import NON_IDEMPOTENT_ENDPOINTS
 from pysmscenter.exceptions import CredentialError
 from pysmscenter.main import BaseHTTPClient, SMSAuthClient
 
@@ -28,7 +30,8 @@ class TestSMSClient:
         mock_session = mocker.Mock()
         session_ctor = mocker.patch("pysmscenter.main.Session", return_value=mock_session)
         adapter = mocker.Mock()
-        adapter_ctor = mocker.patch("pysmscenter.main.HTTPAdapter", return_value=adapter)
+        unsafe_adapter = mocker.Mock()
+        adapter_ctor = mocker.patch("pysmscenter.main.HTTPAdapter", side_effect=[adapter, unsafe_adapter])
 
         client = SMSClient("test-api-key", max_retries=2)
 
@@ -38,12 +41,14 @@ class TestSMSClient:
         assert session_one is mock_session
         assert session_two is mock_session
         session_ctor.assert_called_once_with()
-        adapter_ctor.assert_called_once()
-        retry_arg = adapter_ctor.call_args.kwargs.get("max_retries")
-        assert isinstance(retry_arg, Retry)
+        assert adapter_ctor.call_count == 2
+        for call in adapter_ctor.call_args_list:
+            assert isinstance(call.kwargs.get("max_retries"), Retry)
         mock_session.mount.assert_any_call("http://", adapter)
         mock_session.mount.assert_any_call("https://", adapter)
-        assert mock_session.mount.call_count == 2
+        for endpoint in NON_IDEMPOTENT_ENDPOINTS:
+            mock_session.mount.assert_any_call(urljoin(SMSClient.BASE_URL, endpoint), unsafe_adapter)
+        assert mock_session.mount.call_count == 2 + len(NON_IDEMPOTENT_ENDPOINTS)
 
     def test_session_raises_when_closed(self, client: SMSClient) -> None:
         client.close()
@@ -89,7 +94,7 @@ class TestSMSClient:
             "error": "0",
         }
         response = mocker.Mock()
-        response.json.return_value = response_json
+        response.content = json.dumps(response_json).encode()
         mock_session = mocker.Mock()
         mock_session.request.return_value = response
         client._session = mock_session
@@ -116,7 +121,7 @@ class TestSMSClient:
             "error": "0",
         }
         response = mocker.Mock()
-        response.json.return_value = response_json
+        response.content = json.dumps(response_json).encode()
         mock_session = mocker.Mock()
         mock_session.request.return_value = response
         client._session = mock_session
@@ -143,7 +148,7 @@ class TestSMSClient:
     def test_fetch_data_raises_credential_error(self, client: SMSClient, mocker: Any) -> None:
         response_json = {"status": 0, "error": 101, "remarks": "Invalid API key"}
         response = mocker.Mock()
-        response.json.return_value = response_json
+        response.content = json.dumps(response_json).encode()
         mock_session = mocker.Mock()
         mock_session.request.return_value = response
         client._session = mock_session
@@ -237,12 +242,14 @@ class TestBaseHTTPClient:
         mock_session = mocker.Mock()
         client._session = mock_session
         response = mocker.Mock()
-        response.json.return_value = {
-            "status": "1",
-            "balance": "2",
-            "remarks": "Success",
-            "error": "0",
-        }
+        response.content = json.dumps(
+            {
+                "status": "1",
+                "balance": "2",
+                "remarks": "Success",
+                "error": "0",
+            }
+        ).encode()
         mock_session.request.return_value = response
 
         result = client._request("GET", "health", params={"foo": "bar"})
@@ -0,0 +1,185 @@
+import json
+from typing import Any
+
+import pytest
+
+from pysmscenter import SMSClient
+from pysmscenter.exceptions import ContactExceptionError, CredentialError, GroupExceptionError
+from pysmscenter.streaming import JSONItemParser, iter_json_items
+
+GROUP_GET = {
+    "status": "1",
+    "remarks": "Success",
+    "error": "0",
+    "total": "1",
+    "group": {
+        "name": "Customers",
+        "total": "2",
+        "contacts": [
+            {"contactId": "1", "mobile": "306900000001", "name": "Νίκος"},
+            {"contactId": "2", "mobile": "306900000002", "name": "Maria"},
+        ],
+    },
+}
+
+HISTORY_GROUPS = {
+    "0": {"groupId": "10", "text": "hello", "sms": [{"smsId": "1"}]},
+    "1": {"groupId": "11", "text": "world", "sms": []},
+    "status": "1",
+    "remarks": "Success",
+    "error": "0",
+}
+
+
+def _chunks(document: Any, size: int) -> list[bytes]:
+    body = json.dumps(document, ensure_ascii=False, indent=1).encode()
+    return [body[index : index + size] for index in range(0, len(body), size)]
+
+
+class TestJSONItemParser:
+    @pytest.mark.parametrize("size", [1, 2, 7, 4096])
+    def test_streams_nested_array(self, size: int) -> None:
+        meta: dict[str, Any] = {}
+
+        items = list(iter_json_items(_chunks(GROUP_GET, size), ("group", "contacts"), meta))
+
+        assert items == GROUP_GET["group"]["contacts"]
+        assert meta == {
+            "status": "1",
+            "remarks": "Success",
+            "error": "0",
+            "total": "1",
+            "group": {"name": "Customers", "total": "2"},
+        }
+
+    @pytest.mark.parametrize("size", [1, 5, 4096])
+    def test_streams_top_level_object_values(self, size: int) -> None:
+        meta: dict[str, Any] = {}
+
+        items = list(iter_json_items(_chunks(HISTORY_GROUPS, size), (), meta))
+
+        assert items == [HISTORY_GROUPS["0"], HISTORY_GROUPS["1"]]
+        assert meta == {"status": "1", "remarks": "Success", "error": "0"}
+
+    def test_numbers_split_across_chunks(self) -> None:
+        items = list(iter_json_items([b'{"values": [12', b"34, 5", b"6]}"], ("values",)))
+
+        assert items == [1234, 56]
+
+    def test_feed_returns_items_as_soon_as_complete(self) -> None:
+        parser = JSONItemParser(("sms",))
+
+        assert parser.feed(b'{"status": "1", "sms": [{"smsId": "1"}, {"smsId"') == [{"smsId": "1"}]
+        assert parser.feed(b': "2"}]}') == [{"smsId": "2"}]
+        assert parser.close() == []
+        assert parser.meta == {"status": "1"}
+
+    def test_missing_container_collects_everything_into_meta(self) -> None:
+        meta: dict[str, Any] = {}
+        body = [b'{"status": "0", "remarks": "Invalid group", "error": "304"}']
+
+        assert list(iter_json_items(body, ("group", "contacts"), meta)) == []
+        assert meta == {"status": "0", "remarks": "Invalid group", "error": "304"}
+
+    def test_null_container_is_recorded(self) -> None:
+        meta: dict[str, Any] = {}
+
+        assert list(iter_json_items([b'{"contacts": null, "total": "0"}'], ("contacts",), meta)) == []
+        assert meta == {"contacts": None, "total": "0"}
+
+    @pytest.mark.parametrize("body", [b'{"contacts": []}', b'{"contacts": {}}', b"{}"])
+    def test_empty_containers(self, body: bytes) -> None:
+        assert list(iter_json_items([body], ("contacts",))) == []
+
+    def test_truncated_document_raises(self) -> None:
+        with pytest.raises(ValueError, match="Unexpected end of JSON document"):
+            list(iter_json_items([b'{"contacts": [{"contactId": "1"}, '], ("contacts",)))
+
+    def test_malformed_document_raises(self) -> None:
+        with pytest.raises(ValueError, match="Expected ',' or ']'"):
+            list(iter_json_items([b'{"contacts": [1 2]}'], ("contacts",)))
+
+    def test_top_level_array_streams_elements(self) -> None:
+        assert list(iter_json_items([b"[1, ", b"2]"], ())) == [1, 2]
+
+    def test_top_level_scalar_raises(self) -> None:
+        with pytest.raises(ValueError, match="Expected a JSON object or array"):
+            list(iter_json_items([b'"text"'], ()))
+
+
+class TestStreamData:
+    @staticmethod
+    def _mock_stream(client: SMSClient, mocker: Any, document: Any) -> Any:
+        response = mocker.MagicMock()
+        response.__enter__.return_value = response
+        response.iter_content.return_value = iter(_chunks(document, 16))
+        mock_session = mocker.Mock()
+        mock_session.request.return_value = response
+        client._session = mock_session
+        return mock_session
+
+    def test_stream_data_requests_streamed_body(self, client: SMSClient, mocker: Any) -> None:
+        mock_session = self._mock_stream(client, mocker, {"status": "1", "contacts": [{"contactId": "1"}]})
+
+        items = list(client.stream_data("get", "contact/list", ("contacts",)))
+
+        assert items == [{"contactId": "1"}]
+        mock_session.request.assert_called_once_with(
+            "GET",
+            "https://smscenter.gr/api/contact/list",
+            params={"type": "json", "key": "test-api-key"},
+            timeout=client.timeout,
+            stream=True,
+        )
+
+    def test_stream_data_raises_credential_error(self, client: SMSClient, mocker: Any) -> None:
+        self._mock_stream(client, mocker, {"status": "0", "error": "101", "remarks": "Invalid key"})
+
+        with pytest.raises(CredentialError, match="Invalid key"):
+            list(client.stream_data("GET", "contact/list", ("contacts",)))
+
+    def test_stream_data_bypasses_cache(self, mocker: Any) -> None:
+        cache = mocker.Mock()
+        client = SMSClient("test-api-key", cache=cache)
+        self._mock_stream(client, mocker, {"status": "1", "contacts": []})
+
+        list(client.stream_data("GET", "contact/list", ("contacts",)))
+
+        cache.get.assert_not_called()
+        cache.update.assert_not_called()
+
+    def test_contact_iter(self, client: SMSClient, mocker: Any) -> None:
+        document = {"status": "1", "total": "2", "contacts": [{"contactId": "1"}, {"contactId": "2"}]}
+        self._mock_stream(client, mocker, document)
+
+        assert [contact["contactId"] for contact in client.contact.iter()] == ["1", "2"]
+
+    def test_contact_iter_raises_on_error(self, client: SMSClient, mocker: Any) -> None:
+        self._mock_stream(client, mocker, {"status": "0", "error": "200", "remarks": "Failure"})
+
+        with pytest.raises(ContactExceptionError, match="Failure"):
+            list(client.contact.iter())
+
+    def test_group_iter_contacts(self, client: SMSClient, mocker: Any) -> None:
+        mock_session = self._mock_stream(client, mocker, GROUP_GET)
+
+        contacts = list(client.group.iter_contacts("7"))
+
+        assert contacts == GROUP_GET["group"]["contacts"]
+        assert mock_session.request.call_args.kwargs["params"]["groupId"] == "7"
+
+    def test_group_iter_contacts_raises_on_error(self, client: SMSClient, mocker: Any) -> None:
+        self._mock_stream(client, mocker, {"status": "0", "error": "304", "remarks": "Invalid group"})
+
+        with pytest.raises(GroupExceptionError, match="Invalid group"):
+            list(client.group.iter_contacts("7"))
+
+    def test_history_iter_single(self, client: SMSClient, mocker: Any) -> None:
+        self._mock_stream(client, mocker, {"status": "1", "total": "2", "sms": [{"smsId": "1"}, {"smsId": "2"}]})
+
+        assert [sms.get("smsId") for sms in client.history.iter_single()] == ["1", "2"]
+
+    def test_history_iter_groups(self, client: SMSClient, mocker: Any) -> None:
+        self._mock_stream(client, mocker, HISTORY_GROUPS)
+
+        assert [group.get("groupId") for group in client.history.iter_groups()] == ["10", "11"]
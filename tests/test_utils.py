@@ -3,7 +3,7 @@ import datetime
 import pytest
 
 from pysmscenter.exceptions import SMSClientError
-from pysmscenter.utils import bool2str, parse_date, raise_for_errors, ts2epoch
+from pysmscenter.utils import bool2str, msisdn_key, parse_date, raise_for_errors, ts2epoch
 
 
 def test_raise_for_errors_does_not_raise_on_success():
@@ -77,3 +77,8 @@ def test_ts2epoch_with_naive_datetime_assumes_utc():
     dt = datetime.datetime(2024, 1, 1)  # noqa: DTZ001
     epoch = ts2epoch(dt)
     assert epoch == int(dt.replace(tzinfo=datetime.UTC).timestamp())
+
+
+@pytest.mark.parametrize("value", ["6900000000", "306900000000", "+30 690 000 0000", "0030-6900000000"])
+def test_msisdn_key_ignores_prefix_and_formatting(value):
+    assert msisdn_key(value) == "6900000000"